@@ -2,17 +2,62 @@
 Authentication and cookie management for Perplexity.ai
 Handles session cookies, authentication verification, and cookie injection via CDP
 """
+import asyncio
+import functools
 import logging
-from typing import List, Dict
+from typing import List, Dict, Optional, Sequence, Tuple
 import nodriver as uc
 
-from src.config import REQUIRED_COOKIES, COOKIE_DEFAULTS, SELECTORS, TIMEOUTS
+from src.config import REQUIRED_COOKIES, REQUIRED_COOKIES_SET, COOKIE_DEFAULTS, SELECTORS, TIMEOUTS
 from src.utils.decorators import async_retry
-from src.browser.interactions import human_delay
+from src.browser.interactions import human_delay, matched_selector
 from src.types import NodriverPage
 
 logger = logging.getLogger(__name__)
 
+# True if the page text mentions both "Account" and "Home" navigation
+_ACCOUNT_NAV_JS = (
+    "(() => { const text = document.body ? document.body.textContent : '';"
+    " return text.includes('Account') && text.includes('Home'); })()"
+)
+
+# True if any button on the page reads "Sign In" or "Log In"
+_SIGN_IN_BUTTON_JS = (
+    "Array.from(document.querySelectorAll('button'))"
+    ".some(b => /Sign In|Log In/.test(b.textContent || ''))"
+)
+
+
+@functools.lru_cache(maxsize=64)
+def _cookie_param(fields: tuple) -> uc.cdp.network.CookieParam:
+    """
+    Build a CDP CookieParam, memoized on the cookie's field values
+
+    Retries and repeated sessions with the same cookie file reuse the
+    converted param instead of rebuilding the CDP wrapper types. Cached
+    per cookie, so a malformed cookie raises for itself only and is
+    never stored.
+
+    Args:
+        fields: (name, value, domain, path, secure, httpOnly, sameSite, expires)
+            with defaults already applied
+
+    Returns:
+        CookieParam for the cookie
+    """
+    name, value, domain, path, secure, http_only, same_site, expires = fields
+    return uc.cdp.network.CookieParam(
+        name=name,
+        value=value,
+        domain=domain,
+        path=path,
+        secure=secure,
+        http_only=http_only,
+        same_site=uc.cdp.network.CookieSameSite(same_site) if same_site else None,
+        expires=uc.cdp.network.TimeSinceEpoch(expires)
+            if expires and expires > 0 else None
+    )
+
 
 @async_retry(max_attempts=2, exceptions=(Exception,))
 async def set_cookies(page: NodriverPage, cookies: List[Dict]) -> None:
@@ -26,60 +71,131 @@ async def set_cookies(page: NodriverPage, cookies: List[Dict]) -> None:
     Raises:
         Exception: If critical cookies cannot be set
     """
-    cookies_set = 0
-    critical_cookies_set = 0
-
+    params: List[uc.cdp.network.CookieParam] = []
     for cookie in cookies:
+        name = cookie.get('name', '')
+        value = cookie.get('value', '')
+
+        if not name or not value:
+            logger.warning(f'Skipping invalid cookie (missing name or value)')
+            continue
+
+        fields = (
+            name,
+            value,
+            cookie.get('domain', COOKIE_DEFAULTS['domain']),
+            cookie.get('path', COOKIE_DEFAULTS['path']),
+            cookie.get('secure', COOKIE_DEFAULTS['secure']),
+            cookie.get('httpOnly', COOKIE_DEFAULTS['httpOnly']),
+            cookie.get('sameSite'),
+            cookie.get('expires'),
+        )
+
+        # Convert each cookie on its own so one malformed optional cookie
+        # (bad sameSite, non-numeric expires) doesn't sink the whole batch
         try:
-            name = cookie.get('name', '')
-            value = cookie.get('value', '')
-            domain = cookie.get('domain', COOKIE_DEFAULTS['domain'])
-            path = cookie.get('path', COOKIE_DEFAULTS['path'])
+            try:
+                hash(fields)
+            except TypeError:
+                # Unhashable field values can't be cached; build them directly
+                params.append(_cookie_param.__wrapped__(fields))
+            else:
+                params.append(_cookie_param(fields))
+        except Exception as e:
+            if name in REQUIRED_COOKIES_SET:
+                logger.error(f'Failed to set critical cookie {name}: {e}')
+                raise  # Fail fast for critical cookies
+            logger.warning(f'Could not set cookie {name}: {e}')
+
+    try:
+        # One CDP round-trip for the whole set
+        await page.send(uc.cdp.network.set_cookies(cookies=params))
+        cookies_set = len(params)
+        critical_cookies_set = sum(1 for param in params if param.name in REQUIRED_COOKIES_SET)
+    except Exception as e:
+        logger.warning(f'Batch cookie injection failed ({e}), setting cookies one by one')
+        cookies_set, critical_cookies_set = await _set_cookies_individually(page, params)
+
+    logger.info(f'Set {cookies_set} cookies ({critical_cookies_set} critical)')
+
+    # Verify critical cookies were set
+    if critical_cookies_set < len(REQUIRED_COOKIES):
+        raise Exception(f'Not all critical cookies were set ({critical_cookies_set}/{len(REQUIRED_COOKIES)})')
+
+    # Add small delay to ensure cookies are applied
+    await human_delay('short')
+
+
+async def _set_cookies_individually(
+    page: NodriverPage,
+    params: Sequence[uc.cdp.network.CookieParam],
+) -> Tuple[int, int]:
+    """
+    Set cookies one CDP call at a time so a bad cookie can be identified
 
-            if not name or not value:
-                logger.warning(f'Skipping invalid cookie (missing name or value)')
-                continue
+    Returns:
+        Tuple of (cookies set, critical cookies set)
+
+    Raises:
+        Exception: If a critical cookie cannot be set
+    """
+    cookies_set = 0
+    critical_cookies_set = 0
 
-            # Use CDP network.set_cookie with proper parameter handling
+    for param in params:
+        try:
             await page.send(uc.cdp.network.set_cookie(
-                name=name,
-                value=value,
-                domain=domain,
-                path=path,
-                secure=cookie.get('secure', COOKIE_DEFAULTS['secure']),
-                http_only=cookie.get('httpOnly', COOKIE_DEFAULTS['httpOnly']),
-                same_site=uc.cdp.network.CookieSameSite(
-                    cookie.get('sameSite', COOKIE_DEFAULTS['sameSite'])
-                ) if cookie.get('sameSite') else None,
-                expires=uc.cdp.network.TimeSinceEpoch(cookie['expires'])
-                    if cookie.get('expires') and cookie['expires'] > 0 else None
+                name=param.name,
+                value=param.value,
+                domain=param.domain,
+                path=param.path,
+                secure=param.secure,
+                http_only=param.http_only,
+                same_site=param.same_site,
+                expires=param.expires
             ))
 
             cookies_set += 1
 
             # Track critical cookies
-            if name in REQUIRED_COOKIES:
+            if param.name in REQUIRED_COOKIES_SET:
                 critical_cookies_set += 1
-                logger.debug(f'Set critical cookie: {name}')
+                logger.debug(f'Set critical cookie: {param.name}')
             else:
-                logger.debug(f'Set cookie: {name}')
+                logger.debug(f'Set cookie: {param.name}')
 
         except Exception as e:
-            cookie_name = cookie.get('name', 'unknown')
-            if cookie_name in REQUIRED_COOKIES:
-                logger.error(f'Failed to set critical cookie {cookie_name}: {e}')
+            if param.name in REQUIRED_COOKIES_SET:
+                logger.error(f'Failed to set critical cookie {param.name}: {e}')
                 raise  # Fail fast for critical cookies
             else:
-                logger.warning(f'Could not set cookie {cookie_name}: {e}')
+                logger.warning(f'Could not set cookie {param.name}: {e}')
 
-    logger.info(f'Set {cookies_set} cookies ({critical_cookies_set} critical)')
+    return cookies_set, critical_cookies_set
 
-    # Verify critical cookies were set
-    if critical_cookies_set < len(REQUIRED_COOKIES):
-        raise Exception(f'Not all critical cookies were set ({critical_cookies_set}/{len(REQUIRED_COOKIES)})')
 
-    # Add small delay to ensure cookies are applied
-    await human_delay('short')
+async def _first_matching_selector(
+    page: NodriverPage,
+    selectors: Sequence[str],
+    timeout: float,
+) -> Optional[str]:
+    """
+    Look up several selectors with one any-of query and report which matched.
+
+    The browser evaluates the joined selector natively, so a miss costs one
+    lookup and one timeout rather than one per selector.
+
+    Returns:
+        The matching selector, or None if none matched within the timeout
+    """
+    try:
+        element = await page.select(', '.join(selectors), timeout=timeout)
+    except Exception as e:
+        logger.debug(f'No auth indicator matched: {type(e).__name__}: {e}')
+        return None
+    if not element:
+        return None
+    return await matched_selector(element, selectors)
 
 
 async def verify_authentication(page: NodriverPage) -> bool:
@@ -90,38 +206,40 @@ async def verify_authentication(page: NodriverPage) -> bool:
         True if authenticated, False otherwise
     """
     try:
-        # Wait for page to fully load
-        await human_delay('medium')
+        # No fixed load delay: the caller waits for the page to render, and
+        # the indicator probe below waits for late elements on its own
 
-        # Check for sign-in button (should NOT be present if authenticated)
+        # Start the indicator probe now so its lookup overlaps the sign-in scan
+        indicator_probe = asyncio.ensure_future(_first_matching_selector(
+            page, SELECTORS['auth_indicators'], TIMEOUTS['auth_verification']
+        ))
         try:
-            sign_in_elements = await page.select_all('button')
-            for btn in sign_in_elements:
-                text = btn.text  # .text is a property, not async
-                if text and ('Sign In' in text or 'Log In' in text):
+            # Check for sign-in button (should NOT be present if authenticated).
+            # Scanned in the page so no button handles cross CDP
+            try:
+                has_sign_in = await page.evaluate(_SIGN_IN_BUTTON_JS, return_by_value=True)
+                if has_sign_in is True:
                     logger.warning('Found visible "Sign In" button - not authenticated')
                     return False
-        except Exception as e:
-            logger.debug(f'Sign-in button check failed: {e}')
+            except Exception as e:
+                logger.debug(f'Sign-in button check failed: {e}')
 
-        # Check for authenticated sidebar elements
-        for selector in SELECTORS['auth_indicators']:
-            try:
-                element = await page.select(selector, timeout=TIMEOUTS['auth_verification'])
-                if element:
-                    logger.info(f'Found authenticated element: {selector}')
-                    return True
-            except:
-                continue
-
-        # Check for "Account" text in page (another strong indicator)
+            # Check for authenticated sidebar elements (all indicators probed at once)
+            selector = await indicator_probe
+        finally:
+            indicator_probe.cancel()
+
+        if selector:
+            logger.info(f'Found authenticated element: {selector}')
+            return True
+
+        # Check for "Account" text in page (another strong indicator).
+        # Evaluated in the page so only a boolean crosses CDP, not the body text
         try:
-            body = await page.select('body')
-            if body:
-                body_text = body.text_all  # .text_all is a property, no await
-                if body_text and 'Account' in body_text and 'Home' in body_text:
-                    logger.info('Found "Account" and "Home" navigation - authenticated')
-                    return True
+            has_account_nav = await page.evaluate(_ACCOUNT_NAV_JS, return_by_value=True)
+            if has_account_nav is True:
+                logger.info('Found "Account" and "Home" navigation - authenticated')
+                return True
         except Exception as e:
             logger.debug(f'Account text check failed: {e}')
 
@@ -5,12 +5,56 @@ import asyncio
 import json
 import random
 import logging
-from typing import List, Dict, Any, Optional
-from src.config import HUMAN_BEHAVIOR, TIMEOUTS
+from typing import List, Dict, Any, Optional, Sequence, Tuple
+from src.config import HUMAN_BEHAVIOR, TIMEOUTS, TYPING_SPEED
 from src.types import NodriverPage
 
 logger = logging.getLogger(__name__)
 
+# Burst size range (characters) when HUMAN_BEHAVIOR['typing_chunked'] is set
+_TYPING_CHUNK_SIZE = (3, 8)
+
+# Browser-driven scroll sequence: applies each increment, then waits its dwell
+# time before the next one, resolving once the final increment has settled.
+_SCROLL_SEQUENCE_JS = '''
+(() => new Promise((resolve) => {
+    const increments = %s;
+    const dwells = %s;
+    const step = (i) => {
+        if (i >= increments.length) { resolve(true); return; }
+        window.scrollBy(0, increments[i]);
+        setTimeout(() => step(i + 1), dwells[i] * 1000);
+    };
+    step(0);
+}))()
+'''
+
+
+def _build_delay_params() -> Dict[str, tuple]:
+    """
+    Resolve HUMAN_BEHAVIOR delay settings into per-tier parameter tuples.
+
+    Returns:
+        Dict mapping 'short'/'medium'/'long' to
+        (min_delay, max_delay, variance, mean, std_dev)
+    """
+    delays = HUMAN_BEHAVIOR['delays']
+    params = {}
+    for tier in ('short', 'medium', 'long'):
+        min_delay = delays[f'{tier}_min']
+        max_delay = delays[f'{tier}_max']
+        params[tier] = (
+            min_delay,
+            max_delay,
+            delays[f'{tier}_variance'],
+            (min_delay + max_delay) / 2,
+            (max_delay - min_delay) / 6,  # ~99.7% within range
+        )
+    return params
+
+
+_DELAY_PARAMS = _build_delay_params()
+
 
 async def human_delay(delay_type: str = 'short', distribution: str = 'exponential') -> None:
     """
@@ -24,44 +68,20 @@ async def human_delay(delay_type: str = 'short', distribution: str = 'exponentia
         - Exponential: Many short pauses, few long ones (mimics reaction time)
         - Gaussian: Delays cluster around mean with occasional outliers
     """
-    delays = HUMAN_BEHAVIOR['delays']
-
-    # Get min/max/variance for the delay type from config
-    if delay_type == 'short':
-        min_delay = delays['short_min']
-        max_delay = delays['short_max']
-        variance = delays['short_variance']
-    elif delay_type == 'medium':
-        min_delay = delays['medium_min']
-        max_delay = delays['medium_max']
-        variance = delays['medium_variance']
-    elif delay_type == 'long':
-        min_delay = delays['long_min']
-        max_delay = delays['long_max']
-        variance = delays['long_variance']
-    else:
-        # Default to medium
-        min_delay = delays['medium_min']
-        max_delay = delays['medium_max']
-        variance = delays['medium_variance']
-
-    base = (min_delay + max_delay) / 2
+    # Tier parameters are resolved once at import; unknown tiers use medium
+    min_delay, max_delay, variance, base, std_dev = (
+        _DELAY_PARAMS.get(delay_type) or _DELAY_PARAMS['medium']
+    )
 
     # Generate delay using natural distribution
-    if distribution == 'exponential':
-        # Exponential distribution creates realistic pause patterns
-        delay = random.expovariate(1 / base) * variance
-        delay = max(min_delay, min(delay, max_delay))
-    elif distribution == 'gaussian':
+    if distribution == 'gaussian':
         # Gaussian distribution with delays clustering around mean
-        mean = (min_delay + max_delay) / 2
-        std_dev = (max_delay - min_delay) / 6  # ~99.7% within range
-        delay = random.gauss(mean, std_dev)
-        delay = max(min_delay, min(delay, max_delay))
+        delay = random.gauss(base, std_dev)
     else:
-        # Fallback to exponential
+        # Exponential distribution creates realistic pause patterns
+        # (also the fallback for unknown distributions)
         delay = random.expovariate(1 / base) * variance
-        delay = max(min_delay, min(delay, max_delay))
+    delay = max(min_delay, min(delay, max_delay))
 
     await asyncio.sleep(delay)
 
@@ -212,6 +232,63 @@ async def _clear_element(element) -> bool:
         return False
 
 
+def _typing_schedule(text: str) -> List[Tuple[float, bool]]:
+    """
+    Pre-generate the typing rhythm for text.
+
+    Returns:
+        One (delay_after_char, micro_pause) pair per character
+    """
+    speed = TYPING_SPEED
+    space_min, space_max = speed.space_min, speed.space_max
+    char_min, char_max = speed.char_min, speed.char_max
+    space_rate = 2 / (space_min + space_max)
+    char_rate = 2 / (char_min + char_max)
+    expovariate = random.expovariate
+    randint = random.randint
+
+    schedule = []
+    for i, char in enumerate(text):
+        if char == ' ':
+            # Slightly longer pause at spaces (natural typing)
+            delay = max(space_min, min(expovariate(space_rate) * 0.4, space_max))
+        else:
+            delay = max(char_min, min(expovariate(char_rate) * 0.3, char_max))
+        # Occasional micro-pause (simulates thinking/hesitation)
+        schedule.append((delay, i > 0 and i % randint(8, 15) == 0))
+    return schedule
+
+
+def _keystrokes(text: str, chunked: bool = False) -> List[Tuple[str, float, bool]]:
+    """
+    Group the typing rhythm into send_keys() calls.
+
+    In chunked mode, characters are sent in bursts of 3-8. Each burst waits
+    for the sum of its characters' delays, so the overall typing time keeps
+    the per-character distribution while making fewer CDP calls.
+
+    Returns:
+        One (keys, delay_after, micro_pause) triple per send_keys() call
+    """
+    schedule = _typing_schedule(text)
+    if not chunked:
+        return [(char, delay, pause) for char, (delay, pause) in zip(text, schedule)]
+
+    randint = random.randint
+    strokes = []
+    i = 0
+    while i < len(text):
+        size = randint(*_TYPING_CHUNK_SIZE)
+        burst = schedule[i:i + size]
+        strokes.append((
+            text[i:i + size],
+            sum(delay for delay, _ in burst),
+            any(pause for _, pause in burst),
+        ))
+        i += size
+    return strokes
+
+
 async def type_like_human(
     element,
     text: str,
@@ -222,6 +299,9 @@ async def type_like_human(
     """
     Type text character-by-character with human-like delays and verification.
 
+    With HUMAN_BEHAVIOR['typing_chunked'] enabled, keys are sent in short
+    bursts with one combined delay per burst instead of one call per key.
+
     Args:
         element: Nodriver element to type into
         text: Text to type
@@ -236,29 +316,13 @@ async def type_like_human(
         asyncio.TimeoutError: If typing operations timeout
         ConnectionError: If browser connection is lost
     """
-    typing_speed = HUMAN_BEHAVIOR['typing_speed']
-
     for attempt in range(max_retries + 1):
         try:
-            # Type character-by-character with human-like delays
-            for i, char in enumerate(text):
-                await element.send_keys(char)
-
-                # Variable delays based on character type
-                if char == ' ':
-                    # Slightly longer pause at spaces (natural typing)
-                    base = (typing_speed['space_min'] + typing_speed['space_max']) / 2
-                    delay = random.expovariate(1 / base) * 0.4
-                    delay = max(typing_speed['space_min'], min(delay, typing_speed['space_max']))
-                else:
-                    base = (typing_speed['char_min'] + typing_speed['char_max']) / 2
-                    delay = random.expovariate(1 / base) * 0.3
-                    delay = max(typing_speed['char_min'], min(delay, typing_speed['char_max']))
-
+            # Type with a pre-generated rhythm, per character or in short bursts
+            for keys, delay, micro_pause in _keystrokes(text, HUMAN_BEHAVIOR['typing_chunked']):
+                await element.send_keys(keys)
                 await asyncio.sleep(delay)
-
-                # Occasional micro-pause (simulates thinking/hesitation)
-                if i > 0 and i % random.randint(8, 15) == 0:
+                if micro_pause:
                     await human_delay('short', 'exponential')
 
             # Verify text was entered correctly if requested
@@ -361,6 +425,32 @@ async def find_interactive_element(page: NodriverPage, selectors: List[str], tim
     return None
 
 
+async def matched_selector(element: Any, selectors: Sequence[str]) -> str:
+    """
+    Identify which selector of a group an element was matched by
+
+    Used after looking up an any-of selector ('a, b, c'), which returns the
+    first match in document order without saying which part matched.
+
+    Args:
+        element: Element returned by a union-selector lookup
+        selectors: The selectors that were joined into the union
+
+    Returns:
+        The first selector in the list the element matches, or the joined
+        union if that cannot be determined
+    """
+    try:
+        index = await element.apply(
+            f'(el) => {json.dumps(list(selectors))}.findIndex((s) => el.matches(s))'
+        )
+        if type(index) is int and 0 <= index < len(selectors):
+            return selectors[index]
+    except Exception as e:
+        logger.debug(f"Could not resolve matched selector: {type(e).__name__}: {e}")
+    return ', '.join(selectors)
+
+
 async def health_check(page: NodriverPage) -> Dict[str, Any]:
     """
     Perform health check on current page state
@@ -437,8 +527,12 @@ async def scroll_naturally(
         num_increments = max(5, int(total_pixels / (50 * smoothness)))
         base_increment = total_pixels / num_increments
 
+        # Pre-compute every increment and its reading dwell in Python, then let
+        # the browser drive the whole scroll so there is a single CDP round-trip
+        increments = []
+        dwells = []
         scrolled = 0
-        for i in range(num_increments):
+        for _ in range(num_increments):
             # Variable scroll speed with Gaussian variance
             variance = random.gauss(1.0, 0.3)  # 30% variance
             increment = max(10, base_increment * variance)
@@ -447,12 +541,6 @@ async def scroll_naturally(
             if scrolled + increment > total_pixels:
                 increment = total_pixels - scrolled
 
-            # Perform scroll
-            await page.evaluate(f'window.scrollBy(0, {increment})')
-            scrolled += increment
-
-            logger.debug(f'Scrolled {increment:.0f}px (total: {scrolled:.0f}/{total_pixels:.0f}px)')
-
             # Pause for reading with exponential distribution
             # Longer pauses for more content
             # Safety bounds prevent division by zero
@@ -470,17 +558,27 @@ async def scroll_naturally(
             # Clamp final value to reasonable range
             dwell_with_variance = max(0.1, min(dwell_with_variance, 3.0))
 
-            await asyncio.sleep(dwell_with_variance)
-
             # Occasionally add longer pause (simulate careful reading)
             if random.random() < 0.2:  # 20% chance
-                pause_duration = random.uniform(0.5, 2.0) * reading_speed
-                logger.debug(f'Reading pause: {pause_duration:.1f}s')
-                await asyncio.sleep(pause_duration)
+                dwell_with_variance += random.uniform(0.5, 2.0) * reading_speed
+
+            scrolled += increment
+            increments.append(round(increment, 1))
+            dwells.append(round(dwell_with_variance, 3))
 
             if scrolled >= total_pixels:
                 break
 
+        logger.debug(
+            f'Scrolling {scrolled:.0f}px in {len(increments)} increments '
+            f'(~{sum(dwells):.1f}s of reading pauses)'
+        )
+
+        await page.evaluate(
+            _SCROLL_SEQUENCE_JS % (json.dumps(increments), json.dumps(dwells)),
+            await_promise=True,
+        )
+
         logger.info(f'Natural scrolling complete: scrolled {scrolled:.0f}px')
 
     except Exception as e:
@@ -19,6 +19,34 @@ from src.config import BROWSER_CONFIG, USER_AGENTS, VIEWPORT_SIZES, RETRY_CONFIG
 logger = logging.getLogger(__name__)
 
 
+def _pool_picker(pool: tuple):
+    """
+    Build a zero-argument sampler for a fixed fingerprint pool.
+
+    A power-of-two pool is sampled with a masked getrandbits() call instead
+    of random.choice(); other sizes (the current 5-entry USER_AGENTS and
+    VIEWPORT_SIZES included) use random.choice().
+
+    Args:
+        pool: Non-empty tuple of candidates
+
+    Returns:
+        Callable returning a uniformly random element of the pool
+    """
+    size = len(pool)
+    if size and size & (size - 1) == 0:
+        bits = size.bit_length() - 1
+        mask = size - 1
+        getrandbits = random.getrandbits
+        return lambda: pool[getrandbits(bits) & mask] if bits else pool[0]
+    choice = random.choice
+    return lambda: choice(pool)
+
+
+_pick_user_agent = _pool_picker(USER_AGENTS)
+_pick_viewport = _pool_picker(VIEWPORT_SIZES)
+
+
 @dataclass
 class BrowserConfig:
     """
@@ -61,13 +89,13 @@ def _build_browser_args(config: Optional[BrowserConfig] = None) -> tuple[list[st
     if config and config.user_agent:
         user_agent = config.user_agent
     else:
-        user_agent = random.choice(USER_AGENTS)
+        user_agent = _pick_user_agent()
 
     if config:
         width = config.window_width
         height = config.window_height
     else:
-        selected_viewport = random.choice(VIEWPORT_SIZES)
+        selected_viewport = _pick_viewport()
         width = selected_viewport['width']
         height = selected_viewport['height']
 
@@ -238,7 +266,7 @@ def get_random_user_agent() -> str:
     Returns:
         str: Random user agent string
     """
-    return random.choice(USER_AGENTS)
+    return _pick_user_agent()
 
 
 def get_random_viewport() -> dict:
@@ -253,4 +281,4 @@ def get_random_viewport() -> dict:
         >>> print(f"{viewport['width']}x{viewport['height']}")
         1920x1080
     """
-    return random.choice(VIEWPORT_SIZES)
+    return _pick_viewport()
@@ -5,10 +5,13 @@ This module handles post-search navigation actions like starting new chats.
 Uses SmartClicker for reliable element interaction with multiple fallback strategies.
 """
 import asyncio
+import inspect
 import json
 import logging
+import random
+import re
 import time
-from typing import Any, Optional
+from typing import Any, Dict, Optional, Tuple
 
 from src.browser.smart_click import SmartClicker
 from src.browser.interactions import human_delay, find_interactive_element
@@ -16,6 +19,308 @@ from src.config import NEW_CHAT_CONFIG, TIMEOUTS
 
 logger = logging.getLogger(__name__)
 
+# New chat pages: the site root or a /search/[thread-id] path, optionally
+# followed by a query string or fragment
+_NEW_CHAT_URL_RE = re.compile(
+    r'^https?://(?:www\.)?perplexity\.ai(?:/(?:search/[^?#]*)?)?(?:[?#].*)?$'
+)
+
+
+def _union_selector(selectors) -> str:
+    """
+    Join selector patterns into one CSS selector list.
+
+    The browser resolves a comma-joined list in a single pass and returns
+    the first match in document order, so N patterns cost one lookup.
+    """
+    return ', '.join(selectors)
+
+
+# Checks that must all pass for a page to count as a new chat
+_CRITICAL_CHECKS = frozenset({
+    'URL matches new chat pattern',
+    'Search input found',
+    'Search input empty',
+})
+
+# Selectors for elements that indicate a search result page
+_OLD_CONTENT_SELECTORS = (
+    '[data-testid*="answer"]',          # Answer container
+    '[data-testid*="source"]',          # Source citations
+    '[class*="answer"]',                # CSS class-based answer
+    '[class*="response"]',              # Response container
+    'main [class*="text-base"]',        # Response text (Perplexity specific)
+)
+
+# All old-content selectors as one CSS selector list
+_OLD_CONTENT_UNION = _union_selector(_OLD_CONTENT_SELECTORS)
+
+# Text patterns that indicate a search result page
+_OLD_CONTENT_TEXT_PATTERNS = (
+    'ask a follow-up',
+    'ask follow-up',
+)
+
+# Case-insensitive JS RegExp matching any old-content text pattern
+_OLD_CONTENT_TEXT_RE_JS = 'new RegExp({}, "i")'.format(json.dumps('|'.join(
+    re.sub(r'[.*+?^${}()|[\]\\]', r'\\\g<0>', pattern)
+    for pattern in _OLD_CONTENT_TEXT_PATTERNS
+)))
+
+# Old-content check shared by the poll script and the MutationObserver wait.
+# Built once since its inputs are constants.
+_OLD_CONTENT_CHECK_FN = f'''
+    (() => {{
+        const selectors = {json.dumps(list(_OLD_CONTENT_SELECTORS))};
+        const union = {json.dumps(_OLD_CONTENT_UNION)};
+        const textPattern = {_OLD_CONTENT_TEXT_RE_JS};
+        return () => {{
+            // Check all element selectors in one lookup
+            let element = null;
+            try {{
+                element = document.querySelector(union);
+            }} catch (e) {{
+                // Ignore invalid selectors
+            }}
+            if (element !== null) {{
+                // Only resolve which pattern matched once something did
+                const value = selectors.find((selector) => element.matches(selector)) || union;
+                return {{found: true, type: 'selector', value: value}};
+            }}
+
+            // Check text patterns (textContent avoids the layout reflow innerText forces)
+            const match = textPattern.exec(document.body.textContent);
+            if (match) {{
+                return {{found: true, type: 'text', value: match[0]}};
+            }}
+
+            // No old content found
+            return {{found: false}};
+        }};
+    }})()
+'''
+
+# Single poll of the old-content check
+_OLD_CONTENT_JS = f'({_OLD_CONTENT_CHECK_FN})()'
+
+# Push-based wait: re-runs the check only when the DOM mutates and resolves as
+# soon as old content is gone, or with ok=false once timeoutMs elapses
+_OLD_CONTENT_WAIT_JS = f'''
+    ((timeoutMs) => new Promise((resolve) => {{
+        const check = {_OLD_CONTENT_CHECK_FN};
+        const start = performance.now();
+        let done = false;
+        let timer = null;
+        let observer = null;
+        const finish = (ok) => {{
+            if (done) return;
+            done = true;
+            if (observer) observer.disconnect();
+            clearTimeout(timer);
+            resolve({{ok: ok, elapsed: (performance.now() - start) / 1000}});
+        }};
+        if (!check().found) {{ finish(true); return; }}
+        observer = new MutationObserver(() => {{
+            if (!check().found) finish(true);
+        }});
+        observer.observe(document.body, {{subtree: true, childList: true, characterData: true}});
+        timer = setTimeout(() => finish(false), timeoutMs);
+    }}))
+'''
+
+# Resolves true once the page has finished loading, the search input is
+# rendered and old search results are gone, or with the final state once
+# timeoutMs elapses
+_WAIT_READY_JS = f'''
+    ((selector, timeoutMs) => new Promise((resolve) => {{
+        const oldContent = {_OLD_CONTENT_CHECK_FN};
+        const ready = () => {{
+            try {{
+                return document.readyState === 'complete'
+                    && document.querySelector(selector) !== null
+                    && !oldContent().found;
+            }} catch (e) {{
+                return false;
+            }}
+        }};
+        if (ready()) {{ resolve(true); return; }}
+        let done = false;
+        let timer = null;
+        const finish = (ok) => {{
+            if (done) return;
+            done = true;
+            observer.disconnect();
+            document.removeEventListener('readystatechange', onChange);
+            clearTimeout(timer);
+            resolve(ok);
+        }};
+        const onChange = () => {{ if (ready()) finish(true); }};
+        const observer = new MutationObserver(onChange);
+        observer.observe(document, {{subtree: true, childList: true, characterData: true}});
+        document.addEventListener('readystatechange', onChange);
+        timer = setTimeout(() => finish(ready()), timeoutMs);
+    }}))
+'''
+
+# Element-scoped probe for _get_input_value (run via element.apply)
+_INPUT_VALUE_JS = '(el) => String(el.value ?? el.textContent ?? "")'
+
+
+def _build_new_chat_state_js(input_selectors: tuple) -> str:
+    """
+    Build a one-shot JS snapshot of the new chat page state.
+
+    The script reports whether a search input exists, whether it is empty,
+    and whether any old search result content is still on the page.
+    """
+    return f'''
+    (() => {{
+        const inputSelectors = {json.dumps(list(input_selectors))};
+        let input = null;
+        for (const selector of inputSelectors) {{
+            try {{
+                input = document.querySelector(selector);
+            }} catch (e) {{
+                // Ignore invalid selectors
+            }}
+            if (input) break;
+        }}
+        const inputValue = input ? (input.value ?? input.innerText ?? '') : '';
+
+        let hasOld = false;
+        try {{
+            hasOld = document.querySelector({json.dumps(_OLD_CONTENT_UNION)}) !== null;
+        }} catch (e) {{
+            // Ignore invalid selectors
+        }}
+        if (!hasOld) {{
+            hasOld = {_OLD_CONTENT_TEXT_RE_JS}.test(document.body.textContent);
+        }}
+
+        return {{
+            inputFound: input !== null,
+            inputEmpty: input !== null && String(inputValue).trim() === '',
+            hasOld: hasOld,
+        }};
+    }})()
+    '''
+
+
+def _refresh_config() -> None:
+    """
+    Resolve NEW_CHAT_CONFIG lookups into module-level constants.
+
+    Runs once at import so hot paths avoid repeated dict lookups; call again
+    after mutating NEW_CHAT_CONFIG (e.g. in tests) to pick up the changes.
+    """
+    global _NEW_CHAT_SELECTORS, _NEW_CHAT_SELECTOR_UNION
+    global _NEW_CHAT_CLICK_TIMEOUT, _NEW_CHAT_VERIFY_TIMEOUT
+    global _VERIFICATION_SELECTORS, _VERIFICATION_SELECTOR_UNION
+    global _VERIFICATION_POLL_INTERVAL, _NEW_CHAT_STATE_JS, _NEW_CHAT_READY_TIMEOUT
+
+    _NEW_CHAT_SELECTORS = tuple(NEW_CHAT_CONFIG.get('selectors', (
+        'button[data-testid="sidebar-new-thread"]',
+        'button[aria-label="New Thread"]',
+        '[data-testid="sidebar-new-thread"]',
+    )))
+    _NEW_CHAT_SELECTOR_UNION = _union_selector(_NEW_CHAT_SELECTORS)
+    _NEW_CHAT_CLICK_TIMEOUT = NEW_CHAT_CONFIG.get('timeout', TIMEOUTS['element_select'])
+    _NEW_CHAT_VERIFY_TIMEOUT = NEW_CHAT_CONFIG.get('timeout', TIMEOUTS['new_chat_navigation'])
+    _VERIFICATION_SELECTORS = tuple(NEW_CHAT_CONFIG.get('verification_selectors', (
+        '[contenteditable="true"]',
+        'textarea[placeholder*="Ask"]',
+    )))
+    _VERIFICATION_SELECTOR_UNION = _union_selector(_VERIFICATION_SELECTORS)
+    _VERIFICATION_POLL_INTERVAL = NEW_CHAT_CONFIG.get('verification_poll_interval', 0.5)
+    _NEW_CHAT_STATE_JS = _build_new_chat_state_js(_VERIFICATION_SELECTORS)
+    _NEW_CHAT_READY_TIMEOUT = NEW_CHAT_CONFIG.get('ready_timeout', 2.0)
+
+
+_refresh_config()
+
+
+async def _wait_ready(page: Any, selector: str, timeout: float) -> bool:
+    """
+    Wait for the page to settle into a new chat after the button click.
+
+    The browser resolves the wait itself (MutationObserver plus
+    readystatechange), so it returns as soon as the page is ready. Falls
+    back to a fixed human-like delay if the in-page wait cannot run.
+
+    Args:
+        page: Nodriver page/tab object
+        selector: Search input selector that must be present
+        timeout: Max seconds to wait
+
+    Returns:
+        bool: True if the page became ready, False on timeout or fallback
+    """
+    try:
+        result = await page.evaluate(
+            f'{_WAIT_READY_JS}({json.dumps(selector)}, {int(timeout * 1000)})',
+            await_promise=True,
+            return_by_value=True,
+        )
+    except Exception as e:
+        logger.debug("Ready wait failed: %s: %s, using fixed delay", type(e).__name__, e)
+        await human_delay('medium')
+        return False
+
+    if result is True:
+        return True
+    # nodriver hands back the RemoteObject itself for a falsy by-value result
+    if result is False or getattr(result, 'value', None) is False:
+        logger.debug("New chat page not ready after %.2fs", timeout)
+        return False
+
+    # No usable result (e.g. the page navigated mid-wait) - wait the old way
+    logger.debug("Unexpected ready wait result: %s, using fixed delay", type(result))
+    await human_delay('medium')
+    return False
+
+
+async def _probe_new_chat_state(page: Any) -> Optional[dict]:
+    """
+    Read input and old-content state with a single page.evaluate call.
+
+    Args:
+        page: Nodriver page/tab object
+
+    Returns:
+        dict with inputFound, inputEmpty and hasOld keys, or None if the
+        snapshot could not be taken
+    """
+    try:
+        result = await page.evaluate(
+            _NEW_CHAT_STATE_JS,
+            return_by_value=True,
+        )
+    except Exception as e:
+        logger.debug("New chat state probe failed: %s: %s", type(e).__name__, e)
+        return None
+
+    if not isinstance(result, dict):
+        logger.debug("Unexpected new chat state probe result: %s", type(result))
+        return None
+    return result
+
+
+async def _quick_input_empty_check(page: Any) -> bool:
+    """
+    Check in one round-trip whether the page is already a blank new chat.
+
+    Args:
+        page: Nodriver page/tab object
+
+    Returns:
+        bool: True if the search input is present and empty and no old
+              search result content remains, False otherwise
+    """
+    state = await _probe_new_chat_state(page)
+    if state is None:
+        return False
+    return bool(state.get('inputFound') and state.get('inputEmpty') and not state.get('hasOld'))
+
 
 async def navigate_to_new_chat(page: Any, verify: bool = True, previous_url: Optional[str] = None) -> bool:
     """
@@ -53,34 +358,35 @@ async def navigate_to_new_chat(page: Any, verify: bool = True, previous_url: Opt
     """
     logger.info("Navigating to new chat...")
     if previous_url:
-        logger.debug(f"Previous URL stored for verification: {previous_url}")
+        logger.debug("Previous URL stored for verification: %s", previous_url)
 
     try:
-        # Get selectors from config
-        selectors = NEW_CHAT_CONFIG.get('selectors', [
-            'button[data-testid="sidebar-new-thread"]',
-            'button[aria-label="New Thread"]',
-            '[data-testid="sidebar-new-thread"]',
-        ])
-
-        logger.debug(f"Looking for new chat button with {len(selectors)} selector patterns")
-
-        # Find the new chat button using multiple selector patterns
-        button_element = None
-        for selector in selectors:
-            try:
-                button_element = await find_interactive_element(
-                    page,
-                    selectors=[selector],
-                    timeout=NEW_CHAT_CONFIG.get('timeout', TIMEOUTS['element_select'])
-                )
-                if button_element:
-                    logger.debug(f"Found new chat button with selector: {selector}")
-                    break
-            except Exception as e:
-                logger.debug(f"Selector '{selector}' failed: {e}")
-                continue
+        # Skip the find/click/verify cycle if we're already on a blank new chat
+        current_url = getattr(page, 'url', None)
+        if (
+            current_url
+            and _is_new_chat_url(current_url)
+            and (previous_url is None or current_url != previous_url)
+            and await _quick_input_empty_check(page)
+        ):
+            logger.info("Already on an empty new chat page, skipping navigation")
+            return True
+
+        selectors = _NEW_CHAT_SELECTORS
 
+        logger.debug("Looking for new chat button with %d selector patterns", len(selectors))
+
+        # Probe every selector pattern at once in a single lookup
+        combined_selector = _NEW_CHAT_SELECTOR_UNION
+
+        # One deadline shared by the lookup and every click attempt, so the
+        # worst case stays bounded by the configured timeout
+        deadline = time.monotonic() + _NEW_CHAT_CLICK_TIMEOUT
+        button_element = await find_interactive_element(
+            page,
+            selectors=[combined_selector],
+            timeout=_NEW_CHAT_CLICK_TIMEOUT
+        )
         if not button_element:
             error_msg = (
                 "New chat button not found. "
@@ -89,45 +395,63 @@ async def navigate_to_new_chat(page: Any, verify: bool = True, previous_url: Opt
             logger.error(error_msg)
             raise RuntimeError(error_msg)
 
+        logger.debug("Found new chat button with combined selector")
+
         # Add human-like delay before interaction
         logger.debug("Adding human-like delay before clicking...")
         await human_delay('short')
 
-        # Click using SmartClicker for reliability
+        # Fast path: one native click on the element we already resolved.
+        # Sidebar buttons are already in view, so skip scrolling and delays.
         logger.debug("Clicking new chat button with SmartClicker...")
-        clicker = SmartClicker(
+        fast_clicker = SmartClicker(
             page=page,
             verify_click=False,  # We'll do manual verification
-            scroll_into_view=True,
-            human_like_delay=True,
-            max_retries=6
+            scroll_into_view=False,
+            human_like_delay=False,
+            max_retries=1
+        )
+        result = await fast_clicker.click(
+            selector=combined_selector,
+            element=button_element,
+            timeout=max(deadline - time.monotonic(), 0.1)
         )
 
-        # Try to click with the first selector that found the element
-        for selector in selectors:
-            try:
-                result = await clicker.click(
-                    selector=selector,
-                    timeout=NEW_CHAT_CONFIG.get('timeout', 5.0)
-                )
+        remaining = deadline - time.monotonic()
+        if not result.success and remaining > 0:
+            # Escalate: fresh lookup (the handle may be stale) with every strategy
+            logger.debug(
+                "Fast click failed (%s), escalating to full fallback strategies "
+                "(%.2fs left)", result.error, remaining
+            )
+            robust_clicker = SmartClicker(
+                page=page,
+                verify_click=False,
+                scroll_into_view=True,
+                human_like_delay=True,
+                max_retries=6
+            )
+            result = await robust_clicker.click(
+                selector=combined_selector,
+                timeout=remaining
+            )
 
-                if result.success:
-                    logger.info(
-                        f"New chat button clicked successfully using "
-                        f"{result.strategy_used.value} strategy (attempt {result.attempts})"
-                    )
-                    break
-            except Exception as e:
-                logger.debug(f"Click attempt with '{selector}' failed: {e}")
-                continue
-        else:
+        if not result.success:
             # All selectors failed
             logger.error("Failed to click new chat button with all strategies")
             return False
 
-        # Wait for navigation to complete
+        logger.info(
+            "New chat button clicked successfully using %s strategy (attempt %d)",
+            result.strategy_used.value, result.attempts
+        )
+
+        # Wait for navigation to complete: returns as soon as the new chat
+        # page has rendered instead of sleeping a fixed window
         logger.debug("Waiting for navigation to complete...")
-        await human_delay('medium')
+        if await _wait_ready(page, _VERIFICATION_SELECTOR_UNION, _NEW_CHAT_READY_TIMEOUT):
+            # Small jitter so the follow-up probes don't fire in lockstep
+            await asyncio.sleep(random.uniform(0.02, 0.08))
 
         # Verify navigation succeeded if requested
         if verify:
@@ -149,7 +473,7 @@ async def navigate_to_new_chat(page: Any, verify: bool = True, previous_url: Opt
             return True
 
     except Exception as e:
-        logger.error(f"Error during new chat navigation: {type(e).__name__}: {e}")
+        logger.error("Error during new chat navigation: %s: %s", type(e).__name__, e)
         if isinstance(e, RuntimeError):
             logger.error("New chat button not found - check NEW_CHAT_CONFIG selectors")
         return False
@@ -158,11 +482,16 @@ async def navigate_to_new_chat(page: Any, verify: bool = True, previous_url: Opt
 async def verify_new_chat_page(
     page: Any,
     timeout: float = None,
-    previous_url: str = None
+    previous_url: str = None,
+    strict_all_checks: bool = False
 ) -> bool:
     """
     Verify that we're actually on a new chat page.
 
+    DOM state (search input and old content) is read with one fused
+    page.evaluate call; slower polling/probing only runs for whatever that
+    snapshot could not confirm, concurrently when both are needed.
+
     Performs multiple checks with a two-tier strategy:
     - CRITICAL checks (must all pass): URL pattern, search input found, input empty
     - INFO checks (60% majority required): Old search results gone
@@ -174,6 +503,8 @@ async def verify_new_chat_page(
         page: Nodriver page/tab object (nodriver Tab instance)
         timeout: Max seconds to wait (default from config)
         previous_url: URL before navigation (for comparison)
+        strict_all_checks: Run the DOM checks even when the URL checks already
+                           decide the outcome (full diagnostics, slower)
 
     Returns:
         bool: True if CRITICAL checks pass + 60% majority of all checks pass, False otherwise
@@ -192,99 +523,110 @@ async def verify_new_chat_page(
         - URL verification confirms page navigation occurred
         - Input checks ensure search functionality is available
         - Uses try/except for safety - verification fails safely without exceptions
+        - URL pattern mismatch, or staying on the same search thread, returns
+          False before any DOM queries are issued (unless strict_all_checks)
     """
-    timeout = timeout or NEW_CHAT_CONFIG.get('timeout', TIMEOUTS['new_chat_navigation'])
+    timeout = timeout or _NEW_CHAT_VERIFY_TIMEOUT
     logger.info("Verifying new chat page (multi-check verification)...")
 
-    checks_passed = []
+    checks: Dict[str, bool] = {}
 
     try:
         # ===== Check 1: URL Verification =====
         current_url = page.url
-        logger.debug(f"Current URL: {current_url}")
+        logger.debug("Current URL: %s", current_url)
 
         # Check if URL changed from previous
+        url_changed = True
         if previous_url:
             url_changed = current_url != previous_url
-            checks_passed.append(('URL changed', url_changed))
-            logger.debug(f"URL changed from '{previous_url}': {url_changed}")
+            checks['URL changed'] = url_changed
+            logger.debug("URL changed from '%s': %s", previous_url, url_changed)
         else:
             logger.debug("Previous URL not provided, skipping URL change check")
 
         # Check if URL matches new chat pattern
         is_new_chat_url = _is_new_chat_url(current_url)
-        checks_passed.append(('URL matches new chat pattern', is_new_chat_url))
-        logger.debug(f"URL matches new chat pattern: {is_new_chat_url}")
-
-        # ===== Check 2: Previous Content Gone =====
-        old_content_gone = await _verify_old_content_gone(page, timeout)
-        checks_passed.append(('Old search results gone', old_content_gone))
-        logger.debug(f"Old content verification: {old_content_gone}")
+        checks['URL matches new chat pattern'] = is_new_chat_url
+        logger.debug("URL matches new chat pattern: %s", is_new_chat_url)
+
+        # A URL mismatch is a guaranteed critical failure, and an unchanged
+        # search thread URL means the click never navigated - skip all DOM work
+        stayed_on_thread = not url_changed and '/search/' in current_url
+        if not strict_all_checks and (not is_new_chat_url or stayed_on_thread):
+            failed_url_checks = [
+                name for name, passed in checks.items() if not passed
+            ]
+            logger.warning(
+                "New chat page verification: FAILED - URL check(s) failed: "
+                "%s (current URL: %s)", ', '.join(failed_url_checks), current_url
+            )
+            return False
 
-        # ===== Check 3: Search Input Present and Empty =====
-        input_found = False
-        input_empty = False
+        # Read input and old-content state in a single round-trip
+        state = await _probe_new_chat_state(page)
 
-        verification_selectors = NEW_CHAT_CONFIG.get('verification_selectors', [
-            '[contenteditable="true"]',
-            'textarea[placeholder*="Ask"]',
-        ])
+        # ===== Checks 2 & 3: Previous Content Gone, Search Input Present and Empty =====
+        need_old_content_wait = state is None or bool(state.get('hasOld'))
+        need_input_probe = state is None or not state.get('inputFound')
 
-        logger.debug(
-            f"Checking for search input with {len(verification_selectors)} selectors"
+        # Start the old-content wait first so it overlaps the input probe
+        old_content_task = (
+            asyncio.create_task(_verify_old_content_gone(page, timeout))
+            if need_old_content_wait else None
         )
-
-        for selector in verification_selectors:
-            try:
-                element = await find_interactive_element(
-                    page,
-                    [selector],
-                    timeout=timeout
+        try:
+            if need_input_probe:
+                # Input not rendered yet - wait for it with one union-selector probe
+                input_found, input_empty = await _probe_input(
+                    page, _VERIFICATION_SELECTOR_UNION, timeout
                 )
+            else:
+                input_found = True
+                input_empty = bool(state.get('inputEmpty'))
+                logger.debug("Search input found via state snapshot, empty: %s", input_empty)
+
+            if old_content_task is None:
+                old_content_gone = True
+            elif input_found and input_empty:
+                old_content_gone = await old_content_task
+            else:
+                # A critical input check already failed - waiting out the
+                # old-content timeout can't change the outcome
+                logger.debug("Search input check failed, cancelling old content wait")
+                old_content_task.cancel()
+                old_content_gone = False
+        finally:
+            if old_content_task is not None and not old_content_task.done():
+                old_content_task.cancel()
 
-                if element:
-                    input_found = True
-                    input_value = await _get_input_value(element)
-                    input_empty = not input_value or not input_value.strip()
-
-                    logger.debug(
-                        f"Search input found (selector: {selector}), "
-                        f"empty: {input_empty}"
-                    )
-                    break
-            except Exception as e:
-                logger.debug(f"Selector '{selector}' failed: {e}")
-                continue
+        checks['Old search results gone'] = old_content_gone
+        logger.debug("Old content verification: %s", old_content_gone)
 
-        checks_passed.append(('Search input found', input_found))
-        checks_passed.append(('Search input empty', input_empty))
+        checks['Search input found'] = input_found
+        checks['Search input empty'] = input_empty
 
         # ===== Evaluate All Checks =====
-        # Define which checks are critical (must pass)
-        critical_checks = [
-            'URL matches new chat pattern',
-            'Search input found',
-            'Search input empty',
-        ]
-
-        # Check if all critical checks passed
-        critical_passed = all(
-            passed for name, passed in checks_passed if name in critical_checks
-        )
-
-        # Count total passed checks
-        total_checks = len(checks_passed)
-        passed_count = sum(1 for _, passed in checks_passed if passed)
-
-        # Log detailed summary
-        logger.info("New chat verification checks:")
-        for check_name, passed in checks_passed:
-            is_critical = check_name in critical_checks
-            status = "PASS" if passed else "FAIL"
-            criticality = " [CRITICAL]" if is_critical else " [INFO]"
-            logger.info(f"  [{status}]{criticality} {check_name}")
-
-        logger.info(f"Verification summary: {passed_count}/{total_checks} checks passed")
+        # Single pass: count passes, collect failed critical checks and log each
+        total_checks = len(checks)
+        passed_count = 0
+        failed_critical = []
+        log_checks = logger.isEnabledFor(logging.INFO)
+        if log_checks:
+            logger.info("New chat verification checks:")
+        for check_name, passed in checks.items():
+            is_critical = check_name in _CRITICAL_CHECKS
+            if passed:
+                passed_count += 1
+            elif is_critical:
+                failed_critical.append(check_name)
+            if log_checks:
+                status = "PASS" if passed else "FAIL"
+                criticality = " [CRITICAL]" if is_critical else " [INFO]"
+                logger.info("  [%s]%s %s", status, criticality, check_name)
+        critical_passed = not failed_critical
+
+        logger.info("Verification summary: %d/%d checks passed", passed_count, total_checks)
 
         # Verification succeeds if:
         # 1. All critical checks pass, AND
@@ -294,37 +636,97 @@ async def verify_new_chat_page(
 
         if critical_passed and majority_passed:
             logger.info(
-                f"New chat page verification: SUCCESS - All critical checks passed "
-                f"({passed_count}/{total_checks} total)"
+                "New chat page verification: SUCCESS - All critical checks passed "
+                "(%d/%d total)", passed_count, total_checks
             )
             return True
         else:
             if not critical_passed:
-                failed_critical = [name for name in critical_checks
-                                  if not any(passed for n, passed in checks_passed if n == name)]
                 logger.warning(
-                    f"New chat page verification: FAILED - Critical check(s) failed: "
-                    f"{', '.join(failed_critical)}"
+                    "New chat page verification: FAILED - Critical check(s) failed: %s",
+                    ', '.join(failed_critical)
                 )
             else:
                 logger.warning(
-                    f"New chat page verification: FAILED - Only {passed_count}/{total_checks} "
-                    f"checks passed (need {int(majority_threshold * 100)}%)"
+                    "New chat page verification: FAILED - Only %d/%d checks passed "
+                    "(need %d%%)", passed_count, total_checks, int(majority_threshold * 100)
                 )
             return False
 
     except Exception as e:
         logger.error(
-            f"Error during new chat verification: {type(e).__name__}: {e}"
+            "Error during new chat verification: %s: %s", type(e).__name__, e
         )
         return False
 
 
+async def _probe_input(page, selector: str, timeout: float) -> Tuple[bool, bool]:
+    """
+    Wait for the search input and check whether it is empty.
+
+    All verification selectors are probed as one union selector, so the
+    wait costs a single lookup instead of one per selector.
+
+    Args:
+        page: Nodriver page/tab object
+        selector: Search input selector (typically _VERIFICATION_SELECTOR_UNION)
+        timeout: Max seconds to wait for the input
+
+    Returns:
+        Tuple[bool, bool]: (input_found, input_empty)
+    """
+    # find_interactive_element returns None on a miss rather than raising
+    element = await find_interactive_element(page, [selector], timeout=timeout)
+    if element is None:
+        logger.debug("Search input not found")
+        return False, False
+
+    input_value = await _get_input_value(element)
+    input_empty = not input_value or not input_value.strip()
+
+    logger.debug("Search input found, empty: %s", input_empty)
+    return True, input_empty
+
+
+# Fallback value readers in priority order, keyed by the attribute they need
+_VALUE_READERS = (
+    ('get_attribute', lambda element: element.get_attribute('value')),  # input/textarea
+    ('text_all', lambda element: element.text_all),                     # contenteditable
+    ('text', lambda element: element.text),                             # direct text
+)
+
+# Element type -> (reader, returns_awaitable) pairs it supports, so the
+# hasattr and coroutine probes run once per type
+_VALUE_READERS_BY_TYPE: Dict[type, tuple] = {}
+
+
+def _value_readers(element: Any) -> tuple:
+    """
+    Get the fallback value readers supported by an element's type.
+
+    Capabilities, including whether a reader's accessor is a coroutine
+    function (depends on nodriver version), are probed on the first
+    element of each type and cached.
+    """
+    element_type = type(element)
+    readers = _VALUE_READERS_BY_TYPE.get(element_type)
+    if readers is None:
+        readers = tuple(
+            (reader, inspect.iscoroutinefunction(getattr(element, attr)))
+            for attr, reader in _VALUE_READERS if hasattr(element, attr)
+        )
+        _VALUE_READERS_BY_TYPE[element_type] = readers
+    return readers
+
+
 async def _get_input_value(element) -> Optional[str]:
     """
     Safely get input value or text content from an element.
 
-    Tries multiple methods to extract text from input/textarea elements:
+    Prefers a single in-page probe via element.apply() that returns
+    el.value for form inputs or el.textContent for contenteditable elements.
+    Falls back to the attribute/property chain if apply() is unavailable,
+    skipping readers the element's type doesn't support:
     1. .get_attribute('value') - For input/textarea elements
     2. .text_all property - For contenteditable elements
     3. .text property - Fallback for direct text
@@ -336,38 +738,32 @@ async def _get_input_value(element) -> Optional[str]:
         str: Element value/text or None if not accessible
 
     Notes:
-        - Handles both awaitable and non-awaitable attribute access
+        - Handles both coroutine and plain attribute access
         - Safely handles AttributeError and TypeError
         - Returns None instead of raising exceptions
     """
-    try:
-        # Try value attribute first (for input/textarea)
-        value = element.get_attribute('value')
-
-        # Check if it's awaitable (depends on nodriver version)
-        if hasattr(value, '__await__'):
-            value = await value
-
-        if value is not None:
-            return str(value)
-    except (AttributeError, TypeError) as e:
-        logger.debug(f"Could not get 'value' attribute: {e}")
+    # One round-trip: value for input/textarea, textContent for contenteditable
+    apply = getattr(element, 'apply', None)
+    if apply is not None:
+        try:
+            value = await apply(_INPUT_VALUE_JS)
+            if isinstance(value, str):
+                return value
+            logger.debug("Unexpected input value probe result: %s", type(value))
+        except Exception as e:
+            logger.debug("Input value probe failed: %s: %s", type(e).__name__, e)
 
-    # Fallback to text_all property (for contenteditable)
-    try:
-        if hasattr(element, 'text_all'):
-            text_all = element.text_all  # Property, not async
-            return text_all if text_all else ""
-    except (AttributeError, TypeError) as e:
-        logger.debug(f"Could not get 'text_all' property: {e}")
+    # Fallback: readers supported by this element class, resolved once per type
+    for reader, returns_awaitable in _value_readers(element):
+        try:
+            value = reader(element)
+            if returns_awaitable:
+                value = await value
 
-    # Fallback to text property
-    try:
-        if hasattr(element, 'text'):
-            text = element.text  # Property, not async
-            return text if text else ""
-    except (AttributeError, TypeError) as e:
-        logger.debug(f"Could not get 'text' property: {e}")
+            if value is not None:
+                return str(value)
+        except (AttributeError, TypeError) as e:
+            logger.debug("Could not read input value: %s", e)
 
     return None
 
@@ -387,33 +783,30 @@ def _is_new_chat_url(url: str) -> bool:
     Returns:
         bool: True if URL matches new chat pattern
     """
-    if not url:
-        return False
-
-    # Remove protocol and trailing slashes for comparison
-    url_clean = url.replace('https://', '').replace('http://', '').rstrip('/')
+    return bool(url) and _NEW_CHAT_URL_RE.match(url) is not None
 
-    # Check for root path
-    if url_clean == 'www.perplexity.ai' or url_clean == 'perplexity.ai':
-        logger.debug("URL is root path (new chat)")
-        return True
 
-    # Check for /search/ path (new search thread)
-    if '/search/' in url:
-        logger.debug("URL contains /search/ path (new search thread)")
-        return True
+def _poll_backoff(check_count: int, poll_interval: float) -> float:
+    """
+    Delay before the next old-content poll using full-jitter exponential backoff.
 
-    logger.debug(f"URL does not match new chat pattern: {url}")
-    return False
+    Starts around 50ms and doubles per check up to poll_interval, so fast
+    DOM clears are caught early and concurrent verifications don't poll in
+    lockstep.
+    """
+    ceiling = min(poll_interval, 0.05 * (2 ** min(check_count, 4)))
+    return random.uniform(0, ceiling)
 
 
 async def _verify_old_content_gone(page: Any, timeout: float) -> bool:
     """
     Verify that previous search results have disappeared.
 
-    Uses polling to wait for old content to be removed from the DOM.
-    After clicking "new chat", the URL changes immediately while DOM elements
-    take longer to disappear. This function polls repeatedly until either:
+    Waits for old content to be removed from the DOM. After clicking "new
+    chat", the URL changes immediately while DOM elements take longer to
+    disappear. A MutationObserver injected into the page re-checks only on DOM
+    changes and resolves in a single awaited call; if that is unavailable the
+    function falls back to polling. Either way it waits until:
     - No old content is found (success), or
     - Timeout is exceeded (failure)
 
@@ -432,141 +825,128 @@ async def _verify_old_content_gone(page: Any, timeout: float) -> bool:
               False if old content still exists after timeout expires
 
     Notes:
-        - Polls configurable interval for consistent timing
+        - Fallback polling uses jittered exponential backoff capped at the configured interval
         - Returns immediately on success (old content gone)
         - Logs polling progress at DEBUG level to avoid log spam
     """
     # Validate timeout value
     if timeout <= 0:
-        logger.warning(f"Invalid timeout value: {timeout}. Timeout must be positive.")
+        logger.warning("Invalid timeout value: %s. Timeout must be positive.", timeout)
         return False
 
-    # Selectors for elements that indicate a search result page
-    old_content_selectors = [
-        '[data-testid*="answer"]',          # Answer container
-        '[data-testid*="source"]',          # Source citations
-        '[class*="answer"]',                # CSS class-based answer
-        '[class*="response"]',              # Response container
-        'main [class*="text-base"]',        # Response text (Perplexity specific)
-    ]
-
-    # Text patterns that indicate a search result page
-    old_content_text_patterns = [
-        'ask a follow-up',
-        'ask follow-up',
-    ]
-
-    poll_interval = NEW_CHAT_CONFIG.get('verification_poll_interval', 0.5)
-    start_time = time.time()
+    # Event loop clock: monotonic, so immune to wall-clock adjustments
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+
+    # Preferred path: the browser pushes the result back once the DOM settles
+    try:
+        result = await page.evaluate(
+            f'{_OLD_CONTENT_WAIT_JS}({int(timeout * 1000)})',
+            await_promise=True,
+            return_by_value=True,
+        )
+        if isinstance(result, dict) and 'ok' in result:
+            elapsed = result.get('elapsed', loop.time() - start)
+            if result['ok']:
+                logger.debug("Old content gone after %.2fs (MutationObserver)", elapsed)
+                return True
+            logger.warning(
+                "Timeout waiting for old content to disappear "
+                "(elapsed=%.2fs, MutationObserver). Old content may still be present.",
+                elapsed
+            )
+            return False
+        logger.debug(
+            "Unexpected MutationObserver wait result: %s, falling back to polling", type(result)
+        )
+    except Exception as e:
+        logger.debug(
+            "MutationObserver wait failed: %s: %s, falling back to polling", type(e).__name__, e
+        )
+
+    poll_interval = _VERIFICATION_POLL_INTERVAL
     check_count = 0
 
     logger.debug(
-        f"Starting polling for old content removal (timeout={timeout}s, "
-        f"poll_interval={poll_interval}s, {len(old_content_selectors)} selectors, "
-        f"{len(old_content_text_patterns)} text patterns)"
+        "Starting polling for old content removal (timeout=%ss, poll_interval=%ss, "
+        "%d selectors, %d text patterns)",
+        timeout, poll_interval, len(_OLD_CONTENT_SELECTORS), len(_OLD_CONTENT_TEXT_PATTERNS)
     )
 
     # Polling loop
     while True:
         check_count += 1
-        elapsed = time.time() - start_time
-        logger.debug(f"Check #{check_count}: elapsed={elapsed:.2f}s")
+        elapsed = loop.time() - start
+        logger.debug("Check #%d: elapsed=%.2fs", check_count, elapsed)
 
         # Check if timeout expired
         if elapsed >= timeout:
             logger.warning(
-                f"Timeout waiting for old content to disappear "
-                f"(elapsed={elapsed:.2f}s, check_count={check_count}). "
-                f"Old content may still be present."
+                "Timeout waiting for old content to disappear "
+                "(elapsed=%.2fs, check_count=%d). Old content may still be present.",
+                elapsed, check_count
             )
             return False
 
         # Use single JavaScript evaluation to check all conditions at once
         # This is MUCH faster than multiple page.select_all() and page.evaluate() calls
         try:
-            # Build JavaScript to check all selectors and text patterns
-            selectors_js = json.dumps(old_content_selectors)
-            patterns_js = json.dumps([p.lower() for p in old_content_text_patterns])
-
-            result = await page.evaluate(f'''
-                (() => {{
-                    // Check element selectors
-                    const selectors = {selectors_js};
-                    for (const selector of selectors) {{
-                        try {{
-                            const elements = document.querySelectorAll(selector);
-                            if (elements.length > 0) {{
-                                return {{found: true, type: 'selector', value: selector, count: elements.length}};
-                            }}
-                        }} catch (e) {{
-                            // Ignore invalid selectors
-                        }}
-                    }}
-
-                    // Check text patterns
-                    const patterns = {patterns_js};
-                    const bodyText = document.body.innerText.toLowerCase();
-                    for (const pattern of patterns) {{
-                        if (bodyText.includes(pattern)) {{
-                            return {{found: true, type: 'text', value: pattern}};
-                        }}
-                    }}
-
-                    // No old content found
-                    return {{found: false}};
-                }})()
-            ''')
+            result = await page.evaluate(_OLD_CONTENT_JS, return_by_value=True)
 
             # Handle different return types from page.evaluate()
             # Sometimes returns dict, sometimes list, sometimes None
             if not result or not isinstance(result, dict):
                 # Invalid or unexpected result - log and retry
                 logger.debug(
-                    f"Check #{check_count}: Unexpected JavaScript result type: {type(result)}, "
-                    f"value: {result}"
+                    "Check #%d: Unexpected JavaScript result type: %s, value: %s",
+                    check_count, type(result), result
                 )
                 # Assume old content might still be present
-                logger.debug(f"Retrying after unexpected result in {poll_interval}s...")
-                await asyncio.sleep(poll_interval)
+                delay = _poll_backoff(check_count, poll_interval)
+                logger.debug("Retrying after unexpected result in %.2fs...", delay)
+                await asyncio.sleep(delay)
                 continue
 
             # Valid dict result
             if result.get('found'):
-                found_type = result.get('type', 'unknown')
-                found_value = result.get('value', 'unknown')
-                if found_type == 'selector':
-                    count = result.get('count', '?')
-                    logger.debug(
-                        f"Check #{check_count}: Found old content with selector "
-                        f"'{found_value}' ({count} elements)"
-                    )
-                else:
-                    logger.debug(
-                        f"Check #{check_count}: Found old content text pattern '{found_value}'"
-                    )
-
-                logger.debug(f"Old content still present, retrying in {poll_interval}s...")
-                await asyncio.sleep(poll_interval)
+                if logger.isEnabledFor(logging.DEBUG):
+                    found_type = result.get('type', 'unknown')
+                    found_value = result.get('value', 'unknown')
+                    if found_type == 'selector':
+                        logger.debug(
+                            "Check #%d: Found old content with selector '%s'",
+                            check_count, found_value
+                        )
+                    else:
+                        logger.debug(
+                            "Check #%d: Found old content text pattern '%s'",
+                            check_count, found_value
+                        )
+
+                delay = _poll_backoff(check_count, poll_interval)
+                logger.debug("Old content still present, retrying in %.2fs...", delay)
+                await asyncio.sleep(delay)
                 continue
             else:
                 # No old content found - success!
                 logger.debug(
-                    f"Check #{check_count}: No old content found after {check_count} checks "
-                    f"({elapsed:.2f}s)"
+                    "Check #%d: No old content found after %d checks (%.2fs)",
+                    check_count, check_count, elapsed
                 )
                 return True
 
         except Exception as e:
             logger.debug(
-                f"Check #{check_count}: Error during evaluation: {type(e).__name__}: {e}"
+                "Check #%d: Error during evaluation: %s: %s", check_count, type(e).__name__, e
             )
             # On error, assume content might still be present and retry
             # (unless we're close to timeout)
             if elapsed >= timeout - 1.0:  # Less than 1s left
                 logger.warning(
-                    f"Error during verification with insufficient time remaining: {e}"
+                    "Error during verification with insufficient time remaining: %s", e
                 )
                 return False
-            logger.debug(f"Retrying after error in {poll_interval}s...")
-            await asyncio.sleep(poll_interval)
+            delay = _poll_backoff(check_count, poll_interval)
+            logger.debug("Retrying after error in %.2fs...", delay)
+            await asyncio.sleep(delay)
             continue
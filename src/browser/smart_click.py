@@ -14,17 +14,124 @@ Features:
 
 import asyncio
 import random
+import sys
 import time
 import logging
 from dataclasses import dataclass
 from enum import Enum
-from typing import Optional, Any, Callable
+from typing import Optional, Any, Callable, Dict, Tuple
 import nodriver as uc
 
 from src.browser.element_waiter import ElementWaiter, WaitCondition
 
 logger = logging.getLogger(__name__)
 
+# Element-scoped scripts, run via element.apply(), which passes the element
+# as the function's only argument. Built once at import.
+_JS_IS_VISIBLE = """
+(el) => {
+    const style = window.getComputedStyle(el);
+    if (style.display === 'none' || style.visibility === 'hidden'
+        || style.opacity === '0') {
+        return false;
+    }
+    const rect = el.getBoundingClientRect();
+    return rect.width > 0 && rect.height > 0;
+}
+"""
+
+_JS_IS_INTERACTABLE = """
+(el) => {
+    // Check if disabled
+    if (el.disabled) return false;
+
+    // Check aria-disabled
+    if (el.getAttribute('aria-disabled') === 'true') return false;
+
+    // Check pointer-events
+    if (window.getComputedStyle(el).pointerEvents === 'none') return false;
+
+    // Check if element or parent is hidden
+    for (let current = el; current; current = current.parentElement) {
+        const s = window.getComputedStyle(current);
+        if (s.display === 'none' || s.visibility === 'hidden') {
+            return false;
+        }
+    }
+    return true;
+}
+"""
+
+_JS_SCROLL_CENTER = (
+    "(el) => el.scrollIntoView({behavior: '%s', block: 'center', inline: 'center'})"
+)
+# Instant scrolling lays out synchronously, so no settle wait is needed
+_JS_SCROLL_INSTANT = _JS_SCROLL_CENTER % 'instant'
+_JS_SCROLL_SMOOTH = _JS_SCROLL_CENTER % 'smooth'
+
+_JS_CLICK = '(el) => el.click()'
+
+_JS_DISPATCH_CLICK = """
+(el) => {
+    el.dispatchEvent(new MouseEvent('mousedown', {bubbles: true}));
+    el.dispatchEvent(new MouseEvent('mouseup', {bubbles: true}));
+    el.dispatchEvent(new MouseEvent('click', {bubbles: true}));
+}
+"""
+
+_JS_IS_CONNECTED = '(el) => el.isConnected'
+
+
+def _key_message(type_: str, **key: Any) -> Dict[str, Any]:
+    """Build an Input.dispatchKeyEvent message once, via nodriver's own CDP helper."""
+    return next(uc.cdp.input_.dispatch_key_event(type_=type_, **key))
+
+
+def _replay(message: Dict[str, Any]):
+    """
+    Wrap a prebuilt CDP message in the one-shot generator page.send() expects.
+
+    CDP command generators cannot be reused, but the message dict they yield
+    is never mutated by send(), so it can be built once at import.
+    """
+    yield message
+
+
+_ENTER_KEY = dict(key='Enter', code='Enter', windows_virtual_key_code=13, native_virtual_key_code=13)
+# keyDown carries text so Chrome also emits the keypress that buttons
+# activate on; links activate on the keydown itself
+_ENTER_DOWN = _key_message('keyDown', text='\r', **_ENTER_KEY)
+_ENTER_UP = _key_message('keyUp', **_ENTER_KEY)
+_SPACE_DOWN = _key_message('keyDown', key=' ', code='Space')
+_SPACE_UP = _key_message('keyUp', key=' ', code='Space')
+
+# Pre-click preparation: visibility, interactability and (optionally) scroll
+# into view in one round-trip instead of three
+_PREPARE_ELEMENT_TEMPLATE = f"""
+(el) => {{
+    const visible = ({_JS_IS_VISIBLE})(el);
+    const interactable = ({_JS_IS_INTERACTABLE})(el);
+    if (%s) {{
+        (%s)(el);
+    }}
+    return {{visible: visible, interactable: interactable}};
+}}
+"""
+_PREPARE_ELEMENT_JS = _PREPARE_ELEMENT_TEMPLATE % ('false', _JS_SCROLL_INSTANT)
+_PREPARE_AND_SCROLL_JS = _PREPARE_ELEMENT_TEMPLATE % ('true', _JS_SCROLL_INSTANT)
+_PREPARE_AND_SMOOTH_SCROLL_JS = _PREPARE_ELEMENT_TEMPLATE % ('true', _JS_SCROLL_SMOOTH)
+
+# Time for a smooth scroll animation to finish before clicking
+_SMOOTH_SCROLL_SETTLE = 0.3
+
+# Human-like delay ranges as (min_seconds, span_seconds)
+_DELAY_AFTER_SCROLL = (0.1, 0.2)      # 100-300ms
+_DELAY_AFTER_CLICK = (0.2, 0.3)       # 200-500ms
+_DELAY_BEFORE_KEY = (0.05, 0.1)       # 50-150ms
+_DELAY_BETWEEN_CLICKS = (0.01, 0.04)  # 10-50ms
+
+_random = random.random
+
 
 class ClickStrategy(Enum):
     """Click strategies in order of preference."""
@@ -36,7 +143,24 @@ class ClickStrategy(Enum):
     DOUBLE_CLICK = "double_click"
 
 
-@dataclass
+# Fallback order used by SmartClicker (sliced to max_retries)
+_DEFAULT_STRATEGIES: Tuple[ClickStrategy, ...] = (
+    ClickStrategy.NORMAL,
+    ClickStrategy.JAVASCRIPT,
+    ClickStrategy.FOCUS_ENTER,
+    ClickStrategy.DISPATCH_EVENT,
+    ClickStrategy.FOCUS_SPACE,
+    ClickStrategy.DOUBLE_CLICK,
+)
+
+# Placeholder strategy reported when no click was attempted
+_STRAT_NORMAL = ClickStrategy.NORMAL
+
+# dataclass(slots=True) needs Python 3.10+; older interpreters keep __dict__
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class ClickResult:
     """Result of a click attempt."""
     success: bool
@@ -64,6 +188,7 @@ class SmartClicker:
         scroll_into_view: bool = True,
         human_like_delay: bool = True,
         max_retries: int = 6,
+        smooth_scroll: bool = False,
     ):
         """
         Initialize the SmartClicker.
@@ -74,18 +199,35 @@ class SmartClicker:
             scroll_into_view: Scroll element into viewport before clicking
             human_like_delay: Add random delays between actions
             max_retries: Maximum number of strategies to try
+            smooth_scroll: Animate scroll-into-view and wait for it to settle
+                (instant scrolling needs no wait)
         """
         self.page = page
         self.verify_click = verify_click
         self.scroll_into_view = scroll_into_view
         self.human_like_delay = human_like_delay
         self.max_retries = max_retries
+        self.smooth_scroll = smooth_scroll
+
+        # ElementWaiter keeps no per-query state, so one instance serves every click
+        self._waiter = ElementWaiter(page, poll_interval=0.1, verbose=False)
+
+        # Strategy -> bound click method
+        self._dispatch = {
+            ClickStrategy.NORMAL: self._click_normal,
+            ClickStrategy.JAVASCRIPT: self._click_javascript,
+            ClickStrategy.FOCUS_ENTER: self._click_focus_enter,
+            ClickStrategy.FOCUS_SPACE: self._click_focus_space,
+            ClickStrategy.DISPATCH_EVENT: self._click_dispatch_event,
+            ClickStrategy.DOUBLE_CLICK: self._click_double_click,
+        }
 
     async def click(
         self,
-        selector: str,
+        selector: Optional[str] = None,
         verify_action: Optional[Callable] = None,
         timeout: float = 10.0,
+        element: Any = None,
     ) -> ClickResult:
         """
         Click an element with automatic fallback strategies.
@@ -94,42 +236,46 @@ class SmartClicker:
             selector: CSS selector for the element
             verify_action: Optional async callable to verify click succeeded
             timeout: Timeout for the entire operation
+            element: Already-resolved element handle; skips the selector lookup
 
         Returns:
-            ClickResult with success status and details
+            ClickResult with success status and details. Routine failures
+            (element not found, every strategy failing) are reported via
+            success=False rather than raised, so callers can branch on the
+            result without try/except.
         """
-        start_time = time.time()
+        deadline = time.monotonic() + timeout
 
         try:
-            # Step 1: Find and validate element
-            element = await self._find_element(selector, timeout)
+            # Step 1: Find and validate element (unless the caller already has it)
+            if element is None:
+                element = await self._find_element(selector, timeout)
             if not element:
                 return ClickResult(
                     success=False,
-                    strategy_used=ClickStrategy.NORMAL,
+                    strategy_used=_STRAT_NORMAL,
                     attempts=1,
                     error=f"Element not found: {selector}",
                 )
 
-            # Step 2: Check visibility and interactability
-            is_visible = await self._check_element_visible(element)
-            is_interactable = await self._check_element_interactable(element)
-
-            if not is_visible or not is_interactable:
-                logger.warning(
-                    f"Element not fully interactable - visible: {is_visible}, "
-                    f"interactable: {is_interactable}"
-                )
-
-            # Step 3: Scroll into view if needed
+            # Steps 2-3: Scroll into view if needed. The visibility and
+            # interactability checks ride along on the same round-trip;
+            # without a scroll they are deferred until the first fallback.
+            checked = False
             if self.scroll_into_view:
-                await self._scroll_into_view(element)
-                await self._add_delay(100, 300)
+                await self._check_readiness(element)
+                checked = True
+                if self.smooth_scroll:
+                    await asyncio.sleep(_SMOOTH_SCROLL_SETTLE)  # Wait for scroll animation
+                await self._add_delay(_DELAY_AFTER_SCROLL)
 
             # Step 4: Try click strategies in order
             strategies = self._get_strategies_to_try()
+            # Per-attempt outcomes are collected and logged as one line
+            debug = logger.isEnabledFor(logging.DEBUG)
+            failed = []
             for attempt, strategy in enumerate(strategies, 1):
-                if time.time() - start_time > timeout:
+                if time.monotonic() > deadline:
                     return ClickResult(
                         success=False,
                         strategy_used=strategy,
@@ -137,30 +283,42 @@ class SmartClicker:
                         error="Timeout exceeded",
                     )
 
+                if not checked and attempt > 1:
+                    # The native click failed - only now is it worth knowing why
+                    await self._check_readiness(element)
+                    checked = True
+
                 try:
-                    logger.debug(f"Trying click strategy: {strategy.value} (attempt {attempt})")
                     success = await self._execute_click_strategy(element, strategy)
                     if success:
-                        await self._add_delay(200, 500)
+                        await self._add_delay(_DELAY_AFTER_CLICK)
 
                         # Verify if requested
                         verified = True
                         if verify_action:
                             verified = await self._verify_action(
-                                verify_action, timeout - (time.time() - start_time)
+                                verify_action, deadline - time.monotonic()
                             )
 
-                        logger.info(f"Click successful using {strategy.value} strategy")
+                        if failed:
+                            logger.debug("Click strategies failed before %s: %s",
+                                         strategy.value, '; '.join(failed))
+                        logger.info("Click successful using %s strategy", strategy.value)
                         return ClickResult(
                             success=True,
                             strategy_used=strategy,
                             attempts=attempt,
                             verification_passed=verified,
                         )
+                    if debug:
+                        failed.append(strategy.value)
                 except Exception as e:
-                    logger.debug(f"Strategy {strategy.value} failed: {str(e)}")
+                    if debug:
+                        failed.append('%s (%s)' % (strategy.value, e))
                     continue
 
+            if failed:
+                logger.debug("All click strategies failed: %s", '; '.join(failed))
             return ClickResult(
                 success=False,
                 strategy_used=strategies[-1],
@@ -169,24 +327,17 @@ class SmartClicker:
             )
 
         except Exception as e:
-            logger.error(f"Click operation failed: {str(e)}")
+            logger.error("Click operation failed: %s", e)
             return ClickResult(
                 success=False,
-                strategy_used=ClickStrategy.NORMAL,
+                strategy_used=_STRAT_NORMAL,
                 attempts=0,
                 error=str(e),
             )
 
-    def _get_strategies_to_try(self) -> list:
-        """Get list of strategies to try in order."""
-        return [
-            ClickStrategy.NORMAL,
-            ClickStrategy.JAVASCRIPT,
-            ClickStrategy.FOCUS_ENTER,
-            ClickStrategy.DISPATCH_EVENT,
-            ClickStrategy.FOCUS_SPACE,
-            ClickStrategy.DOUBLE_CLICK,
-        ]
+    def _get_strategies_to_try(self) -> Tuple[ClickStrategy, ...]:
+        """Get strategies to try in order, capped at max_retries."""
+        return _DEFAULT_STRATEGIES[:max(self.max_retries, 1)]
 
     async def _find_element(self, selector: str, timeout: float) -> Any:
         """
@@ -199,115 +350,111 @@ class SmartClicker:
         Returns:
             Element if found, None otherwise
         """
-        # Use ElementWaiter instead of reimplementing
-        waiter = ElementWaiter(self.page, poll_interval=0.1, verbose=False)
-
-        # Wait for element to be present
-        result = await waiter.wait_for_presence(selector, timeout=timeout)
+        # Wait for element to be present (ElementWaiter instead of reimplementing)
+        result = await self._waiter.wait_for_presence(selector, timeout=timeout)
 
         if result.success:
             logger.debug(
-                f"Element found: {selector} after {result.wait_time:.2f}s "
-                f"({result.attempts} attempts)"
+                "Element found: %s after %.2fs (%d attempts)",
+                selector, result.wait_time, result.attempts
             )
             return result.element
         else:
             logger.debug(
-                f"Element not found: {selector} after {result.wait_time:.2f}s "
-                f"({result.attempts} attempts)"
+                "Element not found: %s after %.2fs (%d attempts)",
+                selector, result.wait_time, result.attempts
             )
             return None
 
+    async def _prepare_element(self, element: Any) -> Tuple[bool, bool]:
+        """
+        Check visibility and interactability, and scroll into view if enabled.
+
+        Runs as a single element.apply call instead of one round-trip per
+        check.
+
+        If the combined script returns something unusable, the separate
+        checks run concurrently instead.
+
+        Returns:
+            (visible, interactable); both assumed True on error
+        """
+        if not self.scroll_into_view:
+            script = _PREPARE_ELEMENT_JS
+        elif self.smooth_scroll:
+            script = _PREPARE_AND_SMOOTH_SCROLL_JS
+        else:
+            script = _PREPARE_AND_SCROLL_JS
+        try:
+            result = await element.apply(script)
+            if isinstance(result, dict):
+                return bool(result.get('visible')), bool(result.get('interactable'))
+            logger.debug("Unexpected element preparation result: %s", type(result))
+            return await self._prepare_element_separately(element)
+        except Exception as e:
+            logger.debug("Error preparing element: %s", e)
+        return True, True  # Assume visible and interactable on error
+
+    async def _prepare_element_separately(self, element: Any) -> Tuple[bool, bool]:
+        """Run the individual checks (and scroll) as one concurrent batch."""
+        checks = [
+            self._check_element_visible(element),
+            self._check_element_interactable(element),
+        ]
+        if self.scroll_into_view:
+            # click() waits out a smooth scroll itself
+            checks.append(self._scroll_into_view(element, settle=False))
+        is_visible, is_interactable, *_ = await asyncio.gather(*checks)
+        return is_visible, is_interactable
+
+    async def _check_readiness(self, element: Any) -> None:
+        """Run the pre-click checks and warn if the element looks unclickable."""
+        is_visible, is_interactable = await self._prepare_element(element)
+
+        if not is_visible or not is_interactable:
+            logger.warning(
+                "Element not fully interactable - visible: %s, interactable: %s",
+                is_visible, is_interactable
+            )
+
     async def _check_element_visible(self, element: Any) -> bool:
         """Check if element is visible in the viewport."""
         try:
-            script = """
-            function isVisible(el) {
-                if (!el) return false;
-                const style = window.getComputedStyle(el);
-                if (style.display === 'none' || style.visibility === 'hidden'
-                    || style.opacity === '0') {
-                    return false;
-                }
-                const rect = el.getBoundingClientRect();
-                return rect.width > 0 && rect.height > 0;
-            }
-            return isVisible(arguments[0]);
-            """
-            return await self.page.evaluate(script, element)
+            result = await element.apply(_JS_IS_VISIBLE)
+            return result if isinstance(result, bool) else True
         except Exception as e:
-            logger.debug(f"Error checking visibility: {str(e)}")
+            logger.debug("Error checking visibility: %s", e)
             return True  # Assume visible on error
 
     async def _check_element_interactable(self, element: Any) -> bool:
         """Check if element can receive interactions."""
         try:
-            script = """
-            function isInteractable(el) {
-                if (!el) return false;
-
-                // Check if disabled
-                if (el.disabled) return false;
-
-                // Check aria-disabled
-                if (el.getAttribute('aria-disabled') === 'true') return false;
-
-                // Check pointer-events
-                const style = window.getComputedStyle(el);
-                if (style.pointerEvents === 'none') return false;
-
-                // Check if element or parent is hidden
-                let current = el;
-                while (current) {
-                    const s = window.getComputedStyle(current);
-                    if (s.display === 'none' || s.visibility === 'hidden') {
-                        return false;
-                    }
-                    current = current.parentElement;
-                }
-
-                return true;
-            }
-            return isInteractable(arguments[0]);
-            """
-            return await self.page.evaluate(script, element)
+            result = await element.apply(_JS_IS_INTERACTABLE)
+            return result if isinstance(result, bool) else True
         except Exception as e:
-            logger.debug(f"Error checking interactability: {str(e)}")
+            logger.debug("Error checking interactability: %s", e)
             return True  # Assume interactable on error
 
-    async def _scroll_into_view(self, element: Any) -> None:
-        """Scroll element into view."""
+    async def _scroll_into_view(self, element: Any, settle: bool = True) -> None:
+        """Scroll element into view, waiting for a smooth scroll if settle is set."""
         try:
-            script = """
-            arguments[0].scrollIntoView({
-                behavior: 'smooth',
-                block: 'center',
-                inline: 'center'
-            });
-            """
-            await self.page.evaluate(script, element)
-            await asyncio.sleep(0.3)  # Wait for scroll animation
+            if self.smooth_scroll:
+                await element.apply(_JS_SCROLL_SMOOTH)
+                if settle:
+                    await asyncio.sleep(_SMOOTH_SCROLL_SETTLE)  # Wait for scroll animation
+            else:
+                await element.apply(_JS_SCROLL_INSTANT)
         except Exception as e:
-            logger.debug(f"Scroll into view failed: {str(e)}")
+            logger.debug("Scroll into view failed: %s", e)
 
     async def _execute_click_strategy(
         self, element: Any, strategy: ClickStrategy
     ) -> bool:
         """Execute a specific click strategy."""
-        if strategy == ClickStrategy.NORMAL:
-            return await self._click_normal(element)
-        elif strategy == ClickStrategy.JAVASCRIPT:
-            return await self._click_javascript(element)
-        elif strategy == ClickStrategy.FOCUS_ENTER:
-            return await self._click_focus_enter(element)
-        elif strategy == ClickStrategy.FOCUS_SPACE:
-            return await self._click_focus_space(element)
-        elif strategy == ClickStrategy.DISPATCH_EVENT:
-            return await self._click_dispatch_event(element)
-        elif strategy == ClickStrategy.DOUBLE_CLICK:
-            return await self._click_double_click(element)
-
-        return False
+        handler = self._dispatch.get(strategy)
+        if handler is None:
+            return False
+        return await handler(element)
 
     async def _click_normal(self, element: Any) -> bool:
         """Standard element click."""
@@ -315,110 +462,120 @@ class SmartClicker:
             await element.click()
             return True
         except Exception as e:
-            logger.debug(f"Normal click failed: {str(e)}")
+            logger.debug("Normal click failed: %s", e)
             return False
 
     async def _click_javascript(self, element: Any) -> bool:
         """Click using JavaScript."""
         try:
-            script = "arguments[0].click();"
-            await self.page.evaluate(script, element)
+            await element.apply(_JS_CLICK)
             return True
         except Exception as e:
-            logger.debug(f"JavaScript click failed: {str(e)}")
+            logger.debug("JavaScript click failed: %s", e)
             return False
 
     async def _click_focus_enter(self, element: Any) -> bool:
         """Focus element and press Enter."""
         try:
-            await self._focus_element(element)
-            await self._add_delay(50, 150)
-            await self.page.send(
-                uc.cdp.input_.dispatch_key_event(
-                    type_='keyDown',
-                    key='Enter',
-                    code='Enter',
-                    windows_virtual_key_code=13,
-                    native_virtual_key_code=13
-                )
-            )
-            await self._add_delay(10, 30)
-            await self.page.send(
-                uc.cdp.input_.dispatch_key_event(
-                    type_='keyUp',
-                    key='Enter',
-                    code='Enter',
-                    windows_virtual_key_code=13,
-                    native_virtual_key_code=13
-                )
-            )
+            await self._focus_and_press(element, _ENTER_DOWN, _ENTER_UP)
             return True
         except Exception as e:
-            logger.debug(f"Focus+Enter click failed: {str(e)}")
+            logger.debug("Focus+Enter click failed: %s", e)
             return False
 
     async def _click_focus_space(self, element: Any) -> bool:
         """Focus element and press Space."""
         try:
-            await self._focus_element(element)
-            await self._add_delay(50, 150)
-            await self.page.send(
-                uc.cdp.input_.dispatch_key_event(type_='keyDown', key=' ', code='Space')
-            )
-            await self._add_delay(10, 30)
-            await self.page.send(
-                uc.cdp.input_.dispatch_key_event(type_='keyUp', key=' ', code='Space')
-            )
+            await self._focus_and_press(element, _SPACE_DOWN, _SPACE_UP)
             return True
         except Exception as e:
-            logger.debug(f"Focus+Space click failed: {str(e)}")
+            logger.debug("Focus+Space click failed: %s", e)
             return False
 
+    async def _focus_and_press(
+        self, element: Any, key_down: Dict[str, Any], key_up: Dict[str, Any]
+    ) -> None:
+        """
+        Focus an element and send prebuilt keyDown/keyUp messages.
+
+        DOM.focus is a single CDP command, so without a human-like pause it
+        joins the key events in one pipelined batch; the session handles
+        commands in order, so focus still lands first. Key strategies only
+        run as fallbacks, so they skip the cosmetic inter-key delay.
+        """
+        focus = uc.cdp.dom.focus(backend_node_id=element.backend_node_id)
+        if self.human_like_delay:
+            await self.page.send(focus)
+            await self._add_delay(_DELAY_BEFORE_KEY)
+            await self._pipeline(_replay(key_down), _replay(key_up))
+        else:
+            await self._pipeline(focus, _replay(key_down), _replay(key_up))
+
+    async def _pipeline(self, *commands: Any) -> list:
+        """
+        Send CDP commands back to back over the page's connection, then
+        await all replies together.
+
+        Sends are issued in argument order, so the browser also runs them in
+        that order; the batch costs one round-trip instead of one per command.
+        """
+        return await asyncio.gather(*(self.page.send(command) for command in commands))
+
     async def _click_dispatch_event(self, element: Any) -> bool:
         """Dispatch click and mousedown/mouseup events."""
         try:
-            script = """
-            const el = arguments[0];
-            el.dispatchEvent(new MouseEvent('mousedown', {bubbles: true}));
-            el.dispatchEvent(new MouseEvent('mouseup', {bubbles: true}));
-            el.dispatchEvent(new MouseEvent('click', {bubbles: true}));
-            """
-            await self.page.evaluate(script, element)
+            await element.apply(_JS_DISPATCH_CLICK)
             return True
         except Exception as e:
-            logger.debug(f"Dispatch event click failed: {str(e)}")
+            logger.debug("Dispatch event click failed: %s", e)
             return False
 
     async def _click_double_click(self, element: Any) -> bool:
         """Double-click the element."""
         try:
             await element.click()
-            await self._add_delay(10, 50)
+            # The first click already removed the node (e.g. it navigated);
+            # a second click would be wasted or land on stale state
+            if await element.apply(_JS_IS_CONNECTED) is False:
+                return True
+            await self._add_delay(_DELAY_BETWEEN_CLICKS)
             await element.click()
             return True
         except Exception as e:
-            logger.debug(f"Double-click failed: {str(e)}")
+            logger.debug("Double-click failed: %s", e)
             return False
 
-    async def _focus_element(self, element: Any) -> None:
-        """Focus an element."""
-        script = "arguments[0].focus();"
-        await self.page.evaluate(script, element)
-
     async def _verify_action(self, verify_func: Callable, timeout: float) -> bool:
         """Verify that click action had desired effect."""
         try:
             result = await asyncio.wait_for(verify_func(), timeout=timeout)
             return bool(result)
         except Exception as e:
-            logger.debug(f"Verification failed: {str(e)}")
+            logger.debug("Verification failed: %s", e)
             return False
 
-    async def _add_delay(self, min_ms: int, max_ms: int) -> None:
-        """Add human-like random delay."""
+    async def _add_delay(self, delay_range: Tuple[float, float]) -> None:
+        """Add human-like random delay from a (min_seconds, span_seconds) range."""
         if self.human_like_delay:
-            delay = random.randint(min_ms, max_ms) / 1000
-            await asyncio.sleep(delay)
+            low, span = delay_range
+            await asyncio.sleep(low + _random() * span)
+
+
+# Attribute used to cache one SmartClicker per page (nodriver tabs are unhashable,
+# so a WeakKeyDictionary cannot be used; the clicker lives as long as its page)
+_CLICKER_ATTR = '_smart_clicker'
+
+
+def _get_page_clicker(page) -> SmartClicker:
+    """Return the cached SmartClicker for a page, creating it on first use."""
+    clicker = getattr(page, '__dict__', {}).get(_CLICKER_ATTR)
+    if clicker is None:
+        clicker = SmartClicker(page, verify_click=True, human_like_delay=True)
+        try:
+            setattr(page, _CLICKER_ATTR, clicker)
+        except (AttributeError, TypeError):
+            pass
+    return clicker
 
 
 # Convenience function for direct use
@@ -440,5 +597,5 @@ async def smart_click(
     Returns:
         ClickResult with success status
     """
-    clicker = SmartClicker(page, verify_click=True, human_like_delay=True)
+    clicker = _get_page_clicker(page)
     return await clicker.click(selector, verify_action, timeout)
@@ -3,11 +3,13 @@ Configuration settings for GEO-Perplex automation tool
 Centralizes all constants, timeouts, and selectors for easy maintenance
 """
 
+import re
 from dataclasses import dataclass, field, asdict
-from typing import List, Dict, Any
+from types import MappingProxyType
+from typing import Any, Callable, Dict, List, Tuple
 
 
-@dataclass
+@dataclass(frozen=True)
 class BrowserConfig:
     """Browser configuration with validation"""
     headless: bool = False  # Must be False - Perplexity blocks headless browsers
@@ -25,7 +27,7 @@ class BrowserConfig:
         return asdict(self)
 
 
-@dataclass
+@dataclass(frozen=True)
 class TypingSpeedConfig:
     """Typing speed configuration for human-like behavior"""
     char_min: float = 0.05  # Minimum delay between characters (seconds)
@@ -42,8 +44,17 @@ class TypingSpeedConfig:
         if self.space_min > self.space_max:
             raise ValueError('space_min must be <= space_max')
 
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for backward compatibility."""
+        return {
+            'char_min': self.char_min,
+            'char_max': self.char_max,
+            'space_min': self.space_min,
+            'space_max': self.space_max,
+        }
+
 
-@dataclass
+@dataclass(frozen=True)
 class DelayConfig:
     """Configuration for human-like delay patterns.
 
@@ -97,21 +108,23 @@ class DelayConfig:
         }
 
 
-@dataclass
+@dataclass(frozen=True)
 class HumanBehaviorConfig:
     """Human-like behavior settings"""
     typing_speed: TypingSpeedConfig = field(default_factory=TypingSpeedConfig)
     delays: DelayConfig = field(default_factory=DelayConfig)
+    typing_chunked: bool = False    # Send 3-8 character bursts instead of single keys
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for backward compatibility"""
         return {
-            'typing_speed': asdict(self.typing_speed),
-            'delays': asdict(self.delays),
+            'typing_speed': self.typing_speed.to_dict(),
+            'delays': self.delays.to_dict(),
+            'typing_chunked': self.typing_chunked,
         }
 
 
-@dataclass
+@dataclass(frozen=True)
 class TimeoutConfig:
     """Timeout configuration with validation"""
     page_load: float = 10           # Page load timeout (seconds)
@@ -132,7 +145,7 @@ class TimeoutConfig:
         return asdict(self)
 
 
-@dataclass
+@dataclass(frozen=True)
 class StabilityConfig:
     """Content stability detection configuration"""
     check_interval: float = 0.5     # How often to check for stability (seconds)
@@ -153,6 +166,15 @@ class StabilityConfig:
         return asdict(self)
 
 
+def _freeze(value: Any) -> Any:
+    """Recursively convert dicts to read-only mappings and lists to tuples"""
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
 # Create instances for use throughout the application
 _browser_config = BrowserConfig()
 _human_behavior_config = HumanBehaviorConfig()
@@ -161,12 +183,15 @@ _stability_config = StabilityConfig()
 
 # Backward compatibility: expose as dictionaries
 BROWSER_CONFIG = _browser_config.to_dict()
-HUMAN_BEHAVIOR = _human_behavior_config.to_dict()
-TIMEOUTS = _timeout_config.to_dict()
+HUMAN_BEHAVIOR = _freeze(_human_behavior_config.to_dict())
+TIMEOUTS = _freeze(_timeout_config.to_dict())
 STABILITY_CONFIG = _stability_config.to_dict()
 
-# Element selectors
-SELECTORS = {
+# Typed views for hot paths: attribute access instead of nested dict lookups
+TYPING_SPEED = _human_behavior_config.typing_speed
+
+# Element selectors (read-only; selector lists are tuples)
+SELECTORS = _freeze({
     'search_input': [
         '[contenteditable="true"]',
         'textarea[placeholder*="Ask"]',
@@ -225,20 +250,66 @@ SELECTORS = {
             '/discover',          # Discover page links
         ]
     },
-}
+})
+
+
+def _build_exclude_filter(patterns: Tuple[str, ...]) -> Callable[[str], bool]:
+    """
+    Generate a URL exclusion check specialized to a fixed pattern list.
+
+    The patterns are inlined as a chain of lowercase substring tests, which
+    runs several times faster than a case-insensitive regex on short URLs.
+    Patterns are embedded with repr(), so any string is safe to include.
+
+    Returns:
+        Function returning True if the URL contains any pattern (case-insensitive)
+    """
+    expr = ' or '.join(f'{pattern.lower()!r} in url' for pattern in patterns) or 'False'
+    source = f'def is_excluded_url(url):\n    url = url.lower()\n    return {expr}\n'
+    namespace: Dict[str, Any] = {}
+    exec(compile(source, '<exclude_patterns>', 'exec'), {'__builtins__': {}}, namespace)
+    return namespace['is_excluded_url']
+
+
+# Source URLs containing any exclude pattern are skipped
+IS_EXCLUDED_URL = _build_exclude_filter(SELECTORS['sources']['exclude_patterns'])
+
+# Each top-level selector list joined into one selector group, so a single
+# querySelector call can replace a loop of per-selector lookups
+SELECTORS_UNION = MappingProxyType({
+    key: ', '.join(value) for key, value in SELECTORS.items() if isinstance(value, tuple)
+})
 
 # Text extraction markers
-EXTRACTION_MARKERS = {
+EXTRACTION_MARKERS = _freeze({
     'start': ['1 step completed', 'answer images', 'images '],
     'end': ['ask a follow-up', 'ask follow-up'],
     'ui_elements': ['Home Discover', 'Spaces Finance', 'Upgrade Install', 'Answer Images'],
     'skip_patterns': ['Home', 'Discover', 'Spaces', 'Finance', 'Install',
                       'Upgrade', 'Account', 'Ask a follow-up', 'Thinking...'],
-}
+})
+
+# Skip patterns compiled into one alternation so each line is scanned in a
+# single pass (case-sensitive, matching the plain substring checks it replaces)
+SKIP_PATTERNS_RE = re.compile('|'.join(map(re.escape, EXTRACTION_MARKERS['skip_patterns'])))
+
+# Answer start/end markers, matched case-insensitively in place so the page
+# text needs no lowercased copy. Start markers get one pattern each, kept in
+# priority order: they can overlap ('answer images ' contains 'images '), so a
+# single alternation scan would miss the later ones.
+START_MARKER_PATTERNS = tuple(
+    re.compile(re.escape(marker), re.IGNORECASE) for marker in EXTRACTION_MARKERS['start']
+)
+END_MARKERS_RE = re.compile(
+    '|'.join(map(re.escape, EXTRACTION_MARKERS['end'])), re.IGNORECASE
+)
+
+# UI labels stripped from marker-extracted answers, removed in one pass
+UI_ELEMENTS_RE = re.compile('|'.join(map(re.escape, EXTRACTION_MARKERS['ui_elements'])))
 
 # Source extraction configuration
 # Controls how sources are extracted, validated, and deduplicated from search results
-SOURCES_CONFIG = {
+SOURCES_CONFIG = _freeze({
     'max_sources': 20,              # Increased from hard-coded 10
     'min_text_length': 3,           # Minimum text length for valid source
     'deduplicate': True,            # Remove duplicate URLs
@@ -246,7 +317,7 @@ SOURCES_CONFIG = {
     'extract_metadata': True,       # Extract additional metadata (title, snippet)
     'validate_external_only': True, # Only include external sources (not perplexity.ai)
     'tier_fallback_threshold': 3,   # Min sources before trying next tier
-}
+})
 
 # Required cookies for authentication
 REQUIRED_COOKIES = [
@@ -254,6 +325,9 @@ REQUIRED_COOKIES = [
     '__Secure-next-auth.session-token',
 ]
 
+# Set form for per-cookie membership checks; the list keeps display order
+REQUIRED_COOKIES_SET = frozenset(REQUIRED_COOKIES)
+
 # Cookie defaults
 COOKIE_DEFAULTS = {
     'domain': '.perplexity.ai',
@@ -299,22 +373,22 @@ PROMPTS_FILE_CONFIG = {
 }
 
 # User agent strings for randomization
-USER_AGENTS = [
+USER_AGENTS = (
     'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
     'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/119.0.0.0 Safari/537.36',
     'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
     'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/119.0.0.0 Safari/537.36',
     'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-]
+)
 
 # Viewport sizes for randomization
-VIEWPORT_SIZES = [
+VIEWPORT_SIZES = (
     {'width': 1920, 'height': 1080},
     {'width': 1366, 'height': 768},
     {'width': 1536, 'height': 864},
     {'width': 1440, 'height': 900},
     {'width': 1280, 'height': 720},
-]
+)
 
 # Model selection configuration
 # Discovered via UI inspection: Model selector is a button with circuit icon
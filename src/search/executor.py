@@ -7,14 +7,14 @@ This module handles:
 - Content stability detection using hash-based monitoring
 """
 import asyncio
-import hashlib
+import json
 import logging
 from time import time
-from typing import Optional
+from typing import Any, Dict, Optional, Sequence, Tuple
 import nodriver as uc
 
 from src.config import SELECTORS, TIMEOUTS, STABILITY_CONFIG
-from src.browser.interactions import find_interactive_element, human_delay, type_like_human
+from src.browser.interactions import find_interactive_element, human_delay, matched_selector, type_like_human
 from src.browser.smart_click import SmartClicker, ClickStrategy
 from src.types import NodriverPage
 
@@ -24,6 +24,149 @@ logger = logging.getLogger(__name__)
 # Quick element check timeout - fail fast if element not immediately visible
 VERIFICATION_ELEMENT_TIMEOUT = 0.5
 
+# CSS probes are unioned so each check is one DOM query; text probes stay separate
+_LOADING_CSS_UNION = '[data-testid*="loading"], [class*="loading"], [class*="spinner"]'
+_LOADING_TEXTS = ('text:Searching', 'text:Thinking')
+_RESULT_CSS_UNION = '[data-testid*="answer"], [data-testid*="result"], [class*="answer"]'
+_RESULT_TEXTS = ('text:1 step', 'text:completed')
+
+# Budget for re-probing a cached selector; a stale entry should cost little
+# before the full lookup gets the caller's timeout
+_CACHED_SELECTOR_TIMEOUT = 0.2
+
+# Page attribute holding (page URL without query, {selector group: (selector, element)}),
+# the selector that last matched and its handle (None once the handle went stale).
+# Stored on the page like the SmartClicker cache and reset when the URL changes,
+# so entries neither outlive their tab nor pile up across /search/<id> URLs.
+_ELEMENT_CACHE_ATTR = '_element_cache'
+
+# True if a cached handle still points at a live, visible node
+_JS_STILL_USABLE = (
+    '(el) => { if (!el.isConnected) return false;'
+    ' const style = window.getComputedStyle(el);'
+    ' return style.display !== "none" && style.visibility !== "hidden"; }'
+)
+
+# 1-based index of the first selector, in list order, whose first match is
+# visible; 0 if none. Any-of selectors return the first match in document
+# order, which can be a lower-priority control earlier on the page. 1-based
+# because falsy evaluate results don't come back as plain values.
+_JS_FIRST_VISIBLE = (
+    '(() => {{ const index = {selectors}.findIndex((s) => {{'
+    ' const el = document.querySelector(s); if (!el) return false;'
+    ' const style = window.getComputedStyle(el);'
+    ' return style.display !== "none" && style.visibility !== "hidden"; }});'
+    ' return index + 1; }})()'
+)
+
+# Attach a MutationObserver to <main> that records its text length and the
+# time of the last change, so stability polls transfer two numbers instead
+# of the whole answer text. Re-attaches if <main> has been replaced.
+_JS_WATCH_MAIN = (
+    '(() => { const main = document.querySelector("main");'
+    ' if (!main) return false;'
+    ' const prev = window.__geoStability;'
+    ' if (prev && prev.node === main) return true;'
+    ' if (prev) prev.observer.disconnect();'
+    ' const state = {node: main, len: main.textContent.length, last: performance.now()};'
+    ' state.observer = new MutationObserver(() => {'
+    ' state.len = main.textContent.length; state.last = performance.now(); });'
+    ' state.observer.observe(main, {subtree: true, childList: true, characterData: true});'
+    ' window.__geoStability = state; return true; })()'
+)
+
+# [ms since <main> last changed, text length], or null if no live observer
+_JS_STABILITY_STATE = (
+    '(() => { const s = window.__geoStability;'
+    ' return s && s.node.isConnected ? [performance.now() - s.last, s.len] : null; })()'
+)
+
+
+def _page_key(page: NodriverPage) -> str:
+    """Cache key for a page: its URL without the query string."""
+    return (getattr(page, 'url', None) or '').split('?', 1)[0]
+
+
+def _page_elements(page: NodriverPage, url: str) -> Dict[str, Tuple[str, Any]]:
+    """Selectors and handles cached on a page for its current URL; reset when the URL changes."""
+    cache = getattr(page, '__dict__', {}).get(_ELEMENT_CACHE_ATTR)
+    if cache is None or cache[0] != url:
+        cache = (url, {})
+        try:
+            setattr(page, _ELEMENT_CACHE_ATTR, cache)
+        except (AttributeError, TypeError):
+            pass
+    return cache[1]
+
+
+async def _first_visible_index(page: NodriverPage, selectors: Sequence[str]) -> Optional[int]:
+    """Index of the highest-priority selector with a visible match, in one round-trip."""
+    try:
+        index = await page.evaluate(_JS_FIRST_VISIBLE.format(selectors=json.dumps(list(selectors))))
+    except Exception as e:
+        logger.debug(f'Could not rank selectors: {type(e).__name__}: {e}')
+        return None
+    if type(index) is int and 1 <= index <= len(selectors):
+        return index - 1
+    return None
+
+
+async def _find_cached(
+    page: NodriverPage,
+    group: str,
+    selectors: Sequence[str],
+    timeout: float,
+) -> Tuple[Any, Optional[str]]:
+    """
+    Find an interactive element, trying the selector that last matched first.
+
+    Otherwise one in-page script picks the first selector in list order that
+    has a visible match, so priority order holds; if nothing is rendered yet,
+    a single any-of wait means a miss costs one timeout, not one per selector. The matched
+    selector and its handle are kept on the page for its current URL; the
+    handle is reused while its node is still attached and visible, so
+    repeated searches on the same page skip the DOM query entirely. A
+    re-render falls back to the selector, navigation drops both.
+
+    Returns:
+        (element, selector) on a hit, (None, None) otherwise
+    """
+    elements = _page_elements(page, _page_key(page))
+    cached, element = elements.get(group, (None, None))
+    if element is not None:
+        try:
+            if await element.apply(_JS_STILL_USABLE) is True:
+                return element, cached
+        except Exception as e:
+            logger.debug(f'Cached {group} handle unusable: {type(e).__name__}: {e}')
+
+    if cached is not None:
+        element = await find_interactive_element(page, [cached], timeout=_CACHED_SELECTOR_TIMEOUT)
+        if element:
+            elements[group] = (cached, element)
+            return element, cached
+        del elements[group]
+
+    # Rank the selectors in page; if none is rendered yet, wait once for any
+    # of them (one timeout, not one per selector) and rank again
+    index = await _first_visible_index(page, selectors)
+    if index is None:
+        element = await find_interactive_element(page, [', '.join(selectors)], timeout=timeout)
+        if not element:
+            return None, None
+        index = await _first_visible_index(page, selectors)
+        if index is None:
+            selector = await matched_selector(element, selectors)
+            elements[group] = (selector, element)
+            return element, selector
+
+    selector = selectors[index]
+    element = await find_interactive_element(page, [selector], timeout=timeout)
+    if not element:
+        return None, None
+    elements[group] = (selector, element)
+    return element, selector
+
 
 async def perform_search(page: NodriverPage, query: str) -> None:
     """
@@ -38,8 +181,9 @@ async def perform_search(page: NodriverPage, query: str) -> None:
     """
     try:
         # Find search input using helper function
-        search_input = await find_interactive_element(
+        search_input, input_selector = await _find_cached(
             page,
+            'search_input',
             SELECTORS['search_input'],
             timeout=TIMEOUTS['element_select']
         )
@@ -47,15 +191,16 @@ async def perform_search(page: NodriverPage, query: str) -> None:
         if not search_input:
             raise Exception('Could not find search input element')
 
-        logger.info('Found search input')
+        logger.info(f'Found search input: {input_selector}')
 
         # Use SmartClicker to click and focus the input
         clicker = SmartClicker(page, verify_click=False, human_like_delay=True)
 
-        # Try to click search input with smart strategies
+        # Try to click the element we just found with smart strategies
         click_result = await clicker.click(
-            SELECTORS['search_input'][0],  # Use first selector
-            timeout=5.0
+            input_selector,
+            timeout=5.0,
+            element=search_input
         )
 
         if not click_result.success:
@@ -136,8 +281,9 @@ async def perform_search(page: NodriverPage, query: str) -> None:
         # Method 3: Fallback - use SmartClicker for search button if Enter didn't work
         try:
             # Try to find search button
-            search_button = await find_interactive_element(
+            search_button, button_selector = await _find_cached(
                 page,
+                'search_button',
                 SELECTORS['search_button'],
                 timeout=2
             )
@@ -145,8 +291,9 @@ async def perform_search(page: NodriverPage, query: str) -> None:
             if search_button:
                 logger.debug('Found search button, using SmartClicker as fallback')
                 button_result = await clicker.click(
-                    SELECTORS['search_button'][0],
-                    timeout=3.0
+                    button_selector,
+                    timeout=3.0,
+                    element=search_button
                 )
 
                 if button_result.success:
@@ -176,6 +323,32 @@ async def perform_search(page: NodriverPage, query: str) -> None:
         raise Exception(f'Failed to perform search: {str(error)}')
 
 
+async def _probe_indicator(
+    page: NodriverPage,
+    css_union: str,
+    texts: Tuple[str, ...]
+) -> Optional[str]:
+    """
+    Return a label for the first indicator present, or None.
+
+    The CSS alternatives are checked with a single union select; text
+    probes have no CSS equivalent and are looked up one by one.
+    """
+    try:
+        if await page.select(css_union, timeout=VERIFICATION_ELEMENT_TIMEOUT):
+            return css_union
+    except Exception:
+        pass
+
+    for text in texts:
+        try:
+            if await page.find(text, timeout=VERIFICATION_ELEMENT_TIMEOUT):
+                return text
+        except Exception:
+            continue
+    return None
+
+
 async def verify_search_submitted(
     page: NodriverPage,
     original_url: str,
@@ -212,42 +385,16 @@ async def verify_search_submitted(
             indicators_found.append('URL changed')
 
         # Check 2: Loading indicators
-        loading_selectors = [
-            '[data-testid*="loading"]',
-            '[class*="loading"]',
-            '[class*="spinner"]',
-            'text:Searching',
-            'text:Thinking',
-        ]
-
-        for selector in loading_selectors:
-            try:
-                element = await page.find(selector, timeout=VERIFICATION_ELEMENT_TIMEOUT)
-                if element:
-                    logger.debug(f"Found loading indicator: {selector}")
-                    indicators_found.append(f'Loading indicator ({selector})')
-                    break
-            except Exception:
-                continue
+        indicator = await _probe_indicator(page, _LOADING_CSS_UNION, _LOADING_TEXTS)
+        if indicator:
+            logger.debug(f"Found loading indicator: {indicator}")
+            indicators_found.append(f'Loading indicator ({indicator})')
 
         # Check 3: Result generation UI
-        result_selectors = [
-            '[data-testid*="answer"]',
-            '[data-testid*="result"]',
-            '[class*="answer"]',
-            'text:1 step',
-            'text:completed',
-        ]
-
-        for selector in result_selectors:
-            try:
-                element = await page.find(selector, timeout=VERIFICATION_ELEMENT_TIMEOUT)
-                if element:
-                    logger.debug(f"Found result generation UI: {selector}")
-                    indicators_found.append(f'Result UI ({selector})')
-                    break
-            except Exception:
-                continue
+        indicator = await _probe_indicator(page, _RESULT_CSS_UNION, _RESULT_TEXTS)
+        if indicator:
+            logger.debug(f"Found result generation UI: {indicator}")
+            indicators_found.append(f'Result UI ({indicator})')
 
         # If we found any indicators, search has started
         if indicators_found:
@@ -262,12 +409,12 @@ async def verify_search_submitted(
 
 async def wait_for_content_stability(page: NodriverPage, max_wait: Optional[int] = None) -> bool:
     """
-    Wait for answer content to stabilize using multiple indicators
+    Wait for answer content to stabilize using a DOM mutation observer
 
-    This function monitors the main content area for stability using:
-    - Hash-based change detection (MD5)
-    - Content length tracking
-    - Configurable stability threshold
+    A MutationObserver on the main content area records its text length and
+    when it last changed; each poll reads back only those two numbers.
+    Content counts as stable once it meets the minimum length and has not
+    changed for check_interval * stable_threshold seconds.
 
     Args:
         page: Nodriver page object
@@ -285,46 +432,24 @@ async def wait_for_content_stability(page: NodriverPage, max_wait: Optional[int]
     stable_threshold = STABILITY_CONFIG['stable_threshold']
     min_content_length = STABILITY_CONFIG['min_content_length']
 
-    stable_count = 0
-    last_length = 0
-    last_hash = ""
+    # Same quiet period the old fixed-interval polling required
+    quiet_needed_ms = check_interval * stable_threshold * 1000
 
-    start_time = asyncio.get_event_loop().time()
+    loop = asyncio.get_running_loop()
+    start_time = loop.time()
 
-    while (asyncio.get_event_loop().time() - start_time) < max_wait:
+    while (loop.time() - start_time) < max_wait:
         try:
-            # Get main content
-            main_content = await page.select('main', timeout=2)
-            if not main_content:
-                await asyncio.sleep(check_interval)
-                continue
-
-            # Use text_all to get full content (no await!)
-            current_text = main_content.text_all
-            current_length = len(current_text) if current_text else 0
-
-            # Use hash for better change detection (catches small edits)
-            current_hash = hashlib.md5(current_text.encode()).hexdigest() if current_text else ""
-
-            # Check if content meets minimum threshold and has stabilized
-            if current_length >= min_content_length:
-                # Content is substantial, check if stable
-                if current_hash == last_hash and current_length == last_length:
-                    stable_count += 1
-                    if stable_count >= stable_threshold:
-                        logger.info(f'Answer generation complete (content stable at {current_length} chars)')
-                        return True
-                else:
-                    # Content changed, reset counter
-                    stable_count = 0
-                    last_hash = current_hash
-                    last_length = current_length
-                    logger.debug(f'Content changing: {current_length} chars')
+            state = await page.evaluate(_JS_STABILITY_STATE, return_by_value=True)
+            if not isinstance(state, list):
+                # No observer yet, or <main> was replaced: (re)attach one
+                await page.evaluate(_JS_WATCH_MAIN, return_by_value=True)
             else:
-                # Not enough content yet
-                stable_count = 0
-                last_hash = current_hash
-                last_length = current_length
+                quiet_ms, current_length = state
+                if current_length >= min_content_length and quiet_ms >= quiet_needed_ms:
+                    logger.info(f'Answer generation complete (content stable at {current_length} chars)')
+                    return True
+                logger.debug(f'Content changing: {current_length} chars')
 
         except Exception as e:
             logger.debug(f'Stability check error: {e}')
@@ -5,22 +5,29 @@ This module handles extracting search results from the page using multiple
 fallback strategies to ensure reliability even when UI structure changes.
 """
 import asyncio
+import json
 import logging
 import re
 import time
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Set, Tuple
+from typing import Dict, List, Optional, Sequence, Set, Tuple
 from urllib.parse import urlparse
 
 from src.config import (
+    IS_EXCLUDED_URL,
     EXTRACTION_MARKERS,
+    END_MARKERS_RE,
+    START_MARKER_PATTERNS,
+    SKIP_PATTERNS_RE,
+    UI_ELEMENTS_RE,
     SELECTORS,
+    SELECTORS_UNION,
     SOURCES_CONFIG,
     TIMEOUTS,
     SCREENSHOT_CONFIG,
     STABILITY_CONFIG
 )
-from src.browser.interactions import human_delay
+from src.browser.interactions import human_delay, matched_selector
 from src.browser.element_waiter import ElementWaiter
 from src.browser.smart_click import SmartClicker
 from src.types import NodriverPage
@@ -37,6 +44,63 @@ _ERROR_PATTERNS = [
 # Maximum text size to check for patterns (prevent ReDoS)
 _MAX_TEXT_CHECK_SIZE = 10000  # Only check first 10K characters
 
+# In-page answer completion wait: polls <main> in the browser and resolves
+# 'followup' once the follow-up prompt appears, 'stable' once the text has
+# grown past its length when the wait began and then stopped changing for the
+# configured number of checks, or 'timeout'. Requiring growth keeps the static
+# "Searching/Thinking" phase before streaming from counting as a finished
+# answer; the follow-up prompt remains the primary signal.
+# One CDP round-trip replaces a Python-side poll per check.
+_ANSWER_COMPLETE_JS = """
+(() => new Promise((resolve) => {
+    const marker = %s;
+    const intervalMs = %d;
+    const needed = %d;
+    const minLength = %d;
+    const deadline = Date.now() + %d;
+    const mainText = () => {
+        const main = document.querySelector('main');
+        return main ? (main.textContent || '') : '';
+    };
+    const startLength = mainText().length;
+    let last = null;
+    let stable = 0;
+    const check = () => {
+        const text = mainText();
+        if (text.toLowerCase().includes(marker)) { resolve('followup'); return; }
+        if (text.length > startLength && text.length >= minLength && text === last) {
+            if (++stable >= needed) { resolve('stable'); return; }
+        } else {
+            stable = 0;
+            last = text;
+        }
+        if (Date.now() >= deadline) { resolve('timeout'); return; }
+        setTimeout(check, intervalMs);
+    };
+    check();
+}))()
+"""
+
+# Collects [href attribute, text] pairs for every element matching each tier
+# selector, all tiers in one round-trip. Text nodes are joined with single
+# spaces to match nodriver's Element.text_all, so results are the same as
+# reading each select_all() hit.
+_SOURCE_LINKS_JS = """
+%s.map((selector) => Array.from(document.querySelectorAll(selector)).map((el) => {
+    const walker = document.createTreeWalker(el, NodeFilter.SHOW_TEXT);
+    const parts = [];
+    while (walker.nextNode()) parts.push(walker.currentNode.nodeValue);
+    return [el.getAttribute('href'), parts.join(' ')];
+}))
+"""
+
+# (label, SELECTORS['sources'] key) in fallback order
+_SOURCE_TIERS = (
+    ('Tier 1', 'tier1_primary'),
+    ('Tier 2', 'tier2_citations'),
+    ('Tier 3', 'tier3_references'),
+)
+
 
 __all__ = [
     'extract_search_results',
@@ -153,17 +217,20 @@ def _extract_domain(url: str) -> str:
         return ''
 
 
-def _is_excluded_url(url: str, exclude_patterns: List[str]) -> bool:
+def _is_excluded_url(url: str, exclude_patterns: Optional[List[str]] = None) -> bool:
     """
     Check if URL should be excluded based on patterns.
 
     Args:
         url: URL to check
-        exclude_patterns: List of patterns to exclude
+        exclude_patterns: List of patterns to exclude (defaults to the
+            configured patterns, checked with the generated IS_EXCLUDED_URL)
 
     Returns:
         True if URL should be excluded, False otherwise
     """
+    if exclude_patterns is None:
+        return IS_EXCLUDED_URL(url)
     url_lower = url.lower()
     for pattern in exclude_patterns:
         if pattern.lower() in url_lower:
@@ -432,6 +499,55 @@ async def collapse_sources_if_expanded(page: NodriverPage) -> bool:
         return False
 
 
+async def _source_links(
+    page: NodriverPage,
+    selectors: Sequence[str],
+) -> Optional[List[List[Tuple[Optional[str], str]]]]:
+    """
+    Read (href, text) for every element matching each source tier selector.
+
+    Runs every tier's query and text collection in the page, so all tiers
+    come back in one CDP round-trip without transferring the DOM tree that
+    select_all() needs to build Element handles.
+
+    Args:
+        page: Nodriver page object
+        selectors: CSS selector for each source tier, in fallback order
+
+    Returns:
+        One list of (href attribute or None, concatenated text) tuples per
+        tier, or None if the in-page evaluation failed
+    """
+    try:
+        tiers = await page.evaluate(_SOURCE_LINKS_JS % json.dumps(list(selectors)), return_by_value=True)
+        if isinstance(tiers, list) and len(tiers) == len(selectors):
+            return [[(href, text) for href, text in links] for links in tiers]
+        logger.debug(f'In-page source query returned {type(tiers).__name__}, using select_all')
+    except Exception as e:
+        logger.debug(f'In-page source query failed ({type(e).__name__}: {e}), using select_all')
+    return None
+
+
+async def _select_all_links(page: NodriverPage, selector: str) -> List[Tuple[Optional[str], str]]:
+    """
+    Read (href, text) pairs for one tier through select_all() Element handles.
+
+    Fallback for when _source_links() cannot evaluate in the page.
+    """
+    try:
+        elements = await page.select_all(selector)
+    except Exception as e:
+        logger.debug(f'select_all failed for {selector}: {e}')
+        return []
+    return [
+        (
+            el.attrs.get('href') if hasattr(el, 'attrs') else None,
+            el.text_all if hasattr(el, 'text_all') else '',
+        )
+        for el in elements
+    ]
+
+
 async def _extract_sources(page: NodriverPage) -> List[Dict[str, str]]:
     """
     Extract sources from the page using multi-tier fallback strategy.
@@ -467,218 +583,156 @@ async def _extract_sources(page: NodriverPage) -> List[Dict[str, str]]:
     min_text_length = SOURCES_CONFIG.get('min_text_length', 3)
     deduplicate = SOURCES_CONFIG.get('deduplicate', True)
     validate_external = SOURCES_CONFIG.get('validate_external_only', True)
-    exclude_patterns = SELECTORS['sources'].get('exclude_patterns', [])
     tier_threshold = max(1, int(SOURCES_CONFIG.get('tier_fallback_threshold', 3)))
 
     # NEW: Expand collapsed sources before extraction
     await _expand_sources_if_collapsed(page)
 
     try:
-        # Tier 1: Primary source elements (most reliable)
-        tier1_selector = SELECTORS['sources']['tier1_primary']
-        logger.debug(f'Trying Tier 1: {tier1_selector}')
+        tier_selectors = [SELECTORS['sources'][key] for _, key in _SOURCE_TIERS]
+        tier_links = await _source_links(page, tier_selectors)
 
-        try:
-            tier1_elements = await page.select_all(tier1_selector)
-            logger.debug(f'Tier 1 found {len(tier1_elements)} potential sources')
+        for index, (tier, _) in enumerate(_SOURCE_TIERS):
+            # Later tiers are only used while earlier ones yielded too few sources
+            if index > 0 and len(sources) >= tier_threshold:
+                break
 
-            for el in tier1_elements:
+            if tier_links is not None:
+                links = tier_links[index]
+            else:
+                links = await _select_all_links(page, tier_selectors[index])
+            logger.debug(f'{tier} ({tier_selectors[index]}) found {len(links)} potential sources')
+            tier_start = len(sources)
+
+            for href, text in links:
                 if len(sources) >= max_sources:
                     break
 
-                try:
-                    # Extract URL
-                    href = el.attrs.get('href') if hasattr(el, 'attrs') else None
-                    if not href:
-                        continue
-
-                    # Validate external URL if required
-                    if validate_external and not href.startswith(('http://', 'https://')):
-                        logger.debug(f'Skipping non-external URL: {href}')
-                        continue
-
-                    # Check exclusion patterns
-                    if _is_excluded_url(href, exclude_patterns):
-                        logger.debug(f'Skipping excluded URL: {href}')
-                        continue
-
-                    # Deduplicate if enabled
-                    if deduplicate and href in seen_urls:
-                        logger.debug(f'Skipping duplicate URL: {href}')
-                        continue
-
-                    # Extract text (text_all is a property, not async)
-                    text = el.text_all if hasattr(el, 'text_all') else ''
-                    text = text.strip() if text else ''
-
-                    # Validate text length
-                    if len(text) < min_text_length:
-                        logger.debug(f'Skipping source with short text ({len(text)} chars): {href}')
-                        continue
-
-                    # Extract domain
-                    domain = _extract_domain(href)
-
-                    # Increment citation number
-                    citation_number += 1
-
-                    # Create source entry with rich metadata
-                    source = {
-                        'url': href,
-                        'text': text,
-                        'domain': domain,
-                        'citation_number': citation_number,
-                        'title': text,  # Title defaults to text for now
-                        'snippet': ''   # Snippet is optional, future enhancement
-                    }
-
-                    sources.append(source)
-                    seen_urls.add(href)
-                    logger.debug(f'Added source #{citation_number}: {domain} - {text[:50]}...')
-
-                except Exception as e:
-                    logger.debug(f'Error extracting individual source: {e}')
+                # Extract URL
+                if not href:
                     continue
 
-        except Exception as e:
-            logger.debug(f'Tier 1 extraction failed: {e}')
-
-        # Track Tier 1 results
-        tier_counts['Tier 1'] = len(sources)
-        logger.debug(f'Tier 1 extracted {tier_counts["Tier 1"]} sources')
-
-        # Tier 2: Citations/footer links (if we need more sources)
-        if len(sources) < tier_threshold:
-            tier2_selector = SELECTORS['sources']['tier2_citations']
-            logger.debug(f'Tier 1 yielded {len(sources)} sources, trying Tier 2: {tier2_selector}')
-
-            try:
-                tier2_elements = await page.select_all(tier2_selector)
-                logger.debug(f'Tier 2 found {len(tier2_elements)} potential sources')
-
-                for el in tier2_elements:
-                    if len(sources) >= max_sources:
-                        break
-
-                    try:
-                        href = el.attrs.get('href') if hasattr(el, 'attrs') else None
-                        if not href:
-                            continue
-
-                        if validate_external and not href.startswith(('http://', 'https://')):
-                            continue
-
-                        if _is_excluded_url(href, exclude_patterns):
-                            continue
-
-                        if deduplicate and href in seen_urls:
-                            continue
+                # Validate external URL if required
+                if validate_external and not href.startswith(('http://', 'https://')):
+                    logger.debug(f'Skipping non-external URL: {href}')
+                    continue
 
-                        text = el.text_all if hasattr(el, 'text_all') else ''
-                        text = text.strip() if text else ''
+                # Check exclusion patterns
+                if _is_excluded_url(href):
+                    logger.debug(f'Skipping excluded URL: {href}')
+                    continue
 
-                        if len(text) < min_text_length:
-                            continue
+                # Deduplicate if enabled
+                if deduplicate and href in seen_urls:
+                    logger.debug(f'Skipping duplicate URL: {href}')
+                    continue
 
-                        domain = _extract_domain(href)
-                        citation_number += 1
+                # Clean and validate text length
+                text = text.strip() if text else ''
+                if len(text) < min_text_length:
+                    logger.debug(f'Skipping source with short text ({len(text)} chars): {href}')
+                    continue
 
-                        source = {
-                            'url': href,
-                            'text': text,
-                            'domain': domain,
-                            'citation_number': citation_number,
-                            'title': text,
-                            'snippet': ''
-                        }
+                # Extract domain
+                domain = _extract_domain(href)
 
-                        sources.append(source)
-                        seen_urls.add(href)
-                        logger.debug(f'Added source #{citation_number} (Tier 2): {domain} - {text[:50]}...')
+                # Increment citation number
+                citation_number += 1
 
-                    except Exception as e:
-                        logger.debug(f'Error extracting Tier 2 source: {e}')
-                        continue
+                # Create source entry with rich metadata
+                source = {
+                    'url': href,
+                    'text': text,
+                    'domain': domain,
+                    'citation_number': citation_number,
+                    'title': text,  # Title defaults to text for now
+                    'snippet': ''   # Snippet is optional, future enhancement
+                }
 
-            except Exception as e:
-                logger.debug(f'Tier 2 extraction failed: {e}')
+                sources.append(source)
+                seen_urls.add(href)
+                logger.debug(f'Added source #{citation_number} ({tier}): {domain} - {text[:50]}...')
 
-        # Track Tier 2 results
-        tier_counts['Tier 2'] = len(sources) - tier_counts['Tier 1']
-        logger.debug(f'Tier 2 extracted {tier_counts["Tier 2"]} additional sources (total: {len(sources)})')
+            # Track per-tier results
+            tier_counts[tier] = len(sources) - tier_start
+            logger.debug(f'{tier} extracted {tier_counts[tier]} sources (total: {len(sources)})')
 
-        # Tier 3: Main content links (last resort)
-        if len(sources) < tier_threshold:
-            tier3_selector = SELECTORS['sources']['tier3_references']
-            logger.debug(f'Tier 2 yielded {len(sources)} sources, trying Tier 3: {tier3_selector}')
-
-            try:
-                tier3_elements = await page.select_all(tier3_selector)
-                logger.debug(f'Tier 3 found {len(tier3_elements)} potential sources')
-
-                for el in tier3_elements:
-                    if len(sources) >= max_sources:
-                        break
+        # Log final results with detailed tier breakdown
+        if sources:
+            tier_breakdown = ', '.join([f'{tier}: {count}' for tier, count in tier_counts.items() if count > 0])
+            logger.info(f'Successfully extracted {len(sources)} sources ({tier_breakdown})')
+        else:
+            logger.warning('No sources found after trying all extraction tiers')
 
-                    try:
-                        href = el.attrs.get('href') if hasattr(el, 'attrs') else None
-                        if not href:
-                            continue
+        return sources
 
-                        if validate_external and not href.startswith(('http://', 'https://')):
-                            continue
+    except Exception as e:
+        logger.error(f'Source extraction completely failed: {e}')
+        return []
 
-                        if _is_excluded_url(href, exclude_patterns):
-                            continue
 
-                        if deduplicate and href in seen_urls:
-                            continue
+def _find_answer_span(full_text: str) -> Tuple[int, int]:
+    """
+    Locate the answer between the configured start and end markers.
 
-                        text = el.text_all if hasattr(el, 'text_all') else ''
-                        text = text.strip() if text else ''
+    Start markers are tried in configured priority order, using each
+    marker's first occurrence (ignored if it is at position 0). The answer
+    ends at the earliest end marker after the start. Matching is
+    case-insensitive on the original text; each start marker is searched
+    separately since markers can overlap.
 
-                        if len(text) < min_text_length:
-                            continue
+    Args:
+        full_text: Page text to search
 
-                        domain = _extract_domain(href)
-                        citation_number += 1
+    Returns:
+        (start_idx, end_idx); start_idx is -1 if no start marker was found
+    """
+    start_idx = -1
+    for marker, pattern in zip(EXTRACTION_MARKERS['start'], START_MARKER_PATTERNS):
+        match = pattern.search(full_text)
+        if match and match.start() > 0:
+            start_idx = match.end()
+            logger.debug(f'Found start marker: {marker}')
+            break
 
-                        source = {
-                            'url': href,
-                            'text': text,
-                            'domain': domain,
-                            'citation_number': citation_number,
-                            'title': text,
-                            'snippet': ''
-                        }
+    end_idx = len(full_text)
+    end_match = END_MARKERS_RE.search(full_text, max(start_idx, 0))
+    if end_match and end_match.start() > 0:
+        end_idx = end_match.start()
+        logger.debug(f'Found end marker: {end_match.group()}')
 
-                        sources.append(source)
-                        seen_urls.add(href)
-                        logger.debug(f'Added source #{citation_number} (Tier 3): {domain} - {text[:50]}...')
+    return start_idx, end_idx
 
-                    except Exception as e:
-                        logger.debug(f'Error extracting Tier 3 source: {e}')
-                        continue
 
-            except Exception as e:
-                logger.debug(f'Tier 3 extraction failed: {e}')
-
-        # Track Tier 3 results
-        tier_counts['Tier 3'] = len(sources) - tier_counts['Tier 1'] - tier_counts['Tier 2']
-        logger.debug(f'Tier 3 extracted {tier_counts["Tier 3"]} additional sources (total: {len(sources)})')
-
-        # Log final results with detailed tier breakdown
-        if sources:
-            tier_breakdown = ', '.join([f'{tier}: {count}' for tier, count in tier_counts.items() if count > 0])
-            logger.info(f'Successfully extracted {len(sources)} sources ({tier_breakdown})')
-        else:
-            logger.warning('No sources found after trying all extraction tiers')
+async def _wait_for_answer_in_page(page: NodriverPage, timeout: float) -> Optional[str]:
+    """
+    Wait for the answer to finish using a single in-page promise.
 
-        return sources
+    Args:
+        page: Nodriver page object
+        timeout: Maximum wait in seconds
 
+    Returns:
+        'followup', 'stable' or 'timeout', or None if the script could not run
+        (callers then fall back to ElementWaiter polling)
+    """
+    script = _ANSWER_COMPLETE_JS % (
+        json.dumps(EXTRACTION_MARKERS['end'][0].lower()),
+        int(STABILITY_CONFIG['check_interval'] * 1000),
+        STABILITY_CONFIG['stable_threshold'],
+        STABILITY_CONFIG['min_content_length'],
+        int(timeout * 1000),
+    )
+    try:
+        # Allow a little slack beyond the in-page deadline for the round-trip
+        result = await asyncio.wait_for(
+            page.evaluate(script, await_promise=True, return_by_value=True),
+            timeout=timeout + 5,
+        )
     except Exception as e:
-        logger.error(f'Source extraction completely failed: {e}')
-        return []
+        logger.debug(f'In-page answer wait unavailable: {e}')
+        return None
+    return result if result in ('followup', 'stable', 'timeout') else None
 
 
 async def extract_search_results(page: NodriverPage, screenshot_path: Optional[str]) -> ExtractionResult:
@@ -717,15 +771,14 @@ async def extract_search_results(page: NodriverPage, screenshot_path: Optional[s
                 logger.info('Search initiated (detected URL change)')
                 break
 
-            # Check for loading indicators from config
-            for selector in SELECTORS['loading_indicators']:
-                result = await waiter.wait_for_presence(selector, timeout=1)
-                if result.success:
-                    search_started = True
-                    logger.info(f'Search initiated (detected: {selector})')
-                    break
-
-            if search_started:
+            # Check for loading indicators from config (one any-of lookup)
+            result = await waiter.wait_for_presence(SELECTORS_UNION['loading_indicators'], timeout=1)
+            if result.success:
+                search_started = True
+                if logger.isEnabledFor(logging.DEBUG):
+                    selector = await matched_selector(result.element, SELECTORS['loading_indicators'])
+                    logger.debug(f'Loading indicator matched: {selector}')
+                logger.info('Search initiated (detected loading indicator)')
                 break
 
             await asyncio.sleep(0.5)
@@ -734,27 +787,37 @@ async def extract_search_results(page: NodriverPage, screenshot_path: Optional[s
             logger.warning('Could not confirm search started, proceeding anyway...')
 
         # Wait for "ask a follow-up" text to appear (indicates answer completion)
+        # or for the content to settle, whichever comes first
         logger.info('Waiting for answer completion...')
-        followup_result = await waiter.wait_for_text(
-            'main',
-            'ask a follow-up',
-            partial=True,
-            timeout=TIMEOUTS['content_stability']
-        )
-
-        if followup_result.success:
-            logger.info(f'Answer completed (detected follow-up prompt after {followup_result.wait_time:.2f}s)')
+        completion = await _wait_for_answer_in_page(page, TIMEOUTS['content_stability'])
+        if completion == 'followup':
+            logger.info('Answer completed (detected follow-up prompt)')
+        elif completion == 'stable':
+            logger.info('Answer completed (content stable)')
+        elif completion == 'timeout':
+            logger.warning('Content stability timeout, proceeding with current content')
         else:
-            # Fallback: Use stability detection
-            logger.info('Follow-up prompt not detected, using content stability detection...')
-            stability_result = await waiter.wait_for_stable(
+            # In-page wait unavailable: poll from Python instead
+            followup_result = await waiter.wait_for_text(
                 'main',
-                timeout=TIMEOUTS['content_stability'],
-                stable_threshold=STABILITY_CONFIG['stable_threshold'],
-                min_content_length=STABILITY_CONFIG['min_content_length']
+                'ask a follow-up',
+                partial=True,
+                timeout=TIMEOUTS['content_stability']
             )
-            if not stability_result.success:
-                logger.warning('Content stability timeout, proceeding with current content')
+
+            if followup_result.success:
+                logger.info(f'Answer completed (detected follow-up prompt after {followup_result.wait_time:.2f}s)')
+            else:
+                # Fallback: Use stability detection
+                logger.info('Follow-up prompt not detected, using content stability detection...')
+                stability_result = await waiter.wait_for_stable(
+                    'main',
+                    timeout=TIMEOUTS['content_stability'],
+                    stable_threshold=STABILITY_CONFIG['stable_threshold'],
+                    min_content_length=STABILITY_CONFIG['min_content_length']
+                )
+                if not stability_result.success:
+                    logger.warning('Content stability timeout, proceeding with current content')
 
         # Additional short wait to ensure rendering complete
         await human_delay('short')
@@ -769,6 +832,8 @@ async def extract_search_results(page: NodriverPage, screenshot_path: Optional[s
         # Extract the main answer/response using multiple strategies
         answer_text = ''
         strategy_used = None
+        # <main> text is fetched once and shared by strategies 1 and 2
+        full_text: Optional[str] = None
 
         # Strategy 1: Marker-based extraction (most accurate)
         try:
@@ -778,39 +843,19 @@ async def extract_search_results(page: NodriverPage, screenshot_path: Optional[s
             if main_element:
                 # Get all text content including children (text_all gets all descendants)
                 # NOTE: .text_all is a PROPERTY, not an async method - do NOT await it
-                full_text = main_element.text_all
-                logger.debug(f'Full main text length: {len(full_text) if full_text else 0}')
+                full_text = main_element.text_all or ''
+                logger.debug(f'Full main text length: {len(full_text)}')
 
                 if full_text:
                     # text_all concatenates with spaces, so we need a different approach
                     # Look for the answer portion between known markers
-                    text_lower = full_text.lower()
-
-                    # Find where answer starts
-                    start_idx = -1
-                    for marker in EXTRACTION_MARKERS['start']:
-                        idx = text_lower.find(marker.lower())
-                        if idx > 0:
-                            start_idx = idx + len(marker)
-                            logger.debug(f'Found start marker: {marker}')
-                            break
-
-                    # Find where answer ends
-                    end_idx = len(full_text)
-                    for marker in EXTRACTION_MARKERS['end']:
-                        idx = text_lower.find(marker.lower(), start_idx if start_idx > 0 else 0)
-                        if idx > 0:
-                            end_idx = min(end_idx, idx)
-                            logger.debug(f'Found end marker: {marker}')
+                    start_idx, end_idx = _find_answer_span(full_text)
 
                     if start_idx > 0 and start_idx < end_idx:
                         answer_text = full_text[start_idx:end_idx].strip()
 
                         # Clean up any remaining UI elements
-                        for ui_elem in EXTRACTION_MARKERS['ui_elements']:
-                            answer_text = answer_text.replace(ui_elem, '')
-
-                        answer_text = answer_text.strip()
+                        answer_text = UI_ELEMENTS_RE.sub('', answer_text).strip()
                         if answer_text:
                             strategy_used = 'Strategy 1: Marker-based'
                             logger.info(f'{strategy_used}: Found answer text ({len(answer_text)} chars)')
@@ -822,24 +867,27 @@ async def extract_search_results(page: NodriverPage, screenshot_path: Optional[s
         if not answer_text:
             try:
                 logger.debug('Trying strategy 2: Clean text extraction')
-                main_content = await page.select('main')
-                if main_content:
-                    # NOTE: .text_all is a PROPERTY, not an async method - do NOT await it
-                    full_text = main_content.text_all
-                    if full_text and len(full_text) > 200:
-                        # Remove known UI elements and clean up
-                        lines = full_text.split('\n')
-                        cleaned_lines = []
-
-                        for line in lines:
-                            line = line.strip()
-                            if line and not any(pattern in line for pattern in EXTRACTION_MARKERS['skip_patterns']):
-                                cleaned_lines.append(line)
-
-                        if cleaned_lines:
-                            answer_text = '\n'.join(cleaned_lines)
-                            strategy_used = 'Strategy 2: Clean text'
-                            logger.info(f'{strategy_used}: Found answer text ({len(answer_text)} chars)')
+                if full_text is None:
+                    # Strategy 1 never got the text; fetch it here instead
+                    main_content = await page.select('main')
+                    if main_content:
+                        # NOTE: .text_all is a PROPERTY, not an async method - do NOT await it
+                        full_text = main_content.text_all
+                if full_text and len(full_text) > 200:
+                    # Remove known UI elements and clean up
+                    lines = full_text.split('\n')
+                    cleaned_lines = []
+
+                    skip_search = SKIP_PATTERNS_RE.search
+                    for line in lines:
+                        line = line.strip()
+                        if line and not skip_search(line):
+                            cleaned_lines.append(line)
+
+                    if cleaned_lines:
+                        answer_text = '\n'.join(cleaned_lines)
+                        strategy_used = 'Strategy 2: Clean text'
+                        logger.info(f'{strategy_used}: Found answer text ({len(answer_text)} chars)')
             except Exception as e:
                 logger.warning(f'Strategy 2 extraction error: {e}')
 
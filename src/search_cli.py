@@ -5,12 +5,14 @@ Authenticates using cookies and performs a search query
 import sys
 import argparse
 import asyncio
+import functools
 import time
 import hashlib
 import logging
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Optional, Dict
+from urllib.parse import urlparse
 
 from src.utils.cookies import load_cookies, validate_auth_cookies
 from src.utils.storage import save_search_result
@@ -18,16 +20,10 @@ from src.utils.json_export import save_result_to_json
 from src.utils.shutdown_handler import ShutdownHandler
 from src.utils.process_cleanup import cleanup_on_startup
 from src.utils.prompts_loader import load_prompts_from_file
-from src.config import SCREENSHOT_CONFIG, LOGGING_CONFIG, MODEL_MAPPING
+from src.config import SCREENSHOT_CONFIG, LOGGING_CONFIG, MODEL_MAPPING, SELECTORS_UNION, TIMEOUTS
 
-# Import from new modular structure
-from src.browser.manager import launch_browser, browser_context
-from src.browser.auth import set_cookies, verify_authentication
-from src.browser.interactions import health_check, human_delay
-from src.browser.navigation import navigate_to_new_chat
-from src.search.executor import perform_search
-from src.search.extractor import extract_search_results, ExtractionResult, collapse_sources_if_expanded
-from src.search.model_selector import select_model
+# Browser and search modules pull in nodriver (~0.5s), so they are imported
+# inside the workflow functions; --help and argument errors stay fast.
 
 # Configure logging
 logging.basicConfig(
@@ -138,6 +134,9 @@ async def execute_single_search_workflow(
     Returns:
         Dict with keys: success (bool), result_id (int|None), error (str|None), execution_time (float)
     """
+    from src.search.executor import perform_search
+    from src.search.extractor import extract_search_results
+
     workflow_start_time = time.time()
     success = True
     error_message = None
@@ -155,7 +154,7 @@ async def execute_single_search_workflow(
         screenshot_path = None
         if save_screenshot:
             timestamp_str = datetime.now().strftime('%Y%m%d_%H%M%S')
-            query_hash = hashlib.md5(search_query.encode()).hexdigest()[:8]
+            query_hash = hashlib.blake2b(search_query.encode(), digest_size=4).hexdigest()
             screenshot_path = screenshot_dir / f'{timestamp_str}_{query_hash}_iter{iteration}.{SCREENSHOT_CONFIG["format"]}'
 
         result = await extract_search_results(page, str(screenshot_path) if screenshot_path else None)
@@ -172,7 +171,10 @@ async def execute_single_search_workflow(
         # Step 4: Save to database
         execution_time = time.time() - workflow_start_time
         logger.info('Saving results to database...')
-        result_id = save_search_result(
+        # Disk/SQLite work runs in the default executor so the loop stays free
+        loop = asyncio.get_running_loop()
+        result_id = await loop.run_in_executor(None, functools.partial(
+            save_search_result,
             query=search_query,
             answer_text=result.answer_text,
             sources=result.sources,
@@ -181,7 +183,7 @@ async def execute_single_search_workflow(
             execution_time=execution_time,
             success=success,
             error_message=error_message
-        )
+        ))
         logger.info(f'Saved as record ID: {result_id}')
         logger.info(f'Execution time: {execution_time:.2f}s')
         if result.strategy_used:
@@ -204,7 +206,9 @@ async def execute_single_search_workflow(
                 "iteration": iteration
             }
             try:
-                json_path = save_result_to_json(result_dict, output_dir=args.json_output_dir)
+                json_path = await loop.run_in_executor(None, functools.partial(
+                    save_result_to_json, result_dict, output_dir=args.json_output_dir
+                ))
                 logger.info(f'Saved result to JSON: {json_path}')
                 print(f'\nResult exported to JSON: {json_path}')
             except Exception as e:
@@ -237,6 +241,14 @@ async def main():
 
     # Parse command line arguments (outside try block for early validation)
     args = parse_arguments()
+
+    from src.browser.manager import browser_context
+    from src.browser.auth import set_cookies, verify_authentication
+    from src.browser.interactions import health_check, human_delay
+    from src.browser.navigation import navigate_to_new_chat
+    from src.search.extractor import collapse_sources_if_expanded
+    from src.search.model_selector import select_model
+
     search_query = args.query
     model = args.model
     save_screenshot = not args.no_screenshot
@@ -305,238 +317,259 @@ async def main():
     logger.debug('Shutdown handler registered for SIGINT and SIGTERM')
 
     try:
-        # Step 1: Load and validate cookies
+        # Step 1: Load cookies in a worker thread while the browser starts up
         logger.info('Loading authentication cookies...')
-        cookies = load_cookies()
-        validate_auth_cookies(cookies)
+        cookies_future = asyncio.get_running_loop().run_in_executor(None, load_cookies)
 
         # Step 2: Launch browser with randomized fingerprint (using context manager)
         logger.info('Launching browser (headed mode with fingerprint randomization)...')
-        async with browser_context() as browser:
-            # Note: Context manager handles browser cleanup automatically
-            # No need to register with shutdown handler (prevents double cleanup)
-            logger.debug('Browser managed by context manager')
-
-            # Step 3: Get first page
-            page = browser.main_tab
-
-            # Step 4: Set cookies BEFORE navigating
-            logger.info('Setting authentication cookies...')
-            await set_cookies(page, cookies)
-            logger.info('Cookies added to browser')
-
-            # Step 5: Navigate to Perplexity with cookies already set
-            logger.info('Navigating to Perplexity.ai...')
-            await page.get('https://www.perplexity.ai')
-            await human_delay('medium')
-
-            # Perform health check
-            health = await health_check(page)
-            logger.debug(f"Page health: {health}")
-
-            # Step 6: Verify authentication
-            logger.info('Verifying authentication status...')
-            is_authenticated = await verify_authentication(page)
-
-            if not is_authenticated:
-                raise Exception('Authentication failed - cookies may be expired or invalid')
-
-            logger.info('Successfully authenticated!')
-
-            # Step 7: Prepare screenshot directory
-            screenshot_dir = Path(SCREENSHOT_CONFIG['directory'])
-            screenshot_dir.mkdir(exist_ok=True)
-
-            # Step 8: Execute prompts loop
-            # Iterate through all prompts (either from file or single query)
-            for prompt_idx, prompt_config in enumerate(prompts):
-                iteration_num = prompt_idx + 1
-
-                # Extract per-prompt settings
-                current_query = prompt_config['query']
-                current_model = prompt_config.get('model', model)  # Fallback to CLI --model
-                current_no_screenshot = prompt_config.get('no_screenshot', args.no_screenshot)
-
-                # Log prompt info
-                logger.info(f'\n{"="*60}')
-                logger.info(f'Query {iteration_num}/{len(prompts)}')
-                logger.info(f'Query: "{current_query}"')
-                if current_model:
-                    logger.info(f'Model: {current_model}')
-                logger.info(f'{"="*60}\n')
-
-                # First iteration: select model if specified
-                if iteration_num == 1:
+        cookies_consumed = False
+        try:
+            async with browser_context() as browser:
+                # Note: Context manager handles browser cleanup automatically
+                # No need to register with shutdown handler (prevents double cleanup)
+                logger.debug('Browser managed by context manager')
+
+                # Cookies were read during browser launch; validate before use
+                cookies_consumed = True
+                cookies = await cookies_future
+                validate_auth_cookies(cookies)
+
+                # Step 3: Get first page
+                page = browser.main_tab
+
+                # Step 4: Set cookies BEFORE navigating
+                logger.info('Setting authentication cookies...')
+                await set_cookies(page, cookies)
+                logger.info('Cookies added to browser')
+
+                # Step 5: Navigate to Perplexity with cookies already set
+                logger.info('Navigating to Perplexity.ai...')
+                await page.get('https://www.perplexity.ai')
+
+                # Wait for the search box rather than a fixed pause; the page is
+                # usable as soon as it renders
+                try:
+                    await page.select(SELECTORS_UNION['search_input'], timeout=TIMEOUTS['page_load'])
+                except Exception as e:
+                    logger.warning(f'Search input not rendered after navigation: {type(e).__name__}: {e}')
+
+                # Perform health check
+                health = await health_check(page)
+                logger.debug(f"Page health: {health}")
+
+                # Step 6: Verify authentication
+                logger.info('Verifying authentication status...')
+                is_authenticated = await verify_authentication(page)
+
+                if not is_authenticated:
+                    raise Exception('Authentication failed - cookies may be expired or invalid')
+
+                logger.info('Successfully authenticated!')
+
+                # Step 7: Prepare screenshot directory
+                screenshot_dir = Path(SCREENSHOT_CONFIG['directory'])
+                await asyncio.get_running_loop().run_in_executor(
+                    None, functools.partial(screenshot_dir.mkdir, exist_ok=True)
+                )
+
+                # Step 8: Execute prompts loop
+                # Iterate through all prompts (either from file or single query)
+                for prompt_idx, prompt_config in enumerate(prompts):
+                    iteration_num = prompt_idx + 1
+
+                    # Extract per-prompt settings
+                    current_query = prompt_config['query']
+                    current_model = prompt_config.get('model', model)  # Fallback to CLI --model
+                    current_no_screenshot = prompt_config.get('no_screenshot', args.no_screenshot)
+
+                    # Log prompt info
+                    logger.info(f'\n{"="*60}')
+                    logger.info(f'Query {iteration_num}/{len(prompts)}')
+                    logger.info(f'Query: "{current_query}"')
                     if current_model:
-                        logger.info(f'Selecting AI model: {current_model}')
-                        try:
-                            model_success = await select_model(page, current_model)
-                            if not model_success:
-                                raise RuntimeError(f'Failed to select model: {current_model}')
-                            logger.info(f'Successfully selected model: {current_model}')
-                        except ValueError as e:
-                            logger.error(f'Invalid model name: {e}')
-                            available = list(MODEL_MAPPING.keys())
-                            logger.error(f'Available models: {", ".join(available)}')
-                            raise
-                        except Exception as e:
-                            logger.error(f'Model selection failed: {e}')
-                            raise
-
-                    # Execute first search workflow
-                    workflow_result = await execute_single_search_workflow(
-                        page=page,
-                        search_query=current_query,
-                        model=current_model,
-                        save_screenshot=not current_no_screenshot,
-                        screenshot_dir=screenshot_dir,
-                        args=args,
-                        iteration=iteration_num
-                    )
-
-                    # Update success and error_message from workflow result
-                    success = workflow_result['success']
-                    error_message = workflow_result['error']
-
-                # Subsequent iterations: navigate to new chat and re-select model if needed
-                elif len(prompts) > 1:  # Only enter multi-query logic if more than 1 prompt
-                    # Store current URL for independent verification
-                    previous_url = page.url
-                    logger.debug(f"Current URL before navigation: {previous_url}")
-
-                    # Close sources overlay before navigating to new chat (with retry logic)
-                    collapse_result = await collapse_sources_if_expanded(page)
-
-                    if not collapse_result:
-                        # First attempt failed - retry once after stabilization delay
-                        logger.warning("First overlay close attempt failed - retrying once...")
-                        await human_delay('medium')  # 0.5-1.5s stabilization
-                        collapse_result = await collapse_sources_if_expanded(page)
+                        logger.info(f'Model: {current_model}')
+                    logger.info(f'{"="*60}\n')
+
+                    # First iteration: select model if specified
+                    if iteration_num == 1:
+                        if current_model:
+                            logger.info(f'Selecting AI model: {current_model}')
+                            try:
+                                model_success = await select_model(page, current_model)
+                                if not model_success:
+                                    raise RuntimeError(f'Failed to select model: {current_model}')
+                                logger.info(f'Successfully selected model: {current_model}')
+                            except ValueError as e:
+                                logger.error(f'Invalid model name: {e}')
+                                available = list(MODEL_MAPPING.keys())
+                                logger.error(f'Available models: {", ".join(available)}')
+                                raise
+                            except Exception as e:
+                                logger.error(f'Model selection failed: {e}')
+                                raise
+
+                        # Execute first search workflow
+                        workflow_result = await execute_single_search_workflow(
+                            page=page,
+                            search_query=current_query,
+                            model=current_model,
+                            save_screenshot=not current_no_screenshot,
+                            screenshot_dir=screenshot_dir,
+                            args=args,
+                            iteration=iteration_num
+                        )
 
-                        if not collapse_result:
-                            # Second attempt also failed - abort to prevent hangs
-                            logger.error(
-                                f"Failed to close sources overlay after 2 attempts on query {iteration_num}/{len(prompts)} - "
-                                f"aborting multi-query to prevent hangs. Successfully completed {iteration_num - 1} queries total."
-                            )
-                            logger.debug(f"Current page URL: {page.url}")
-                            break  # Exit the prompts loop
-                    else:
-                        logger.info("✓ Sources overlay closed before new chat")
+                        # Update success and error_message from workflow result
+                        success = workflow_result['success']
+                        error_message = workflow_result['error']
 
-                    # Check shutdown after navigation
-                    if shutdown_handler.is_shutdown_requested():
-                        logger.info('Shutdown requested after closing overlay')
-                        break
+                    # Subsequent iterations: navigate to new chat and re-select model if needed
+                    elif len(prompts) > 1:  # Only enter multi-query logic if more than 1 prompt
+                        # Store current URL for independent verification
+                        previous_url = page.url
+                        logger.debug(f"Current URL before navigation: {previous_url}")
 
-                    # Navigate to new chat
-                    try:
-                        nav_success = await navigate_to_new_chat(
-                            page,
-                            verify=True,
-                            previous_url=previous_url  # Pass for enhanced verification
-                        )
+                        # Close sources overlay before navigating to new chat (with retry logic)
+                        collapse_result = await collapse_sources_if_expanded(page)
 
-                        if not nav_success:
-                            # Navigation failure indicates browser/UI issue - stop all remaining queries
-                            logger.error(f'Failed to navigate to new chat for query {iteration_num}')
-                            logger.error('Navigation verification returned False')
-                            logger.error('Stopping multi-query execution')
+                        if not collapse_result:
+                            # First attempt failed - retry once after stabilization delay
+                            logger.warning("First overlay close attempt failed - retrying once...")
+                            await human_delay('medium')  # 0.5-1.5s stabilization
+                            collapse_result = await collapse_sources_if_expanded(page)
+
+                            if not collapse_result:
+                                # Second attempt also failed - abort to prevent hangs
+                                logger.error(
+                                    f"Failed to close sources overlay after 2 attempts on query {iteration_num}/{len(prompts)} - "
+                                    f"aborting multi-query to prevent hangs. Successfully completed {iteration_num - 1} queries total."
+                                )
+                                logger.debug(f"Current page URL: {page.url}")
+                                break  # Exit the prompts loop
+                        else:
+                            logger.info("✓ Sources overlay closed before new chat")
+
+                        # Check shutdown after navigation
+                        if shutdown_handler.is_shutdown_requested():
+                            logger.info('Shutdown requested after closing overlay')
                             break
 
-                        # INDEPENDENT VERIFICATION: Check URL actually changed
-                        current_url = page.url
-                        logger.debug(f"Current URL after navigation: {current_url}")
+                        # Navigate to new chat
+                        try:
+                            nav_success = await navigate_to_new_chat(
+                                page,
+                                verify=True,
+                                previous_url=previous_url  # Pass for enhanced verification
+                            )
 
-                        if current_url == previous_url:
-                            logger.error(f'Navigation claimed success but URL did not change!')
-                            logger.error(f'  Previous URL: {previous_url}')
-                            logger.error(f'  Current URL:  {current_url}')
-                            logger.error(f'This indicates navigation verification gave false positive')
-                            logger.error('Stopping multi-query execution to prevent duplicate searches on same page')
-                            break
+                            if not nav_success:
+                                # Navigation failure indicates browser/UI issue - stop all remaining queries
+                                logger.error(f'Failed to navigate to new chat for query {iteration_num}')
+                                logger.error('Navigation verification returned False')
+                                logger.error('Stopping multi-query execution')
+                                break
 
-                        logger.info(f'URL changed to new chat page')
-                        logger.debug(f'  New URL: {current_url}')
+                            # INDEPENDENT VERIFICATION: Check URL actually changed
+                            current_url = page.url
+                            logger.debug(f"Current URL after navigation: {current_url}")
 
-                    except Exception as e:
-                        # Critical navigation error - cannot continue
-                        logger.error(f'Navigation error for query {iteration_num}: {e}')
-                        logger.error('Stopping multi-query execution')
-                        break
+                            if current_url == previous_url:
+                                logger.error(f'Navigation claimed success but URL did not change!')
+                                logger.error(f'  Previous URL: {previous_url}')
+                                logger.error(f'  Current URL:  {current_url}')
+                                logger.error(f'This indicates navigation verification gave false positive')
+                                logger.error('Stopping multi-query execution to prevent duplicate searches on same page')
+                                break
 
-                    # Check shutdown after navigation
-                    if shutdown_handler.is_shutdown_requested():
-                        logger.info('Shutdown requested after navigation')
-                        break
+                            logger.info(f'URL changed to new chat page')
+                            logger.debug(f'  New URL: {current_url}')
 
-                    # Re-select model if different from previous (UI resets after new chat)
-                    if current_model and current_model != model:
-                        logger.info(f'Re-selecting model: {current_model}')
-                        try:
-                            # type: ignore[arg-type] - page is Any type from nodriver, select_model expects NodriverPage protocol
-                            await select_model(page, current_model)
-                            logger.info(f'Model {current_model} selected for query {iteration_num}')
-                        except Exception as e:
-                            logger.error(f'Failed to select model {current_model}: {e}')
-                            logger.error('Stopping multi-query execution')
-                            break
-                    elif current_model:
-                        logger.info(f'Re-selecting model: {current_model}')
-                        try:
-                            await select_model(page, current_model)
-                            logger.info(f'Model {current_model} selected for query {iteration_num}')
                         except Exception as e:
-                            logger.error(f'Failed to select model {current_model}: {e}')
+                            # Critical navigation error - cannot continue
+                            logger.error(f'Navigation error for query {iteration_num}: {e}')
                             logger.error('Stopping multi-query execution')
                             break
 
-                    # Check shutdown before workflow execution
-                    if shutdown_handler.is_shutdown_requested():
-                        logger.info('Shutdown requested before workflow execution')
-                        break
-
-                    # Small delay before next search
-                    await human_delay('short')
+                        # Check shutdown after navigation
+                        if shutdown_handler.is_shutdown_requested():
+                            logger.info('Shutdown requested after navigation')
+                            break
 
-                    # Execute search workflow
-                    logger.info(f'Executing search workflow for query {iteration_num}...')
-                    try:
-                        workflow_result = await execute_single_search_workflow(
-                            page=page,
-                            search_query=current_query,
-                            model=current_model,
-                            save_screenshot=not current_no_screenshot,
-                            screenshot_dir=screenshot_dir,
-                            args=args,
-                            iteration=iteration_num
-                        )
+                        # Re-select model if different from previous (UI resets after new chat)
+                        if current_model and current_model != model:
+                            logger.info(f'Re-selecting model: {current_model}')
+                            try:
+                                # type: ignore[arg-type] - page is Any type from nodriver, select_model expects NodriverPage protocol
+                                await select_model(page, current_model)
+                                logger.info(f'Model {current_model} selected for query {iteration_num}')
+                            except Exception as e:
+                                logger.error(f'Failed to select model {current_model}: {e}')
+                                logger.error('Stopping multi-query execution')
+                                break
+                        elif current_model:
+                            logger.info(f'Re-selecting model: {current_model}')
+                            try:
+                                await select_model(page, current_model)
+                                logger.info(f'Model {current_model} selected for query {iteration_num}')
+                            except Exception as e:
+                                logger.error(f'Failed to select model {current_model}: {e}')
+                                logger.error('Stopping multi-query execution')
+                                break
+
+                        # Check shutdown before workflow execution
+                        if shutdown_handler.is_shutdown_requested():
+                            logger.info('Shutdown requested before workflow execution')
+                            break
 
-                        if workflow_result['success']:
-                            logger.info(f'Query {iteration_num}/{len(prompts)} completed successfully')
-                        else:
-                            logger.warning(f'Query {iteration_num}/{len(prompts)} completed with issues: {workflow_result.get("error", "Unknown error")}')
+                        # Small delay before next search
+                        await human_delay('short')
 
-                    except Exception as e:
-                        # Workflow error - log and continue to next query
-                        # This allows collecting partial results even if individual queries fail
-                        logger.error(f'Query {iteration_num}/{len(prompts)} failed with error: {e}')
-                        # Continue to next iteration to attempt remaining queries
+                        # Execute search workflow
+                        logger.info(f'Executing search workflow for query {iteration_num}...')
+                        try:
+                            workflow_result = await execute_single_search_workflow(
+                                page=page,
+                                search_query=current_query,
+                                model=current_model,
+                                save_screenshot=not current_no_screenshot,
+                                screenshot_dir=screenshot_dir,
+                                args=args,
+                                iteration=iteration_num
+                            )
 
-            # Handle multi-query mode (manual new chat clicks) after prompts loop
-            if args.multi_query:
-                logger.info('Multi-query mode: Browser will remain open')
-                logger.info('You can manually click the new chat button and perform more searches')
-                logger.info('Press Ctrl+C when done')
+                            if workflow_result['success']:
+                                logger.info(f'Query {iteration_num}/{len(prompts)} completed successfully')
+                            else:
+                                logger.warning(f'Query {iteration_num}/{len(prompts)} completed with issues: {workflow_result.get("error", "Unknown error")}')
 
-                # Keep browser alive until user interrupts or shutdown requested
-                try:
-                    while not shutdown_handler.is_shutdown_requested():
-                        await asyncio.sleep(1)
-                except KeyboardInterrupt:
-                    logger.info('User interrupted, cleanup will proceed...')
-                    # Let the exception propagate to outer handler
-                    raise
+                        except Exception as e:
+                            # Workflow error - log and continue to next query
+                            # This allows collecting partial results even if individual queries fail
+                            logger.error(f'Query {iteration_num}/{len(prompts)} failed with error: {e}')
+                            # Continue to next iteration to attempt remaining queries
+
+                # Handle multi-query mode (manual new chat clicks) after prompts loop
+                if args.multi_query:
+                    logger.info('Multi-query mode: Browser will remain open')
+                    logger.info('You can manually click the new chat button and perform more searches')
+                    logger.info('Press Ctrl+C when done')
+
+                    # Keep browser alive until user interrupts or shutdown requested
+                    try:
+                        while not shutdown_handler.is_shutdown_requested():
+                            await asyncio.sleep(1)
+                    except KeyboardInterrupt:
+                        logger.info('User interrupted, cleanup will proceed...')
+                        # Let the exception propagate to outer handler
+                        raise
+        finally:
+            if not cookies_consumed:
+                # Launch failed before the cookies were used; still report a
+                # cookie load error instead of dropping it with the future
+                await asyncio.wait([cookies_future])
+                if not cookies_future.cancelled() and cookies_future.exception() is not None:
+                    logger.error(f'Failed to load cookies: {cookies_future.exception()}')
 
     except KeyboardInterrupt:
         logger.warning('\nInterrupted by user')
@@ -556,7 +589,8 @@ async def main():
         # Save failed result to database
         execution_time = time.time() - start_time
         try:
-            save_search_result(
+            await asyncio.get_running_loop().run_in_executor(None, functools.partial(
+                save_search_result,
                 query=search_query if 'search_query' in locals() else 'Unknown',
                 answer_text='',
                 sources=[],
@@ -565,7 +599,7 @@ async def main():
                 execution_time=execution_time,
                 success=False,
                 error_message=error_message
-            )
+            ))
         except Exception as db_error:
             logger.warning(f'Could not save failed result to database: {db_error}')
 
@@ -600,35 +634,38 @@ def display_results(result) -> None:
         strategy_used = result.strategy_used
         error = result.error
 
-    print('\n' + '=' * 60)
-    print('📊 SEARCH RESULTS')
-    print('=' * 60 + '\n')
+    # Collected and written once so the report is a single stdout write
+    lines = [
+        '',
+        '=' * 60,
+        '📊 SEARCH RESULTS',
+        '=' * 60 + '\n',
+    ]
 
     # Show extraction status
     status_symbol = '✓' if success else '✗'
-    print(f'Status: {status_symbol} {"Success" if success else "Failed"}')
+    lines.append(f'Status: {status_symbol} {"Success" if success else "Failed"}')
     if strategy_used:
-        print(f'Strategy: {strategy_used}')
+        lines.append(f'Strategy: {strategy_used}')
     if error:
-        print(f'Error: {error}')
-    print()
+        lines.append(f'Error: {error}')
+    lines.append('')
 
     # Show answer
-    print('ANSWER:')
-    print('-' * 60)
-    print(answer_text if answer_text else 'No answer available')
-    print()
+    lines.append('ANSWER:')
+    lines.append('-' * 60)
+    lines.append(answer_text if answer_text else 'No answer available')
+    lines.append('')
 
     # Show sources
     if sources and len(sources) > 0:
-        print('SOURCES:')
-        print('-' * 60)
+        lines.append('SOURCES:')
+        lines.append('-' * 60)
         for index, source in enumerate(sources):
             if isinstance(source, dict):
                 # Get domain - either from new field or extract from URL
                 domain = source.get('domain', '')
                 if not domain and source.get('url'):
-                    from urllib.parse import urlparse
                     try:
                         domain = urlparse(source.get('url', '')).netloc
                     except (ValueError, TypeError, AttributeError):
@@ -640,11 +677,12 @@ def display_results(result) -> None:
                 # Format: "citation_number. Title [domain]"
                 text = source.get('text', 'N/A')
                 domain_str = f" [{domain}]" if domain else ""
-                print(f"{citation_num}. {text}{domain_str}")
-                print(f"   {source.get('url', 'N/A')}")
-                print()
+                lines.append(f"{citation_num}. {text}{domain_str}")
+                lines.append(f"   {source.get('url', 'N/A')}")
+                lines.append('')
 
-    print('=' * 60 + '\n')
+    lines.append('=' * 60 + '\n')
+    sys.stdout.write('\n'.join(lines) + '\n')
 
 
 if __name__ == '__main__':
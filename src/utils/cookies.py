@@ -11,9 +11,8 @@ from dataclasses import dataclass, asdict
 from datetime import datetime
 from pathlib import Path
 from typing import List, Dict, Any, Optional
-import nodriver as uc
 
-from src.config import REQUIRED_COOKIES, COOKIE_DEFAULTS
+from src.config import REQUIRED_COOKIES, REQUIRED_COOKIES_SET, COOKIE_DEFAULTS
 
 logger = logging.getLogger(__name__)
 
@@ -161,6 +160,8 @@ class Cookie:
         Returns:
             Dictionary with CDP-compatible parameters for page.send(uc.cdp.network.set_cookie(...))
         """
+        from nodriver import cdp
+
         cdp_cookie = {
             'name': self.name,
             'value': self.value,
@@ -172,11 +173,11 @@ class Cookie:
 
         # Add same_site if present
         if self.same_site:
-            cdp_cookie['same_site'] = uc.cdp.network.CookieSameSite(self.same_site)
+            cdp_cookie['same_site'] = cdp.network.CookieSameSite(self.same_site)
 
         # Add expires if present (must be positive)
         if self.expires and self.expires > 0:
-            cdp_cookie['expires'] = uc.cdp.network.TimeSinceEpoch(self.expires)
+            cdp_cookie['expires'] = cdp.network.TimeSinceEpoch(self.expires)
 
         return cdp_cookie
 
@@ -310,7 +311,7 @@ class CookieManager:
         Returns:
             List of Cookie objects that are in REQUIRED_COOKIES list
         """
-        return [c for c in self.cookies if c.name in REQUIRED_COOKIES]
+        return [c for c in self.cookies if c.name in REQUIRED_COOKIES_SET]
 
     def validate(self) -> bool:
         """
@@ -4,7 +4,7 @@ Manages exporting database records to JSON files
 """
 import json
 import logging
-from hashlib import md5
+from hashlib import blake2b
 from pathlib import Path
 from datetime import datetime
 from typing import Dict, List, Optional
@@ -26,8 +26,8 @@ def generate_filename(query: str, timestamp: str, model: Optional[str] = None) -
     Returns:
         Filename in format: result_{timestamp}_{query_hash}_{model}.json
     """
-    # Generate 8-char MD5 hash of query for uniqueness
-    query_hash = md5(query.encode()).hexdigest()[:8]
+    # Generate 8-char hash of query for uniqueness (same tag as screenshots)
+    query_hash = blake2b(query.encode(), digest_size=4).hexdigest()
 
     # Sanitize model name (replace special chars with underscore)
     if model:
@@ -0,0 +1,240 @@
+"""
+Unit tests for src/browser/auth.py
+Tests authentication indicator probing against a mocked page.
+"""
+import asyncio
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from src.browser import auth
+
+
+def make_page(select):
+    page = MagicMock()
+    page.select = select
+    return page
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+class TestFirstMatchingSelector:
+    """Tests for _first_matching_selector()"""
+
+    async def test_single_union_lookup(self):
+        """All selectors go to the browser as one any-of selector"""
+        element = MagicMock()
+        element.apply = AsyncMock(return_value=1)
+        select = AsyncMock(return_value=element)
+
+        result = await auth._first_matching_selector(make_page(select), ['#a', '#b'], timeout=1)
+
+        assert result == '#b'
+        select.assert_awaited_once_with('#a, #b', timeout=1)
+
+    async def test_unresolved_match_returns_union(self):
+        """If the matching part can't be identified, the union is reported"""
+        element = MagicMock()
+        element.apply = AsyncMock(side_effect=RuntimeError('detached'))
+
+        result = await auth._first_matching_selector(
+            make_page(AsyncMock(return_value=element)), ['#a', '#b'], timeout=1
+        )
+
+        assert result == '#a, #b'
+
+    async def test_no_match_returns_none(self):
+        """A timed-out or empty lookup returns no selector"""
+        timed_out = make_page(AsyncMock(side_effect=asyncio.TimeoutError()))
+        empty = make_page(AsyncMock(return_value=None))
+
+        assert await auth._first_matching_selector(timed_out, ['#a', '#b'], timeout=1) is None
+        assert await auth._first_matching_selector(empty, ['#a', '#b'], timeout=1) is None
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+class TestVerifyAuthentication:
+    """Tests for verify_authentication()"""
+
+    @staticmethod
+    def make_unmatched_page(account_nav, sign_in=False):
+        async def select(selector, timeout=None):
+            raise asyncio.TimeoutError()
+
+        async def evaluate(script, return_by_value=False):
+            return sign_in if script is auth._SIGN_IN_BUTTON_JS else account_nav
+
+        page = make_page(select)
+        page.select_all = AsyncMock(return_value=[])
+        page.evaluate = AsyncMock(side_effect=evaluate)
+        return page
+
+    async def test_account_nav_checked_in_page(self):
+        """The Account/Home fallback should be a single in-page boolean"""
+        page = self.make_unmatched_page(True)
+
+        with patch.object(auth, 'human_delay', new=AsyncMock()):
+            assert await auth.verify_authentication(page) is True
+
+        assert page.evaluate.await_args.args[0] is auth._ACCOUNT_NAV_JS
+
+    async def test_sign_in_button_scanned_in_page(self):
+        """A sign-in button found by the in-page scan means not authenticated"""
+        page = self.make_unmatched_page(True, sign_in=True)
+
+        with patch.object(auth, 'human_delay', new=AsyncMock()):
+            assert await auth.verify_authentication(page) is False
+
+        page.evaluate.assert_awaited_once()
+        assert page.evaluate.await_args.args[0] is auth._SIGN_IN_BUTTON_JS
+        page.select_all.assert_not_awaited()
+
+    async def test_no_fixed_load_delay(self):
+        """Verification should not start with an unconditional pause"""
+        page = self.make_unmatched_page(True)
+        delay = AsyncMock()
+
+        with patch.object(auth, 'human_delay', new=delay):
+            await auth.verify_authentication(page)
+
+        delay.assert_not_awaited()
+
+    async def test_sign_in_cancels_pending_indicator_probe(self):
+        """A sign-in hit returns at once instead of waiting out the probe"""
+        cancelled = []
+
+        async def select(selector, timeout=None):
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.append(selector)
+                raise
+
+        async def evaluate(script, return_by_value=False):
+            await asyncio.sleep(0.01)
+            return True
+
+        page = make_page(select)
+        page.evaluate = evaluate
+
+        result = await asyncio.wait_for(auth.verify_authentication(page), 1.0)
+        await asyncio.sleep(0)
+
+        assert result is False
+        assert len(cancelled) == 1
+
+    async def test_false_remote_object_is_not_authenticated(self):
+        """A falsy result comes back as a RemoteObject and must not count"""
+        page = self.make_unmatched_page(MagicMock(value=False))
+
+        with patch.object(auth, 'human_delay', new=AsyncMock()):
+            assert await auth.verify_authentication(page) is False
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+class TestSetCookies:
+    """Tests for set_cookies()"""
+
+    COOKIES = [
+        {'name': 'pplx.session-id', 'value': 'a'},
+        {'name': '__Secure-next-auth.session-token', 'value': 'b'},
+        {'name': 'extra', 'value': 'c', 'sameSite': 'Lax', 'expires': 2000000000},
+        {'name': 'empty', 'value': ''},
+    ]
+
+    async def test_sends_all_cookies_in_one_batch(self):
+        """Valid cookies should be injected with a single Network.setCookies call"""
+        page = MagicMock()
+        page.send = AsyncMock()
+
+        with patch.object(auth, 'human_delay', AsyncMock()):
+            await auth.set_cookies(page, self.COOKIES)
+
+        page.send.assert_awaited_once()
+        message = next(page.send.await_args.args[0])
+        assert message['method'] == 'Network.setCookies'
+        names = [cookie['name'] for cookie in message['params']['cookies']]
+        assert names == ['pplx.session-id', '__Secure-next-auth.session-token', 'extra']
+        assert message['params']['cookies'][2]['sameSite'] == 'Lax'
+
+    async def test_cookie_params_reused_across_calls(self):
+        """Identical cookie sets reuse the memoized CookieParam objects"""
+        auth._cookie_param.cache_clear()
+        page = MagicMock()
+        page.send = AsyncMock()
+
+        with patch.object(auth, 'human_delay', AsyncMock()):
+            await auth.set_cookies(page, self.COOKIES)
+            await auth.set_cookies(page, [dict(cookie) for cookie in self.COOKIES])
+
+        info = auth._cookie_param.cache_info()
+        assert (info.hits, info.misses) == (3, 3)
+
+    async def test_falls_back_to_individual_cookies(self):
+        """A failed batch should retry per cookie and tolerate optional failures"""
+        methods = []
+
+        async def send(command):
+            message = next(command)
+            methods.append(message['method'])
+            if message['method'] == 'Network.setCookies':
+                raise RuntimeError('batch rejected')
+            if message['params']['name'] == 'extra':
+                raise RuntimeError('bad cookie')
+
+        page = MagicMock()
+        page.send = send
+
+        with patch.object(auth, 'human_delay', AsyncMock()):
+            await auth.set_cookies(page, self.COOKIES)
+
+        assert methods == ['Network.setCookies'] + ['Network.setCookie'] * 3
+
+    async def test_malformed_optional_cookie_is_skipped(self):
+        """A bad sameSite on a non-critical cookie skips only that cookie"""
+        page = MagicMock()
+        page.send = AsyncMock()
+        cookies = self.COOKIES[:2] + [{'name': 'other', 'value': 'x', 'sameSite': 'no_restriction'}]
+
+        with patch.object(auth, 'human_delay', AsyncMock()):
+            await auth.set_cookies(page, cookies)
+
+        page.send.assert_awaited_once()
+        message = next(page.send.await_args.args[0])
+        names = [cookie['name'] for cookie in message['params']['cookies']]
+        assert names == ['pplx.session-id', '__Secure-next-auth.session-token']
+
+    async def test_malformed_critical_cookie_raises(self):
+        """A critical cookie that cannot be converted still fails fast"""
+        page = MagicMock()
+        page.send = AsyncMock()
+        cookies = [dict(self.COOKIES[0], expires='never'), self.COOKIES[1]]
+
+        with patch.object(auth, 'human_delay', AsyncMock()):
+            with pytest.raises(TypeError):
+                await auth.set_cookies(page, cookies)
+
+        page.send.assert_not_awaited()
+
+    async def test_malformed_cookie_not_cached(self):
+        """A cookie that fails conversion is never memoized"""
+        auth._cookie_param.cache_clear()
+        page = MagicMock()
+        page.send = AsyncMock()
+        cookies = self.COOKIES[:2] + [{'name': 'other', 'value': 'x', 'sameSite': 'no_restriction'}]
+
+        with patch.object(auth, 'human_delay', AsyncMock()):
+            await auth.set_cookies(page, cookies)
+
+        assert auth._cookie_param.cache_info().currsize == 2
+
+    async def test_missing_critical_cookie_raises(self):
+        """The critical cookie check still applies after a batch"""
+        page = MagicMock()
+        page.send = AsyncMock()
+
+        with patch.object(auth, 'human_delay', AsyncMock()):
+            with pytest.raises(Exception, match='Not all critical cookies'):
+                await auth.set_cookies(page, self.COOKIES[1:])
@@ -3,7 +3,7 @@ Tests for browser manager module
 Tests fingerprint randomization and browser launch configuration
 """
 import pytest
-from src.browser.manager import get_random_user_agent, get_random_viewport, launch_browser
+from src.browser.manager import get_random_user_agent, get_random_viewport, launch_browser, _pool_picker
 from src.config import USER_AGENTS, VIEWPORT_SIZES, BROWSER_CONFIG
 
 
@@ -47,6 +47,19 @@ class TestFingerprint:
         # With 5 viewports and 10 calls, we should get at least 1 different one
         assert len(viewports) >= 1
 
+    def test_pool_picker_power_of_two_pool(self):
+        """Masked sampler should only return pool members for power-of-two pools"""
+        pool = ('a', 'b', 'c', 'd')
+        pick = _pool_picker(pool)
+        assert {pick() for _ in range(50)} <= set(pool)
+
+    def test_pool_picker_single_and_odd_pools(self):
+        """Sampler should handle single-element and non-power-of-two pools"""
+        assert _pool_picker(('only',))() == 'only'
+        pool = ('a', 'b', 'c')
+        pick = _pool_picker(pool)
+        assert {pick() for _ in range(50)} <= set(pool)
+
     def test_browser_config_headless_is_false(self):
         """Browser config should disable headless mode"""
         assert BROWSER_CONFIG['headless'] is False
@@ -58,6 +71,27 @@ class TestFingerprint:
         assert '--no-sandbox' in BROWSER_CONFIG['args']
 
 
+class TestBrowserArgs:
+    """Test browser argument construction"""
+
+    def test_single_canonical_launch_browser(self):
+        """Package re-export should be the retrying manager implementation"""
+        import src.browser
+        import src.browser.manager as manager
+        assert src.browser.launch_browser is manager.launch_browser
+        assert src.browser.get_random_user_agent is manager.get_random_user_agent
+        assert src.browser.get_random_viewport is manager.get_random_viewport
+
+    def test_build_browser_args_includes_anti_detection(self):
+        """Anti-detection flags must be present in launch arguments"""
+        from src.browser.manager import _build_browser_args
+        args, user_agent, (width, height) = _build_browser_args()
+        assert '--disable-blink-features=AutomationControlled' in args
+        assert f'--user-agent={user_agent}' in args
+        assert f'--window-size={width},{height}' in args
+        assert user_agent in USER_AGENTS
+
+
 class TestBrowserLaunch:
     """Test browser launch function (async tests)"""
 
@@ -0,0 +1,209 @@
+"""
+Unit tests for src/search/executor.py
+Tests the per-page selector cache used when locating search controls.
+"""
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from src.search import executor
+
+
+def make_page(url='https://www.perplexity.ai/?q=1', cached=None):
+    page = MagicMock()
+    page.url = url
+    if cached is not None:
+        page._element_cache = ('https://www.perplexity.ai/', {'search_input': (cached, None)})
+    return page
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+class TestFindCached:
+    """Tests for _find_cached()"""
+
+    async def test_records_winning_selector(self):
+        """A miss looks up all selectors at once and caches the one that matched"""
+        element = MagicMock()
+        find = AsyncMock(return_value=element)
+        resolve = AsyncMock(return_value='#b')
+
+        page = make_page()
+
+        with patch.object(executor, 'find_interactive_element', new=find), \
+                patch.object(executor, 'matched_selector', new=resolve):
+            result = await executor._find_cached(page, 'search_input', ['#a', '#b'], timeout=1)
+
+        assert result == (element, '#b')
+        find.assert_awaited_once()
+        assert find.await_args.args[1] == ['#a, #b']
+        assert page._element_cache[1]['search_input'] == ('#b', element)
+
+    async def test_priority_order_beats_document_order(self):
+        """The first selector in list order wins even if another matches earlier in the page"""
+        page = make_page()
+        page.evaluate = AsyncMock(return_value=1)
+        element = MagicMock()
+        find = AsyncMock(return_value=element)
+
+        with patch.object(executor, 'find_interactive_element', new=find):
+            result = await executor._find_cached(page, 'search_button', ['#submit', 'button svg'], timeout=1)
+
+        assert result == (element, '#submit')
+        assert [call.args[1] for call in find.await_args_list] == [['#submit']]
+        page.evaluate.assert_awaited_once()
+
+    async def test_waits_once_then_ranks(self):
+        """When nothing is rendered yet, one any-of wait is followed by ranking"""
+        page = make_page()
+        page.evaluate = AsyncMock(side_effect=[MagicMock(), 2])
+        find = AsyncMock(return_value=MagicMock())
+
+        with patch.object(executor, 'find_interactive_element', new=find):
+            _, selector = await executor._find_cached(page, 'search_button', ['#a', '#b'], timeout=1)
+
+        assert selector == '#b'
+        assert [call.args[1] for call in find.await_args_list] == [['#a, #b'], ['#b']]
+
+    async def test_cached_selector_tried_first(self):
+        """A cached hit should be probed before the rest of the list"""
+        find = AsyncMock(return_value=MagicMock())
+
+        with patch.object(executor, 'find_interactive_element', new=find):
+            await executor._find_cached(make_page(cached='#b'), 'search_input', ['#a', '#b'], timeout=1)
+
+        find.assert_awaited_once()
+        assert find.await_args.args[1] == ['#b']
+
+    async def test_stale_cache_falls_back_and_is_cleared(self):
+        """When nothing matches, the stale entry is dropped"""
+        page = make_page(cached='#b')
+        find = AsyncMock(return_value=None)
+
+        with patch.object(executor, 'find_interactive_element', new=find):
+            result = await executor._find_cached(page, 'search_input', ['#a', '#b'], timeout=1)
+
+        assert result == (None, None)
+        assert [call.args[1] for call in find.await_args_list] == [['#b'], ['#a, #b']]
+        timeouts = [call.kwargs['timeout'] for call in find.await_args_list]
+        assert timeouts == [executor._CACHED_SELECTOR_TIMEOUT, 1]
+        assert page._element_cache[1] == {}
+
+    async def test_live_handle_reused_without_query(self):
+        """A cached handle that is still attached skips the DOM lookup"""
+        page = make_page()
+        element = MagicMock()
+        element.apply = AsyncMock(return_value=True)
+        find = AsyncMock(return_value=element)
+
+        with patch.object(executor, 'find_interactive_element', new=find):
+            await executor._find_cached(page, 'search_input', ['#a'], timeout=1)
+            result = await executor._find_cached(page, 'search_input', ['#a'], timeout=1)
+
+        assert result == (element, '#a')
+        find.assert_awaited_once()
+
+    async def test_detached_handle_is_requeried(self):
+        """A handle whose node was re-rendered is dropped and looked up again"""
+        page = make_page()
+        stale = MagicMock()
+        stale.apply = AsyncMock(return_value=False)
+        fresh = MagicMock()
+        find = AsyncMock(side_effect=[stale, fresh])
+
+        with patch.object(executor, 'find_interactive_element', new=find):
+            await executor._find_cached(page, 'search_input', ['#a'], timeout=1)
+            result = await executor._find_cached(page, 'search_input', ['#a'], timeout=1)
+
+        assert result == (fresh, '#a')
+        assert find.await_count == 2
+
+    async def test_handle_not_shared_across_urls(self):
+        """Navigating to another URL does not reuse the old handle"""
+        page = make_page()
+        element = MagicMock()
+        element.apply = AsyncMock(return_value=True)
+        find = AsyncMock(return_value=element)
+
+        with patch.object(executor, 'find_interactive_element', new=find), \
+                patch.object(executor, 'matched_selector', new=AsyncMock(return_value='#a')):
+            await executor._find_cached(page, 'search_input', ['#a'], timeout=1)
+            page.url = 'https://www.perplexity.ai/search/abc'
+            await executor._find_cached(page, 'search_input', ['#a'], timeout=1)
+
+        assert find.await_count == 2
+        element.apply.assert_not_awaited()
+
+    async def test_handles_kept_on_page_for_current_url_only(self):
+        """Handles live on the page and are replaced, not accumulated, on navigation"""
+        page = make_page()
+        first, second = MagicMock(), MagicMock()
+        find = AsyncMock(side_effect=[first, second])
+
+        with patch.object(executor, 'find_interactive_element', new=find), \
+                patch.object(executor, 'matched_selector', new=AsyncMock(return_value='#a')):
+            await executor._find_cached(page, 'search_input', ['#a'], timeout=1)
+            page.url = 'https://www.perplexity.ai/search/abc'
+            await executor._find_cached(page, 'search_input', ['#a'], timeout=1)
+
+        url, elements = page._element_cache
+        assert url == 'https://www.perplexity.ai/search/abc'
+        assert elements == {'search_input': ('#a', second)}
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+class TestProbeIndicator:
+    """Tests for the unioned indicator probe in verify_search_submitted"""
+
+    async def test_css_union_single_select(self):
+        """All CSS alternatives are checked with one select call"""
+        page = MagicMock()
+        page.select = AsyncMock(return_value=MagicMock())
+        page.find = AsyncMock()
+
+        label = await executor._probe_indicator(page, executor._LOADING_CSS_UNION, executor._LOADING_TEXTS)
+
+        assert label == executor._LOADING_CSS_UNION
+        page.select.assert_awaited_once()
+        page.find.assert_not_awaited()
+
+    async def test_falls_back_to_text_probes(self):
+        """Text probes run only when the CSS union finds nothing"""
+        page = MagicMock()
+        page.select = AsyncMock(side_effect=TimeoutError())
+        page.find = AsyncMock(side_effect=[None, MagicMock()])
+
+        label = await executor._probe_indicator(page, executor._RESULT_CSS_UNION, executor._RESULT_TEXTS)
+
+        assert label == 'text:completed'
+        assert page.find.await_count == 2
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+class TestWaitForContentStability:
+    """Tests for the mutation-observer based stability wait"""
+
+    @pytest.fixture(autouse=True)
+    def fast_config(self):
+        config = {'check_interval': 0.01, 'stable_threshold': 3, 'min_content_length': 50}
+        with patch.object(executor, 'STABILITY_CONFIG', config):
+            yield
+
+    async def test_installs_observer_then_detects_quiet_period(self):
+        """Attaches the observer once, then returns when content stops changing"""
+        page = MagicMock()
+        page.evaluate = AsyncMock(side_effect=[None, True, [5.0, 400], [45.0, 800]])
+
+        assert await executor.wait_for_content_stability(page, max_wait=5) is True
+
+        scripts = [call.args[0] for call in page.evaluate.await_args_list]
+        assert scripts.count(executor._JS_WATCH_MAIN) == 1
+        assert page.evaluate.await_count == 4
+
+    async def test_short_content_is_not_stable(self):
+        """Quiet content below the minimum length keeps waiting until timeout"""
+        page = MagicMock()
+        page.evaluate = AsyncMock(return_value=[10_000.0, 10])
+
+        assert await executor.wait_for_content_stability(page, max_wait=0.05) is False
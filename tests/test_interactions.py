@@ -0,0 +1,81 @@
+"""
+Unit tests for src/browser/interactions.py
+Tests the pre-generated typing rhythm and selector-group helpers.
+"""
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from src.browser import interactions
+from src.config import TYPING_SPEED
+
+
+@pytest.mark.unit
+class TestTypingSchedule:
+    """Tests for _typing_schedule()"""
+
+    def test_one_entry_per_character(self):
+        """Every character gets a delay and pause flag"""
+        assert len(interactions._typing_schedule('hello world')) == 11
+        assert interactions._typing_schedule('') == []
+
+    def test_delays_within_configured_bounds(self):
+        """Spaces and other characters use their own delay ranges"""
+        text = 'ab cd ' * 50
+        for char, (delay, _) in zip(text, interactions._typing_schedule(text)):
+            if char == ' ':
+                assert TYPING_SPEED.space_min <= delay <= TYPING_SPEED.space_max
+            else:
+                assert TYPING_SPEED.char_min <= delay <= TYPING_SPEED.char_max
+
+    def test_no_micro_pause_after_first_character(self):
+        """The first character never triggers a micro-pause"""
+        assert interactions._typing_schedule('x' * 20)[0][1] is False
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+class TestMatchedSelector:
+    """Tests for matched_selector()"""
+
+    async def test_returns_selector_at_index(self):
+        """The in-page findIndex result picks the selector"""
+        element = MagicMock()
+        element.apply = AsyncMock(return_value=2)
+
+        assert await interactions.matched_selector(element, ['#a', '#b', '#c']) == '#c'
+        assert '["#a", "#b", "#c"]' in element.apply.await_args.args[0]
+
+    async def test_unknown_index_returns_union(self):
+        """A missing, boolean, or failed result falls back to the joined selector"""
+        for outcome in ({'return_value': -1}, {'return_value': True},
+                        {'return_value': None}, {'side_effect': RuntimeError('detached')}):
+            element = MagicMock()
+            element.apply = AsyncMock(**outcome)
+            assert await interactions.matched_selector(element, ['#a', '#b']) == '#a, #b'
+
+
+@pytest.mark.unit
+class TestKeystrokes:
+    """Tests for _keystrokes()"""
+
+    def test_per_character_by_default(self):
+        """Unchunked typing sends one key per call"""
+        strokes = interactions._keystrokes('hello')
+        assert [keys for keys, _, _ in strokes] == list('hello')
+
+    def test_chunks_cover_text_in_bursts(self):
+        """Chunked typing reassembles to the text in 3-8 character bursts"""
+        text = 'what is the capital of france and why'
+        for _ in range(20):
+            strokes = interactions._keystrokes(text, chunked=True)
+            assert ''.join(keys for keys, _, _ in strokes) == text
+            assert all(3 <= len(keys) <= 8 for keys, _, _ in strokes[:-1])
+
+    def test_chunk_delay_is_sum_of_character_delays(self):
+        """A burst waits as long as its characters would have in total"""
+        text = 'abcdefgh'
+        with patch.object(interactions, '_typing_schedule', return_value=[(0.1, False)] * 8), \
+                patch.object(interactions.random, 'randint', return_value=4):
+            strokes = interactions._keystrokes(text, chunked=True)
+
+        assert [(keys, round(delay, 6)) for keys, delay, _ in strokes] == [('abcd', 0.4), ('efgh', 0.4)]
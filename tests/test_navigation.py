@@ -0,0 +1,446 @@
+"""
+Unit tests for src/browser/navigation.py
+Tests new chat navigation and verification logic against mocked pages.
+"""
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from src.browser import navigation
+from src.browser.navigation import navigate_to_new_chat
+
+
+def make_page(url='https://www.perplexity.ai/', evaluate_result=None):
+    """Create a mock nodriver page with a fixed URL and evaluate result."""
+    page = MagicMock()
+    page.url = url
+    page.evaluate = AsyncMock(return_value=evaluate_result)
+    return page
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+class TestNavigateToNewChatIdempotency:
+    """Tests for skipping navigation when already on a new chat page"""
+
+    async def test_skips_navigation_on_blank_new_chat(self):
+        """Blank new chat page should return True without clicking"""
+        page = make_page(evaluate_result={'inputFound': True, 'inputEmpty': True, 'hasOld': False})
+
+        with patch.object(navigation, 'find_interactive_element', new=AsyncMock()) as find:
+            result = await navigate_to_new_chat(page, verify=True)
+
+        assert result is True
+        find.assert_not_awaited()
+        assert page.evaluate.await_count == 1
+
+    async def test_does_not_skip_when_old_content_present(self):
+        """Old answer content should force the full navigation path"""
+        page = make_page(evaluate_result={'inputFound': True, 'inputEmpty': True, 'hasOld': True})
+
+        with patch.object(navigation, 'find_interactive_element', new=AsyncMock(return_value=None)) as find:
+            result = await navigate_to_new_chat(page, verify=True)
+
+        assert result is False
+        find.assert_awaited()
+
+    async def test_does_not_skip_when_url_unchanged(self):
+        """Same URL as previous_url means navigation is still required"""
+        url = 'https://www.perplexity.ai/'
+        page = make_page(url=url, evaluate_result={'inputFound': True, 'inputEmpty': True, 'hasOld': False})
+
+        with patch.object(navigation, 'find_interactive_element', new=AsyncMock(return_value=None)) as find:
+            result = await navigate_to_new_chat(page, verify=True, previous_url=url)
+
+        assert result is False
+        find.assert_awaited()
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+class TestVerifyNewChatPage:
+    """Tests for verify_new_chat_page multi-check verification"""
+
+    async def test_fused_snapshot_passes_in_one_round_trip(self):
+        """A clean snapshot should verify without polling or selector probes"""
+        page = make_page(
+            url='https://www.perplexity.ai/',
+            evaluate_result={'inputFound': True, 'inputEmpty': True, 'hasOld': False},
+        )
+
+        with patch.object(navigation, 'find_interactive_element', new=AsyncMock()) as find:
+            result = await navigation.verify_new_chat_page(
+                page, timeout=1.0, previous_url='https://www.perplexity.ai/search/old'
+            )
+
+        assert result is True
+        assert page.evaluate.await_count == 1
+        find.assert_not_awaited()
+
+    async def test_non_empty_input_fails(self):
+        """Text left in the search input is a critical failure"""
+        page = make_page(
+            url='https://www.perplexity.ai/',
+            evaluate_result={'inputFound': True, 'inputEmpty': False, 'hasOld': False},
+        )
+
+        result = await navigation.verify_new_chat_page(page, timeout=1.0)
+
+        assert result is False
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+class TestVerifyOldContentGone:
+    """Tests for the old-content polling check"""
+
+    async def test_observer_wait_resolves_in_one_call(self):
+        """MutationObserver result should be used without polling"""
+        page = make_page(evaluate_result={'ok': True, 'elapsed': 0.2})
+
+        assert await navigation._verify_old_content_gone(page, timeout=1.0) is True
+        page.evaluate.assert_awaited_once()
+        assert page.evaluate.await_args.kwargs['await_promise'] is True
+
+    async def test_observer_wait_timeout(self):
+        """MutationObserver timeout should fail verification"""
+        page = make_page(evaluate_result={'ok': False, 'elapsed': 1.0})
+
+        assert await navigation._verify_old_content_gone(page, timeout=1.0) is False
+        page.evaluate.assert_awaited_once()
+
+    async def test_falls_back_to_polling(self):
+        """Unusable observer result should fall back to the poll script"""
+        page = make_page()
+        page.evaluate = AsyncMock(side_effect=[None, {'found': False}])
+
+        assert await navigation._verify_old_content_gone(page, timeout=1.0) is True
+        assert page.evaluate.await_count == 2
+        assert page.evaluate.await_args.args[0] is navigation._OLD_CONTENT_JS
+
+    async def test_polling_times_out_when_old_content_persists(self):
+        """Persistent old content should fail once the timeout expires"""
+        page = make_page(evaluate_result={'found': True, 'type': 'selector', 'value': 'x'})
+
+        assert await navigation._verify_old_content_gone(page, timeout=0.3) is False
+
+    async def test_invalid_timeout(self):
+        """Non-positive timeouts are rejected without touching the page"""
+        page = make_page()
+
+        assert await navigation._verify_old_content_gone(page, timeout=0) is False
+        page.evaluate.assert_not_awaited()
+
+
+@pytest.mark.unit
+class TestPollBackoff:
+    """Tests for the jittered poll backoff"""
+
+    def test_backoff_grows_and_is_capped(self):
+        """Delays stay within the growing ceiling and never exceed poll_interval"""
+        for check_count, ceiling in [(1, 0.1), (2, 0.2), (3, 0.4), (4, 0.5), (10, 0.5)]:
+            for _ in range(20):
+                delay = navigation._poll_backoff(check_count, 0.5)
+                assert 0 <= delay <= ceiling
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+class TestVerifyUrlShortCircuit:
+    """Tests for failing fast on URL mismatch"""
+
+    async def test_url_mismatch_skips_dom_queries(self):
+        """Non new-chat URL should fail without any page.evaluate calls"""
+        page = make_page(url='https://www.perplexity.ai/settings')
+
+        result = await navigation.verify_new_chat_page(page, timeout=1.0)
+
+        assert result is False
+        page.evaluate.assert_not_awaited()
+
+    async def test_unchanged_thread_url_skips_dom_queries(self):
+        """Staying on the same search thread should fail without DOM queries"""
+        url = 'https://www.perplexity.ai/search/abc-123'
+        page = make_page(url=url)
+
+        result = await navigation.verify_new_chat_page(page, timeout=1.0, previous_url=url)
+
+        assert result is False
+        page.evaluate.assert_not_awaited()
+
+    async def test_strict_all_checks_runs_dom_checks(self):
+        """strict_all_checks should still gather DOM diagnostics"""
+        page = make_page(
+            url='https://www.perplexity.ai/settings',
+            evaluate_result={'inputFound': True, 'inputEmpty': True, 'hasOld': False},
+        )
+
+        result = await navigation.verify_new_chat_page(
+            page, timeout=1.0, strict_all_checks=True
+        )
+
+        assert result is False
+        page.evaluate.assert_awaited_once()
+
+
+@pytest.mark.unit
+class TestIsNewChatUrl:
+    """Tests for the new chat URL pattern"""
+
+    @pytest.mark.parametrize('url', [
+        'https://www.perplexity.ai',
+        'https://www.perplexity.ai/',
+        'https://perplexity.ai/',
+        'http://www.perplexity.ai',
+        'https://www.perplexity.ai/search/abc-123',
+        'https://www.perplexity.ai/search/abc-123?s=u',
+        'https://www.perplexity.ai/?q=1',
+    ])
+    def test_matches_new_chat_urls(self, url):
+        assert navigation._is_new_chat_url(url) is True
+
+    @pytest.mark.parametrize('url', [
+        '',
+        None,
+        'https://www.perplexity.ai/settings',
+        'https://www.perplexity.ai/discover',
+        'https://example.com/search/abc',
+        'https://www.perplexity.ai.evil.com/',
+    ])
+    def test_rejects_other_urls(self, url):
+        assert navigation._is_new_chat_url(url) is False
+
+
+@pytest.mark.unit
+class TestRefreshConfig:
+    """Tests for module-level NEW_CHAT_CONFIG resolution"""
+
+    def test_refresh_picks_up_config_changes(self):
+        """_refresh_config should re-resolve selectors and state script"""
+        original = navigation.NEW_CHAT_CONFIG['verification_selectors']
+        try:
+            navigation.NEW_CHAT_CONFIG['verification_selectors'] = ['#custom-input']
+            navigation._refresh_config()
+            assert navigation._VERIFICATION_SELECTORS == ('#custom-input',)
+            assert '#custom-input' in navigation._NEW_CHAT_STATE_JS
+        finally:
+            navigation.NEW_CHAT_CONFIG['verification_selectors'] = original
+            navigation._refresh_config()
+
+    def test_refresh_rebuilds_new_chat_selector_union(self):
+        """Button selector union should follow NEW_CHAT_CONFIG['selectors']"""
+        original = navigation.NEW_CHAT_CONFIG['selectors']
+        try:
+            navigation.NEW_CHAT_CONFIG['selectors'] = ['#a', '#b']
+            navigation._refresh_config()
+            assert navigation._NEW_CHAT_SELECTOR_UNION == '#a, #b'
+        finally:
+            navigation.NEW_CHAT_CONFIG['selectors'] = original
+            navigation._refresh_config()
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+class TestNavigateClick:
+    """Tests for the find-and-click pass in navigate_to_new_chat"""
+
+    async def test_clicks_resolved_element_without_second_lookup(self):
+        """The element found by the probe should be clicked directly"""
+        from src.browser.smart_click import ClickResult, ClickStrategy
+
+        page = make_page(url='https://www.perplexity.ai/search/old')
+        button = MagicMock()
+        click = AsyncMock(return_value=ClickResult(
+            success=True, strategy_used=ClickStrategy.NORMAL, attempts=1
+        ))
+
+        with patch.object(navigation, 'find_interactive_element', new=AsyncMock(return_value=button)), \
+                patch.object(navigation, 'human_delay', new=AsyncMock()), \
+                patch.object(navigation.SmartClicker, 'click', new=click):
+            result = await navigate_to_new_chat(page, verify=False)
+
+        assert result is True
+        click.assert_awaited_once()
+        assert click.await_args.kwargs['element'] is button
+
+    async def test_escalates_to_fresh_lookup_on_fast_click_failure(self):
+        """A failed fast click should retry by selector with full fallbacks"""
+        from src.browser.smart_click import ClickResult, ClickStrategy
+
+        page = make_page(url='https://www.perplexity.ai/search/old')
+        button = MagicMock()
+        click = AsyncMock(side_effect=[
+            ClickResult(success=False, strategy_used=ClickStrategy.NORMAL, attempts=1,
+                        error="All strategies failed"),
+            ClickResult(success=True, strategy_used=ClickStrategy.JAVASCRIPT, attempts=2),
+        ])
+
+        with patch.object(navigation, 'find_interactive_element', new=AsyncMock(return_value=button)), \
+                patch.object(navigation, 'human_delay', new=AsyncMock()), \
+                patch.object(navigation.SmartClicker, 'click', new=click):
+            result = await navigate_to_new_chat(page, verify=False)
+
+        assert result is True
+        assert click.await_count == 2
+        assert 'element' not in click.await_args_list[1].kwargs
+        assert click.await_args_list[1].kwargs['selector'] == navigation._NEW_CHAT_SELECTOR_UNION
+
+    async def test_probes_all_selectors_in_one_call(self):
+        """Button lookup should use one comma-joined selector"""
+        page = make_page(url='https://www.perplexity.ai/search/old')
+        find = AsyncMock(return_value=None)
+
+        with patch.object(navigation, 'find_interactive_element', new=find):
+            result = await navigate_to_new_chat(page, verify=False)
+
+        assert result is False
+        find.assert_awaited_once()
+        assert find.await_args.kwargs['selectors'] == [', '.join(navigation._NEW_CHAT_SELECTORS)]
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+class TestWaitReady:
+    """Tests for the post-click readiness wait"""
+
+    async def test_ready_resolves_without_fixed_delay(self):
+        """A ready page should return immediately, without human_delay"""
+        page = make_page(evaluate_result=True)
+
+        with patch.object(navigation, 'human_delay', new=AsyncMock()) as delay:
+            assert await navigation._wait_ready(page, '#input', 2.0) is True
+
+        delay.assert_not_awaited()
+        assert page.evaluate.await_args.kwargs['await_promise'] is True
+
+    async def test_timeout_returns_false(self):
+        """A falsy by-value result (RemoteObject) means the wait timed out"""
+        page = make_page(evaluate_result=MagicMock(value=False))
+
+        with patch.object(navigation, 'human_delay', new=AsyncMock()) as delay:
+            assert await navigation._wait_ready(page, '#input', 2.0) is False
+
+        delay.assert_not_awaited()
+
+    async def test_falls_back_to_fixed_delay_on_error(self):
+        """If the in-page wait can't run, fall back to human_delay('medium')"""
+        page = make_page()
+        page.evaluate = AsyncMock(side_effect=RuntimeError('navigated'))
+
+        with patch.object(navigation, 'human_delay', new=AsyncMock()) as delay:
+            assert await navigation._wait_ready(page, '#input', 2.0) is False
+
+        delay.assert_awaited_once_with('medium')
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+class TestVerifyInputProbe:
+    """Tests for the search input probe in verify_new_chat_page"""
+
+    async def test_input_probe_uses_one_union_lookup(self):
+        """All verification selectors should be probed in a single lookup"""
+        page = make_page(url='https://www.perplexity.ai/')
+        page.evaluate = AsyncMock(side_effect=[None, {'ok': True}])
+        find = AsyncMock(return_value=None)
+
+        with patch.object(navigation, 'find_interactive_element', new=find):
+            result = await navigation.verify_new_chat_page(page, timeout=2.0)
+
+        assert result is False
+        find.assert_awaited_once()
+        assert find.await_args.args[1] == [navigation._VERIFICATION_SELECTOR_UNION]
+        assert find.await_args.kwargs['timeout'] <= 2.0
+
+    async def test_old_content_wait_and_input_probe_overlap(self):
+        """Old content wait and input probe should run concurrently"""
+        import asyncio
+
+        page = make_page(url='https://www.perplexity.ai/')
+        started = []
+
+        async def slow_old_content(page, timeout):
+            started.append('old')
+            await asyncio.sleep(0.05)
+            assert 'input' in started
+            return True
+
+        async def slow_probe(page, selectors, timeout):
+            started.append('input')
+            await asyncio.sleep(0.05)
+            assert 'old' in started
+            return True, True
+
+        with patch.object(navigation, '_verify_old_content_gone', new=slow_old_content), \
+                patch.object(navigation, '_probe_input', new=slow_probe):
+            result = await navigation.verify_new_chat_page(page, timeout=2.0)
+
+        assert result is True
+
+    async def test_failed_input_probe_cancels_old_content_wait(self):
+        """A non-empty input should not wait out the old-content timeout"""
+        import asyncio
+
+        page = make_page(url='https://www.perplexity.ai/')
+        cancelled = []
+
+        async def stuck_old_content(page, timeout):
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.append(True)
+                raise
+            return True
+
+        async def non_empty_probe(page, selectors, timeout):
+            await asyncio.sleep(0.01)
+            return True, False
+
+        with patch.object(navigation, '_verify_old_content_gone', new=stuck_old_content), \
+                patch.object(navigation, '_probe_input', new=non_empty_probe):
+            result = await asyncio.wait_for(
+                navigation.verify_new_chat_page(page, timeout=10.0), timeout=1.0
+            )
+            await asyncio.sleep(0)
+
+        assert result is False
+        assert cancelled == [True]
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+class TestGetInputValue:
+    """Tests for reading the search input value"""
+
+    async def test_uses_single_apply_probe(self):
+        """Element.apply result should be returned without attribute fallbacks"""
+        element = MagicMock()
+        element.apply = AsyncMock(return_value='typed text')
+
+        assert await navigation._get_input_value(element) == 'typed text'
+        element.apply.assert_awaited_once_with(navigation._INPUT_VALUE_JS)
+        element.get_attribute.assert_not_called()
+
+    async def test_falls_back_to_text_all(self):
+        """Elements without apply() fall back to the property chain"""
+        element = MagicMock(spec=['text_all'])
+        element.text_all = 'fallback'
+
+        assert await navigation._get_input_value(element) == 'fallback'
+
+    async def test_awaits_coroutine_get_attribute(self):
+        """Coroutine get_attribute is awaited; the decision is cached per type"""
+        class AsyncElement:
+            async def get_attribute(self, name):
+                return 'async value'
+
+        assert await navigation._get_input_value(AsyncElement()) == 'async value'
+        assert navigation._VALUE_READERS_BY_TYPE[AsyncElement][0][1] is True
+
+    async def test_plain_get_attribute_not_awaited(self):
+        """Synchronous get_attribute results are returned directly"""
+        class SyncElement:
+            def get_attribute(self, name):
+                return 'sync value'
+
+        assert await navigation._get_input_value(SyncElement()) == 'sync value'
+        assert navigation._VALUE_READERS_BY_TYPE[SyncElement][0][1] is False
@@ -0,0 +1,364 @@
+"""
+Unit tests for src/browser/smart_click.py
+Tests click strategy selection and fallback behavior against mocked elements.
+"""
+import sys
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+from nodriver.cdp.dom import BackendNodeId
+
+from src.browser import smart_click
+from src.browser.smart_click import SmartClicker, ClickStrategy
+
+
+def make_clicker(**kwargs):
+    """Create a SmartClicker with delays disabled and a mock page."""
+    kwargs.setdefault('human_like_delay', False)
+    kwargs.setdefault('scroll_into_view', False)
+    return SmartClicker(page=MagicMock(), **kwargs)
+
+
+@pytest.mark.unit
+class TestStrategySelection:
+    """Tests for the ordered click strategy list"""
+
+    def test_default_tries_all_strategies(self):
+        """Default max_retries covers every strategy in preference order"""
+        strategies = make_clicker()._get_strategies_to_try()
+        assert len(strategies) == 6
+        assert strategies[0] is ClickStrategy.NORMAL
+
+    def test_max_retries_caps_strategies(self):
+        """max_retries limits how many strategies are attempted"""
+        assert make_clicker(max_retries=1)._get_strategies_to_try() == (ClickStrategy.NORMAL,)
+        assert len(make_clicker(max_retries=3)._get_strategies_to_try()) == 3
+
+    def test_max_retries_floor_is_one(self):
+        """Non-positive max_retries still attempts the native click"""
+        assert make_clicker(max_retries=0)._get_strategies_to_try() == (ClickStrategy.NORMAL,)
+
+
+@pytest.mark.unit
+class TestClickResult:
+    """Tests for the ClickResult container"""
+
+    @pytest.mark.skipif(sys.version_info < (3, 10), reason='dataclass slots need Python 3.10+')
+    def test_uses_slots(self):
+        """ClickResult should not carry a per-instance __dict__"""
+        result = smart_click.ClickResult(success=True, strategy_used=ClickStrategy.NORMAL, attempts=1)
+        assert not hasattr(result, '__dict__')
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+class TestClick:
+    """Tests for SmartClicker.click"""
+
+    async def test_single_strategy_failure_reports_unsuccessful(self):
+        """A failing native click with max_retries=1 should not fall back"""
+        clicker = make_clicker(max_retries=1)
+        clicker._prepare_element = AsyncMock(return_value=(True, True))
+        clicker._execute_click_strategy = AsyncMock(return_value=False)
+
+        result = await clicker.click(element=MagicMock(), timeout=1.0)
+
+        assert result.success is False
+        assert result.attempts == 1
+        clicker._execute_click_strategy.assert_awaited_once()
+
+    async def test_native_click_success_skips_checks(self):
+        """Without scrolling, a successful first click needs no pre-click probe"""
+        clicker = make_clicker(scroll_into_view=False)
+        clicker._prepare_element = AsyncMock(return_value=(True, True))
+        clicker._execute_click_strategy = AsyncMock(return_value=True)
+
+        result = await clicker.click(element=MagicMock(), timeout=1.0)
+
+        assert result.success is True
+        clicker._prepare_element.assert_not_awaited()
+
+    async def test_checks_run_once_on_first_fallback(self):
+        """Checks should run after the native click fails, and only once"""
+        clicker = make_clicker(scroll_into_view=False)
+        clicker._prepare_element = AsyncMock(return_value=(False, True))
+        clicker._execute_click_strategy = AsyncMock(side_effect=[False, False, True])
+
+        result = await clicker.click(element=MagicMock(), timeout=1.0)
+
+        assert result.success is True
+        assert result.attempts == 3
+        clicker._prepare_element.assert_awaited_once()
+
+    async def test_scroll_runs_checks_up_front(self):
+        """With scrolling enabled, checks share the scroll round-trip"""
+        clicker = make_clicker(scroll_into_view=True)
+        clicker._prepare_element = AsyncMock(return_value=(True, True))
+        clicker._execute_click_strategy = AsyncMock(side_effect=[False, True])
+
+        await clicker.click(element=MagicMock(), timeout=1.0)
+
+        clicker._prepare_element.assert_awaited_once()
+
+    async def test_expired_deadline_stops_before_clicking(self):
+        """An already-passed deadline should report a timeout without clicking"""
+        clicker = make_clicker()
+        clicker._execute_click_strategy = AsyncMock(return_value=True)
+
+        result = await clicker.click(element=MagicMock(), timeout=-1.0)
+
+        assert result.success is False
+        assert result.error == 'Timeout exceeded'
+        clicker._execute_click_strategy.assert_not_awaited()
+
+    async def test_waiter_reused_across_lookups(self):
+        """Selector lookups should share the waiter created at init"""
+        clicker = make_clicker()
+        waiter = clicker._waiter
+        waiter.wait_for_presence = AsyncMock(return_value=MagicMock(
+            success=False, wait_time=0.0, attempts=1
+        ))
+
+        await clicker.click('#a', timeout=0.1)
+        await clicker.click('#b', timeout=0.1)
+
+        assert clicker._waiter is waiter
+        assert waiter.wait_for_presence.await_count == 2
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+class TestPrepareElement:
+    """Tests for the coalesced pre-click checks"""
+
+    async def test_checks_and_scroll_in_one_apply(self):
+        """Visibility, interactability and scroll should share one round-trip"""
+        clicker = make_clicker(scroll_into_view=True)
+        element = MagicMock()
+        element.apply = AsyncMock(return_value={'visible': False, 'interactable': True})
+
+        assert await clicker._prepare_element(element) == (False, True)
+        element.apply.assert_awaited_once()
+        assert 'scrollIntoView' in element.apply.await_args.args[0]
+        clicker.page.evaluate.assert_not_called()
+
+    async def test_no_scroll_when_disabled(self):
+        """scroll_into_view=False should use the non-scrolling script"""
+        clicker = make_clicker(scroll_into_view=False)
+        element = MagicMock()
+        element.apply = AsyncMock(return_value={'visible': True, 'interactable': True})
+
+        await clicker._prepare_element(element)
+
+        assert element.apply.await_args.args[0] is smart_click._PREPARE_ELEMENT_JS
+
+    async def test_errors_assume_clickable(self):
+        """A failed probe should not block the click attempt"""
+        clicker = make_clicker()
+        element = MagicMock()
+        element.apply = AsyncMock(side_effect=RuntimeError('stale node'))
+
+        assert await clicker._prepare_element(element) == (True, True)
+
+    async def test_unexpected_result_falls_back_to_separate_checks(self):
+        """An unusable combined result should run the individual checks together"""
+        clicker = make_clicker(scroll_into_view=True)
+        element = MagicMock()
+        results = {
+            smart_click._PREPARE_AND_SCROLL_JS: None,
+            smart_click._JS_IS_VISIBLE: True,
+            smart_click._JS_IS_INTERACTABLE: False,
+            smart_click._JS_SCROLL_INSTANT: None,
+        }
+        element.apply = AsyncMock(side_effect=lambda script: results[script])
+
+        assert await clicker._prepare_element(element) == (True, False)
+        scripts = [call.args[0] for call in element.apply.await_args_list]
+        assert scripts[1:] == [
+            smart_click._JS_IS_VISIBLE,
+            smart_click._JS_IS_INTERACTABLE,
+            smart_click._JS_SCROLL_INSTANT,
+        ]
+
+    async def test_instant_scroll_by_default(self):
+        """Scrolling defaults to instant so no settle wait is needed"""
+        clicker = make_clicker(scroll_into_view=True)
+        element = MagicMock()
+        element.apply = AsyncMock(return_value={'visible': True, 'interactable': True})
+
+        await clicker._prepare_element(element)
+
+        assert element.apply.await_args.args[0] is smart_click._PREPARE_AND_SCROLL_JS
+        assert "behavior: 'instant'" in smart_click._PREPARE_AND_SCROLL_JS
+
+    async def test_smooth_scroll_opt_in(self):
+        """smooth_scroll=True should animate the scroll"""
+        clicker = make_clicker(scroll_into_view=True, smooth_scroll=True)
+        element = MagicMock()
+        element.apply = AsyncMock(return_value={'visible': True, 'interactable': True})
+
+        await clicker._prepare_element(element)
+
+        assert element.apply.await_args.args[0] is smart_click._PREPARE_AND_SMOOTH_SCROLL_JS
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+class TestElementScripts:
+    """Tests for element-scoped strategy scripts"""
+
+    async def test_javascript_click_runs_on_element(self):
+        """JavaScript click should call the shared script on the element"""
+        clicker = make_clicker()
+        element = MagicMock()
+        element.apply = AsyncMock(return_value=None)
+
+        assert await clicker._click_javascript(element) is True
+        element.apply.assert_awaited_once_with(smart_click._JS_CLICK)
+        clicker.page.evaluate.assert_not_called()
+
+    async def test_dispatch_event_runs_on_element(self):
+        """Dispatched mouse events should target the element itself"""
+        clicker = make_clicker()
+        element = MagicMock()
+        element.apply = AsyncMock(return_value=None)
+
+        assert await clicker._click_dispatch_event(element) is True
+        element.apply.assert_awaited_once_with(smart_click._JS_DISPATCH_CLICK)
+
+    async def test_focus_and_keys_sent_as_one_batch(self):
+        """Focus, keyDown and keyUp should all be sent, in that order"""
+        clicker = make_clicker()
+        sent = []
+
+        async def send(command):
+            sent.append(next(command))
+
+        clicker.page.send = send
+        element = MagicMock(backend_node_id=BackendNodeId(5))
+        element.apply = AsyncMock(return_value=None)
+
+        assert await clicker._click_focus_space(element) is True
+        assert sent[0] == {'method': 'DOM.focus', 'params': {'backendNodeId': 5}}
+        assert [message['params']['type'] for message in sent[1:]] == ['keyDown', 'keyUp']
+        element.apply.assert_not_awaited()
+
+    async def test_focus_waits_for_human_delay_before_keys(self, monkeypatch):
+        """With human-like delays, focus completes before the pause and keys"""
+        monkeypatch.setattr(smart_click.asyncio, 'sleep', AsyncMock())
+        clicker = make_clicker(human_like_delay=True)
+        clicker._pipeline = AsyncMock()
+        clicker.page.send = AsyncMock()
+        element = MagicMock(backend_node_id=BackendNodeId(5))
+
+        assert await clicker._click_focus_enter(element) is True
+        clicker.page.send.assert_awaited_once()
+        assert len(clicker._pipeline.await_args.args) == 2
+
+    async def test_enter_keydown_carries_text(self):
+        """Enter's keyDown should include text so it also fires keypress"""
+        clicker = make_clicker()
+        sent = []
+
+        async def send(command):
+            sent.append(next(command)['params'])
+
+        clicker.page.send = send
+        element = MagicMock(backend_node_id=BackendNodeId(5))
+
+        assert await clicker._click_focus_enter(element) is True
+        assert sent[1]['type'] == 'keyDown' and sent[1]['text'] == '\r'
+        assert sent[2]['type'] == 'keyUp' and 'text' not in sent[2]
+
+    async def test_key_messages_reused_across_presses(self):
+        """Each press should send the prebuilt messages, not rebuild them"""
+        clicker = make_clicker()
+        sent = []
+
+        async def send(command):
+            sent.append(next(command))
+
+        clicker.page.send = send
+        element = MagicMock(backend_node_id=BackendNodeId(5))
+
+        await clicker._click_focus_enter(element)
+        await clicker._click_focus_enter(element)
+
+        keys = [message for message in sent if message['method'] == 'Input.dispatchKeyEvent']
+        assert keys == [smart_click._ENTER_DOWN, smart_click._ENTER_UP] * 2
+        assert all(message is smart_click._ENTER_DOWN for message in keys[::2])
+
+    async def test_double_click_skips_second_click_when_detached(self):
+        """A node removed by the first click should not be clicked again"""
+        clicker = make_clicker()
+        element = MagicMock()
+        element.click = AsyncMock()
+        element.apply = AsyncMock(return_value=False)
+
+        assert await clicker._click_double_click(element) is True
+        element.click.assert_awaited_once()
+        element.apply.assert_awaited_once_with(smart_click._JS_IS_CONNECTED)
+
+    async def test_double_click_clicks_twice_when_attached(self):
+        """A node still in the document gets the second click"""
+        clicker = make_clicker()
+        element = MagicMock()
+        element.click = AsyncMock()
+        element.apply = AsyncMock(return_value=True)
+
+        assert await clicker._click_double_click(element) is True
+        assert element.click.await_count == 2
+
+    async def test_dispatch_covers_every_strategy(self):
+        """Each strategy should dispatch to its own click method"""
+        clicker = make_clicker()
+        assert set(clicker._dispatch) == set(ClickStrategy)
+
+        clicker._dispatch[ClickStrategy.JAVASCRIPT] = AsyncMock(return_value=True)
+        assert await clicker._execute_click_strategy(MagicMock(), ClickStrategy.JAVASCRIPT) is True
+
+
+@pytest.mark.unit
+class TestPageClickerCache:
+    """Tests for the per-page SmartClicker cache used by smart_click()"""
+
+    def test_same_page_reuses_clicker(self):
+        """Repeated lookups on one page should share a clicker and waiter"""
+        page = MagicMock()
+        clicker = smart_click._get_page_clicker(page)
+
+        assert smart_click._get_page_clicker(page) is clicker
+        assert clicker.page is page
+
+    def test_pages_get_separate_clickers(self):
+        """Each page should get its own clicker"""
+        assert smart_click._get_page_clicker(MagicMock()) is not smart_click._get_page_clicker(MagicMock())
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+class TestAddDelay:
+    """Tests for human-like delays"""
+
+    async def test_delay_within_range(self, monkeypatch):
+        """Delay should fall within [min, min + span]"""
+        slept = []
+
+        async def fake_sleep(delay):
+            slept.append(delay)
+
+        monkeypatch.setattr(smart_click.asyncio, 'sleep', fake_sleep)
+        clicker = make_clicker(human_like_delay=True)
+        for _ in range(20):
+            await clicker._add_delay(smart_click._DELAY_AFTER_CLICK)
+
+        assert all(0.2 <= delay <= 0.5 for delay in slept)
+
+    async def test_no_delay_when_disabled(self, monkeypatch):
+        """human_like_delay=False should never sleep"""
+        sleep = AsyncMock()
+        monkeypatch.setattr(smart_click.asyncio, 'sleep', sleep)
+
+        await make_clicker(human_like_delay=False)._add_delay(smart_click._DELAY_AFTER_CLICK)
+
+        sleep.assert_not_awaited()
@@ -803,3 +803,153 @@ class TestHelperFunctions:
         from src.search.extractor import _is_excluded_url
         patterns = []
         assert _is_excluded_url('https://example.com/anything', patterns) is False
+
+    def test_is_excluded_url_uses_configured_patterns(self):
+        """Test URL exclusion defaults to the precompiled config patterns."""
+        from src.search.extractor import _is_excluded_url
+        assert _is_excluded_url('https://www.Perplexity.AI/discover') is True
+        assert _is_excluded_url('https://example.com/article') is False
+
+    def test_find_answer_span_uses_marker_priority(self):
+        """Test start markers follow configured priority, not position."""
+        from src.search.extractor import _find_answer_span
+        text = 'Nav Answer Images x 1 Step Completed The answer. Ask a follow-up'
+        start, end = _find_answer_span(text)
+        assert text[start:end].strip() == 'The answer.'
+
+    def test_find_answer_span_finds_overlapping_marker(self):
+        """A lower-priority marker inside a higher one's failed match is still found"""
+        from src.search.extractor import _find_answer_span
+        text = 'Answer Images The answer text. Ask a follow-up'
+        assert _find_answer_span(text) == (14, 31)
+
+    def test_find_answer_span_ignores_leading_marker(self):
+        """Test a start marker at position 0 is not used."""
+        from src.search.extractor import _find_answer_span
+        assert _find_answer_span('1 step completed answer') == (-1, len('1 step completed answer'))
+
+    def test_generated_exclude_filter_quotes_patterns(self):
+        """Test the generated filter treats patterns as literal text."""
+        from src.config import _build_exclude_filter
+        is_excluded = _build_exclude_filter(("/it's", 'A\\B'))
+        assert is_excluded("https://x.com/IT'S/here") is True
+        assert is_excluded('https://x.com/a\\b') is True
+        assert is_excluded('https://x.com/ab') is False
+        assert _build_exclude_filter(())('https://x.com') is False
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+class TestAnswerCompletionWait:
+    """Tests for the in-page answer completion wait."""
+
+    async def test_returns_in_page_outcome(self):
+        """The promise result is passed through when recognised."""
+        from src.search.extractor import _wait_for_answer_in_page
+        page = MagicMock()
+        page.evaluate = AsyncMock(return_value='stable')
+
+        assert await _wait_for_answer_in_page(page, timeout=1) == 'stable'
+        assert page.evaluate.await_args.kwargs['await_promise'] is True
+        assert '"ask a follow-up"' in page.evaluate.await_args.args[0]
+
+    async def test_stable_requires_growth_since_start(self):
+        """Unchanged pre-stream text must not count as a finished answer."""
+        from src.search.extractor import _ANSWER_COMPLETE_JS
+        assert 'text.length > startLength' in _ANSWER_COMPLETE_JS
+
+    async def test_evaluate_failure_returns_none(self):
+        """A failed evaluate signals the caller to fall back to polling."""
+        from src.search.extractor import _wait_for_answer_in_page
+        page = MagicMock()
+        page.evaluate = AsyncMock(side_effect=RuntimeError('no runtime'))
+
+        assert await _wait_for_answer_in_page(page, timeout=1) is None
+
+    async def test_unexpected_result_returns_none(self):
+        """Non-string results (e.g. exception details) are not trusted."""
+        from src.search.extractor import _wait_for_answer_in_page
+        page = MagicMock()
+        page.evaluate = AsyncMock(return_value=MagicMock())
+
+        assert await _wait_for_answer_in_page(page, timeout=1) is None
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+class TestSourceLinks:
+    """Tests for reading source tiers in one in-page query."""
+
+    async def test_all_tiers_read_in_one_evaluate(self):
+        """Every tier comes back from a single evaluate call."""
+        from src.search.extractor import _source_links
+        page = MagicMock()
+        page.evaluate = AsyncMock(return_value=[[['https://a.com', 'A text']], [[None, 'no href']]])
+        page.select_all = AsyncMock()
+
+        tiers = await _source_links(page, ['a[href]', 'footer a'])
+
+        assert tiers == [[('https://a.com', 'A text')], [(None, 'no href')]]
+        page.evaluate.assert_awaited_once()
+        assert '["a[href]", "footer a"]' in page.evaluate.await_args.args[0]
+        page.select_all.assert_not_awaited()
+
+    async def test_failed_evaluate_returns_none(self):
+        """A failed or malformed evaluate result signals the select_all fallback."""
+        from src.search.extractor import _source_links
+        failed = MagicMock()
+        failed.evaluate = AsyncMock(side_effect=RuntimeError('no runtime'))
+        malformed = MagicMock()
+        malformed.evaluate = AsyncMock(return_value=[[]])
+
+        assert await _source_links(failed, ['a', 'b']) is None
+        assert await _source_links(malformed, ['a', 'b']) is None
+
+    async def test_select_all_fallback(self):
+        """The fallback reads href and text from select_all() elements."""
+        from src.search.extractor import _select_all_links
+        page = MockPage()
+        page.set_source_elements([MockElement('https://b.com', 'B text'), MockElement('', 'x', attrs={})])
+
+        assert await _select_all_links(page, 'footer a') == [('https://b.com', 'B text'), (None, 'x')]
+
+    async def test_extract_sources_filters_evaluated_links(self):
+        """Evaluated links go through the usual validation and dedup."""
+        from src.search import extractor
+        page = MagicMock()
+        page.evaluate = AsyncMock(return_value=[
+            [
+                ['https://example.com/a', ' Example A '],
+                ['https://example.com/a', 'Duplicate'],
+                ['https://www.perplexity.ai/x', 'Internal'],
+                ['/relative', 'Relative link'],
+                ['https://test.org/b', 'ok'],
+            ],
+            [['https://example.com/a', 'Tier 2 duplicate'], ['https://test.org/c', 'Test C']],
+            [['https://test.org/d', 'Test D']],
+        ])
+
+        with patch.object(extractor, '_expand_sources_if_collapsed', AsyncMock(return_value=False)):
+            sources = await extractor._extract_sources(page)
+
+        assert [s['url'] for s in sources] == [
+            'https://example.com/a', 'https://test.org/c', 'https://test.org/d'
+        ]
+        assert sources[0]['text'] == 'Example A'
+        assert sources[2]['citation_number'] == 3
+
+    async def test_later_tiers_skipped_once_threshold_met(self):
+        """Tier 2 and 3 links are ignored when Tier 1 yields enough sources."""
+        from src.search import extractor
+        page = MagicMock()
+        page.evaluate = AsyncMock(return_value=[
+            [[f'https://example.com/{i}', f'Source {i}'] for i in range(3)],
+            [['https://tier2.com/a', 'Tier 2']],
+            [['https://tier3.com/a', 'Tier 3']],
+        ])
+
+        with patch.object(extractor, '_expand_sources_if_collapsed', AsyncMock(return_value=False)):
+            sources = await extractor._extract_sources(page)
+
+        assert [s['domain'] for s in sources] == ['example.com'] * 3
+